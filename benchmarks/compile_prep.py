@@ -0,0 +1,67 @@
+"""
+Compile-prep time for generating program entrypoints, cookiecutter vs the
+in-process template renderer.
+
+    python benchmarks/compile_prep.py [programs]
+"""
+
+import sys
+import tempfile
+import timeit
+
+from djelm.cookiecutter import CookieCutter
+from djelm.generators import entrypoint_cookie_cutter
+
+
+class Logger:
+    def write(self, msg):
+        pass
+
+
+def template_cutters(src_path: str, count: int):
+    return [
+        entrypoint_cookie_cutter(
+            base_name="",
+            base_path="",
+            src_path=src_path,
+            program_name=f"Program{i}",
+            scope=f"app-program{i}",
+            view_prefix="",
+        )
+        for i in range(count)
+    ]
+
+
+def cookie_cutters(src_path: str, count: int):
+    return [
+        CookieCutter(
+            file_dir=c.file_dir,
+            output_dir=c.output_dir,
+            cookie_template_name=c.cookie_template_name,
+            extra=c.extra,
+            overwrite=c.overwrite,
+        )
+        for c in template_cutters(src_path, count)
+    ]
+
+
+def main(count: int = 100, repeat: int = 5):
+    logger = Logger()
+    print(f"{count} programs, best of {repeat}")
+
+    for name, make in [
+        ("cookiecutter", cookie_cutters),
+        ("template", template_cutters),
+    ]:
+        with tempfile.TemporaryDirectory() as src_path:
+            cutters = make(src_path, count)
+            best = min(
+                timeit.repeat(
+                    lambda: [c.cut(logger) for c in cutters], number=1, repeat=repeat
+                )
+            )
+        print(f"{name:<14}{best * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,71 @@
+"""
+Payload size and parse time of a ListFlag of ObjectFlag, row vs columnar encoding.
+
+    python benchmarks/flags_columnar.py [rows]
+"""
+
+import json
+import sys
+import timeit
+
+from djelm.flags.main import Flags
+from djelm.flags.primitives import (
+    BoolFlag,
+    FloatFlag,
+    IntFlag,
+    ListFlag,
+    NullableFlag,
+    ObjectFlag,
+    StringFlag,
+)
+
+
+def record_flag() -> ObjectFlag:
+    return ObjectFlag(
+        {
+            "identifier": IntFlag(),
+            "displayName": StringFlag(),
+            "emailAddress": StringFlag(),
+            "accountBalance": FloatFlag(),
+            "isActive": BoolFlag(),
+            "referrer": NullableFlag(StringFlag()),
+        }
+    )
+
+
+def records(count: int) -> list[dict]:
+    return [
+        {
+            "identifier": i,
+            "displayName": f"user {i}",
+            "emailAddress": f"user{i}@example.com",
+            "accountBalance": i * 1.5,
+            "isActive": i % 2 == 0,
+            "referrer": None if i % 3 else f"user {i - 1}",
+        }
+        for i in range(count)
+    ]
+
+
+def main(count: int = 5000, repeat: int = 20):
+    data = records(count)
+    print(f"{count} records, best of {repeat}")
+    print(f"{'encoding':<10}{'bytes':>12}{'parse ms':>12}{'json.loads ms':>16}")
+
+    for name, columnar in [("rows", False), ("columnar", True)]:
+        flags = Flags(ListFlag(record_flag(), columnar=columnar))
+        payload = flags.parse(data)
+        parse_time = min(
+            timeit.repeat(lambda: flags.parse(data), number=1, repeat=repeat)
+        )
+        loads_time = min(
+            timeit.repeat(lambda: json.loads(payload), number=1, repeat=repeat)
+        )
+        print(
+            f"{name:<10}{len(payload.encode()):>12}"
+            f"{parse_time * 1000:>12.2f}{loads_time * 1000:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,89 @@
+"""
+Time to render a page of program tags: inclusion tag, engine-free render and Jinja2.
+
+    python benchmarks/render_programs.py [programs]
+"""
+
+import sys
+import timeit
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django.contrib.staticfiles", "djelm"],
+    STATIC_URL="/static/",
+    TEMPLATES=[
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "APP_DIRS": True,
+            "OPTIONS": {"libraries": {"bench": "__main__"}},
+        }
+    ],
+)
+django.setup()
+
+from django import template  # noqa: E402
+from django.template import Context, engines  # noqa: E402
+
+from djelm.flags.main import Flags  # noqa: E402
+from djelm.flags.primitives import IntFlag, ObjectFlag, StringFlag  # noqa: E402
+from jinja2 import Environment  # noqa: E402
+
+from djelm.jinja2 import DjelmExtension  # noqa: E402
+from djelm.render import render_program  # noqa: E402
+
+register = template.Library()
+
+key = "benchmark_key"
+BenchmarkFlags = Flags(ObjectFlag({"id": IntFlag(), "title": StringFlag()}))
+
+
+@register.inclusion_tag("djelm/program.html", takes_context=True)
+def render_inclusion(context, program):
+    return {"key": key, "flags": BenchmarkFlags.parse(program)}
+
+
+@register.simple_tag(takes_context=True)
+def render_direct(context, program):
+    return render_program(key, BenchmarkFlags.parse(program))
+
+
+def page(tag: str):
+    return engines["django"].engine.from_string(
+        "{% load bench %}{% for p in programs %}{% " + tag + " p %}{% endfor %}"
+    )
+
+
+def jinja_page():
+    return Environment(autoescape=True, extensions=[DjelmExtension]).from_string(
+        "{% for p in programs %}"
+        "{{ render_program(key, BenchmarkFlags.parse(p)) }}"
+        "{% endfor %}",
+        globals={"key": key, "BenchmarkFlags": BenchmarkFlags},
+    )
+
+
+def main(count: int = 1000, repeat: int = 20):
+    programs = [{"id": i, "title": f"<program {i}>"} for i in range(count)]
+    context = Context({"programs": programs})
+    inclusion, direct, jinja = (
+        page("render_inclusion"),
+        page("render_direct"),
+        jinja_page(),
+    )
+    assert inclusion.render(context) == direct.render(context)
+    assert inclusion.render(context) == jinja.render(programs=programs)
+
+    print(f"{count} programs per page, best of {repeat}")
+    for name, render in [
+        ("inclusion_tag", lambda: inclusion.render(context)),
+        ("render_program", lambda: direct.render(context)),
+        ("jinja2", lambda: jinja.render(programs=programs)),
+    ]:
+        best = min(timeit.repeat(render, number=1, repeat=repeat))
+        print(f"{name:<16}{best * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,114 @@
+import os
+import re
+from typing import Iterable, Optional
+
+SCRIPT_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+STYLE_EXTENSIONS = (".css", ".scss", ".sass", ".less")
+# Extensions Parcel tries for an extensionless specifier
+RESOLVE_EXTENSIONS = (*SCRIPT_EXTENSIONS, ".json", *STYLE_EXTENSIONS)
+
+# Files in static_src that change how Parcel resolves or bundles a program
+BUILD_CONFIG_FILES = (
+    "package.json",
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "bun.lockb",
+    ".parcelrc",
+    "tsconfig.json",
+    ".babelrc",
+    ".postcssrc",
+    ".browserslistrc",
+)
+
+SCRIPT_IMPORT_PATTERNS = (
+    # import x from "y", export { x } from "y"
+    re.compile(r"\b(?:import|export)\s[^'\"`;]*?\bfrom\s*(['\"])(.+?)\1"),
+    # import "y"
+    re.compile(r"\bimport\s*(['\"])(.+?)\1"),
+    # import("y"), require("y"), new URL("y", import.meta.url)
+    re.compile(r"\b(?:import|require|URL)\s*\(\s*(['\"])(.+?)\1"),
+)
+# import(path) or require(path) with a specifier Parcel resolves at runtime
+DYNAMIC_SCRIPT_IMPORT_PATTERN = re.compile(r"\b(?:import|require)\s*\(\s*[^'\"\s)]")
+STYLE_IMPORT_PATTERNS = (
+    re.compile(r"@(?:import|use|forward)\s+(?:url\(\s*)?(['\"]?)([^'\"()\s;]+)\1"),
+    re.compile(r"\burl\(\s*(['\"]?)([^'\"()]+?)\1\s*\)"),
+)
+
+
+def _specifiers(path: str) -> Optional[list[str]]:
+    """
+    The specifiers a script or stylesheet imports, None when it imports a
+    computed specifier.
+    """
+    ext = os.path.splitext(path)[1]
+    if ext not in SCRIPT_EXTENSIONS and ext not in STYLE_EXTENSIONS:
+        return []
+    try:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+    except (OSError, ValueError):
+        return []
+    if ext in SCRIPT_EXTENSIONS:
+        if DYNAMIC_SCRIPT_IMPORT_PATTERN.search(source):
+            return None
+        patterns = SCRIPT_IMPORT_PATTERNS
+    else:
+        patterns = STYLE_IMPORT_PATTERNS
+    return [m.group(2) for pattern in patterns for m in pattern.finditer(source)]
+
+
+def resolve_specifier(specifier: str, importer: str) -> Optional[str]:
+    """
+    The local file a relative specifier points at, None when it can't be found.
+    """
+    specifier = re.split(r"[?#]", specifier, maxsplit=1)[0]
+    path = os.path.normpath(os.path.join(os.path.dirname(importer), specifier))
+    candidates = [path]
+    stem, ext = os.path.splitext(path)
+    # TypeScript imports its own modules with the .js extension
+    if ext in (".js", ".jsx", ".mjs"):
+        candidates += [stem + ".ts", stem + ".tsx", stem + ".mts"]
+    candidates += [path + e for e in RESOLVE_EXTENSIONS]
+    candidates += [os.path.join(path, "index" + e) for e in RESOLVE_EXTENSIONS]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def asset_dependencies(paths: Iterable[str]) -> Optional[set[str]]:
+    """
+    The given scripts and every local script, stylesheet or asset they import,
+    directly or transitively.
+
+    Package imports are left to the build config files. None when an import
+    can't be followed, such as a computed, root relative or missing specifier.
+    """
+    seen: set[str] = set()
+    pending = [os.path.normpath(p) for p in paths]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        specifiers = _specifiers(current)
+        if specifiers is None:
+            return None
+        # Stylesheets resolve bare specifiers relative to themselves
+        is_style = os.path.splitext(current)[1] in STYLE_EXTENSIONS
+        for specifier in specifiers:
+            if specifier.startswith(("#", "//")):
+                continue
+            if specifier.startswith(("/", "~")):
+                return None
+            if specifier.startswith(("./", "../")) or (
+                is_style and ":" not in specifier
+            ):
+                resolved = resolve_specifier(specifier, current)
+                if resolved is None:
+                    return None
+                pending.append(resolved)
+            # Anything else is a package, a url or a data uri
+    return seen
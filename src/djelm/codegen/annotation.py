@@ -72,6 +72,30 @@ def list(anno: Compiler.Annotation):
     return typed("List", [anno])
 
 
+def dict(key: Compiler.Annotation, value: Compiler.Annotation):
+    """Elm Dict annotation"""
+    return typed("Dict", [key, value])
+
+
+def array(anno: Compiler.Annotation):
+    """Elm Array annotation"""
+    return typed("Array", [anno])
+
+
+def function(
+    args: List[Compiler.Annotation], result: Compiler.Annotation
+) -> Compiler.Annotation:
+    """Elm function annotation"""
+    return foldl(
+        lambda acc, arg: Compiler.Annotation(
+            Compiler.FunctionTypeAnnotation(arg.annotation, acc.annotation),
+            mergeAliases(acc.aliases, arg),
+        ),
+        result,
+        args[::-1],
+    )
+
+
 def alias(name: str, anno: Compiler.Annotation):
     """Elm alias annotation"""
     return Compiler.Annotation(
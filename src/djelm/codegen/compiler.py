@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 import djelm.codegen.range as Range
+from djelm.codegen.pattern import Pattern
 
 
 class TypeAnnotation:
@@ -48,6 +49,14 @@ class Typed(TypeAnnotation):
         self.args: List[TypeAnnotation] = args
 
 
+@dataclass(slots=True)
+class FunctionTypeAnnotation(TypeAnnotation):
+    """left -> right"""
+
+    left: TypeAnnotation
+    right: TypeAnnotation
+
+
 @dataclass(slots=True)
 class Generic(TypeAnnotation):
     def __init__(self, value: str) -> None:
@@ -93,6 +102,7 @@ class FunctionDeclaration(DeclarationKind):
     name: str
     expression: Expression
     signature: Signature
+    args: List[Pattern] = field(default_factory=list)
 
 
 def get_declaration_name(declaration: Declaration) -> str:
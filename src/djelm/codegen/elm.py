@@ -6,6 +6,7 @@ import djelm.codegen.format as Format
 import djelm.codegen.expression as Expression
 import djelm.codegen.module_name as Mod
 import djelm.codegen.range as Range
+from djelm.codegen.pattern import Pattern
 
 
 def variantWith(name: str, annotations: List[Compiler.Annotation]) -> Compiler.Variant:
@@ -53,7 +54,10 @@ def literal(value: str) -> Compiler.Expression:
 
 
 def declaration(
-    name: str, expression: Compiler.Expression, signature: Compiler.Signature
+    name: str,
+    expression: Compiler.Expression,
+    signature: Compiler.Signature,
+    args: List[Pattern] | None = None,
 ) -> Compiler.Declaration:
     """Top level declaration"""
     expression.set_range_column(4)
@@ -63,6 +67,7 @@ def declaration(
             name,
             expression,
             signature,
+            args if args else [],
         ),
     )
 
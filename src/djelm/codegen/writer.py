@@ -182,6 +182,13 @@ def writeTypeAnnotation(anno: Compiler.TypeAnnotation) -> Writer:
         case Compiler.Generic(value=value):
             return string(value)
 
+        case Compiler.FunctionTypeAnnotation(left=left, right=right):
+            left_writer = writeTypeAnnotation(left)
+            if isinstance(left, Compiler.FunctionTypeAnnotation):
+                left_writer = paren(left_writer)
+
+            return spaced([left_writer, string("->"), writeTypeAnnotation(right)])
+
         case Compiler.Record(fields=fields):
             writer_fields = []
             for field in fields:
@@ -391,13 +398,16 @@ def writeDeclartion(declaration: Compiler.Declaration) -> Writer:
                     ),
                 ]
             )
-        case Compiler.FunctionDeclaration(name=name, signature=sig, expression=exp):
+        case Compiler.FunctionDeclaration(
+            name=name, signature=sig, expression=exp, args=args
+        ):
             return breaked(
                 [
                     writeSignature(sig),
                     spaced(
                         [
                             string(name),
+                            *[writePattern(arg) for arg in args],
                             string("="),
                         ]
                     ),
@@ -0,0 +1,108 @@
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (".js",)
+
+
+@dataclass(slots=True)
+class CompressedAsset:
+    path: str
+    size: int
+    gzip_size: int
+    brotli_size: Optional[int]
+
+
+def compress_asset(path: str) -> CompressedAsset:
+    """
+    Write .gz and, when the brotli package is installed, .br siblings of an
+    asset at maximum compression.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+    with open(f"{path}.gz", "wb") as f:
+        f.write(gzipped)
+
+    brotli_size = None
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        with open(f"{path}.br", "wb") as f:
+            f.write(compressed)
+        brotli_size = len(compressed)
+
+    return CompressedAsset(path, len(data), len(gzipped), brotli_size)
+
+
+def compressed_asset(path: str) -> Optional[CompressedAsset]:
+    """
+    The asset's existing compressed siblings, when every one of them is at
+    least as new as the asset itself.
+    """
+    siblings = [f"{path}.gz"] + ([f"{path}.br"] if brotli is not None else [])
+    try:
+        source = os.stat(path)
+        stats = [os.stat(sibling) for sibling in siblings]
+    except OSError:
+        return None
+    if any(stat.st_mtime_ns < source.st_mtime_ns for stat in stats):
+        return None
+    return CompressedAsset(
+        path,
+        source.st_size,
+        stats[0].st_size,
+        stats[1].st_size if brotli is not None else None,
+    )
+
+
+def compress_assets(
+    dist_dir: str, max_workers: Optional[int] = None
+) -> list[CompressedAsset]:
+    """
+    Compress every JS asset in dist_dir in a process pool, and remove the
+    compressed siblings of assets that no longer exist.
+
+    Assets whose compressed siblings are already up to date are skipped.
+    """
+    assets: list[str] = []
+    compressed: list[CompressedAsset] = []
+    for entry in os.scandir(dist_dir):
+        if not entry.is_file():
+            continue
+        source, ext = os.path.splitext(entry.path)
+        if ext in (".gz", ".br"):
+            if not os.path.exists(source):
+                os.remove(entry.path)
+        elif ext in COMPRESSIBLE_EXTENSIONS:
+            existing = compressed_asset(entry.path)
+            if existing is None:
+                assets.append(entry.path)
+            else:
+                compressed.append(existing)
+
+    if assets:
+        with ProcessPoolExecutor(max_workers) as pool:
+            compressed.extend(pool.map(compress_asset, assets))
+    return sorted(compressed, key=lambda asset: asset.path)
+
+
+def compression_report(assets: list[CompressedAsset]) -> str:
+    def kb(size: Optional[int]) -> str:
+        return "-" if size is None else f"{size / 1024:.1f} kB"
+
+    width = max([len(os.path.basename(a.path)) for a in assets] + [5])
+    lines = [f"{'asset':<{width}}  {'size':>10}  {'gzip':>10}  {'brotli':>10}"]
+    for a in assets:
+        lines.append(
+            f"{os.path.basename(a.path):<{width}}  {kb(a.size):>10}"
+            f"  {kb(a.gzip_size):>10}  {kb(a.brotli_size):>10}"
+        )
+    return "\n".join(lines)
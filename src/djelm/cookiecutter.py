@@ -1,11 +1,23 @@
+import json
+import os
+import shutil
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Generic, Optional, TypeVar
-from djelm.effect import ExitFailure, ExitSuccess
+
+from cookiecutter.exceptions import OutputDirExistsException
 from cookiecutter.main import cookiecutter
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
 
+from djelm.effect import ExitFailure, ExitSuccess
+from djelm.utils import WriteStats, write_if_changed
 
 T = TypeVar("T")
 
+# cookiecutter changes the working directory while it renders.
+_CUT_LOCK = threading.Lock()
+
 
 @dataclass(slots=True)
 class CookieCutter(Generic[T]):
@@ -18,14 +30,15 @@ class CookieCutter(Generic[T]):
 
     def cut(self, logger) -> ExitSuccess[str] | ExitFailure[None, Exception]:
         try:
-            app_path = cookiecutter(
-                self.file_dir,
-                output_dir=self.output_dir,
-                directory=self.cookie_template_name,
-                no_input=True,
-                overwrite_if_exists=self.overwrite,
-                extra_context=self.extra,
-            )
+            with _CUT_LOCK:
+                app_path = cookiecutter(
+                    self.file_dir,
+                    output_dir=self.output_dir,
+                    directory=self.cookie_template_name,
+                    no_input=True,
+                    overwrite_if_exists=self.overwrite,
+                    extra_context=self.extra,
+                )
 
             if self.log_lines:
                 for line in self.log_lines:
@@ -34,3 +47,110 @@ class CookieCutter(Generic[T]):
             return ExitSuccess(app_path)
         except Exception as err:
             return ExitFailure(None, err)
+
+
+@dataclass(slots=True)
+class TemplateFile:
+    path: Template
+    content: Template
+    source: str
+    newline: Optional[str]
+
+
+@lru_cache(maxsize=None)
+def _environment(file_dir: str) -> Environment:
+    return Environment(
+        loader=FileSystemLoader(file_dir),
+        undefined=StrictUndefined,
+        keep_trailing_newline=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def _template(file_dir: str, template_name: str) -> tuple[dict, list[TemplateFile]]:
+    """
+    The cookiecutter.json defaults and precompiled files of a template.
+    """
+    env = _environment(file_dir)
+    template_dir = os.path.join(file_dir, template_name)
+
+    with open(os.path.join(template_dir, "cookiecutter.json")) as f:
+        defaults = json.load(f)
+
+    files = []
+    for root, dirs, names in os.walk(template_dir):
+        if root == template_dir:
+            dirs[:] = [d for d in dirs if d != "hooks"]
+            continue
+        for name in names:
+            source = os.path.join(root, name)
+            relative = os.path.relpath(source, template_dir)
+            with open(source, encoding="utf-8") as f:
+                f.readline()
+                newline = f.newlines if isinstance(f.newlines, str) else None
+            files.append(
+                TemplateFile(
+                    path=env.from_string(relative),
+                    content=env.get_template(
+                        "/".join([template_name, *relative.split(os.path.sep)])
+                    ),
+                    source=source,
+                    newline=newline,
+                )
+            )
+    return defaults, files
+
+
+@dataclass(slots=True)
+class TemplateCutter(CookieCutter[T]):
+    """
+    Renders a cookiecutter template in-process with cached, precompiled
+    Jinja2 templates, producing the same files as CookieCutter. Files whose
+    content is unchanged are not rewritten.
+
+    Only for templates without hooks.
+    """
+
+    stats: Optional[WriteStats] = None
+
+    def cut(self, logger) -> ExitSuccess[str] | ExitFailure[None, Exception]:
+        try:
+            defaults, files = _template(self.file_dir, self.cookie_template_name)
+            context = {"cookiecutter": _apply_overwrites(defaults, self.extra)}
+
+            targets = [(file, file.path.render(context)) for file in files]
+            (project_dir,) = {relative.split(os.path.sep)[0] for _, relative in targets}
+            project_path = os.path.join(self.output_dir, project_dir)
+
+            if not self.overwrite and os.path.exists(project_path):
+                raise OutputDirExistsException(
+                    f'Error: "{project_path}" directory already exists'
+                )
+
+            for file, relative in targets:
+                target = os.path.join(self.output_dir, relative)
+                written = write_if_changed(
+                    target, file.content.render(context), file.newline
+                )
+                if written:
+                    shutil.copymode(file.source, target)
+                if self.stats is not None:
+                    self.stats.record(written)
+
+            if self.log_lines:
+                for line in self.log_lines:
+                    logger.write(line)
+
+            return ExitSuccess(project_path)
+        except Exception as err:
+            return ExitFailure(None, err)
+
+
+def _apply_overwrites(defaults: dict, extra) -> dict:
+    context = dict(defaults)
+    for key, value in dict(extra).items():
+        if isinstance(context.get(key), dict) and isinstance(value, dict):
+            context[key] = _apply_overwrites(context[key], value)
+        else:
+            context[key] = value
+    return context
@@ -4,6 +4,8 @@ module {{cookiecutter.module_model_namespace}}.{{cookiecutter.program_name}} exp
 <https://github.com/Confidenceman02/django-elm>
 -}
 
+import Array exposing (Array)
+import Dict exposing (Dict)
 import Json.Decode as Decode
 import Json.Decode.Pipeline exposing (required, optional, hardcoded)
 
@@ -1,4 +1,5 @@
 from django import template
+from djelm.render import include_program_once
 from ..flags.{{cookiecutter.tag_name}} import key, {{cookiecutter.program_name}}Flags
 
 register = template.Library()
@@ -9,7 +10,7 @@ def render_{{ cookiecutter.tag_name }}(context):
     return {"key": key, "flags": {{cookiecutter.program_name}}Flags.parse(0)}
 
 
-@register.inclusion_tag("djelm/include.html")
-def include_{{ cookiecutter.tag_name }}():
+@register.simple_tag(takes_context=True)
+def include_{{ cookiecutter.tag_name }}(context):
     # Generates the script tag for the {{cookiecutter.program_name}}.elm program
-    return {"djelm_program": "dist/{{ cookiecutter.program_name }}.js"}
+    return include_program_once(context, "dist/{{ cookiecutter.program_name }}.js")
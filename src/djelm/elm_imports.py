@@ -0,0 +1,181 @@
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+IMPORT_PATTERN = re.compile(r"^import\s+([A-Z][\w.]*)", re.MULTILINE)
+BLOCK_COMMENT_PATTERN = re.compile(r"\{-.*?-\}", re.DOTALL)
+# The first top level declaration, imports can't follow it
+DECLARATION_PATTERN = re.compile(
+    r"^(?!import\b|module\b|port\s+module\b|effect\s+module\b)[a-z]", re.MULTILINE
+)
+
+
+def source_directories(src_path: str) -> list[str]:
+    """
+    The absolute source-directories of the elm.json in src_path.
+    """
+    try:
+        with open(os.path.join(src_path, "elm.json")) as f:
+            directories = json.load(f).get("source-directories", ["src"])
+    except (OSError, ValueError):
+        directories = ["src"]
+    return [os.path.normpath(os.path.join(src_path, d)) for d in directories]
+
+
+def elm_imports(path: str) -> list[str]:
+    """
+    The module names imported by an Elm file.
+    """
+    with open(path, encoding="utf-8") as f:
+        source = BLOCK_COMMENT_PATTERN.sub("", f.read())
+    declaration = DECLARATION_PATTERN.search(source)
+    if declaration is not None:
+        source = source[: declaration.start()]
+    return IMPORT_PATTERN.findall(source)
+
+
+@dataclass(slots=True)
+class ImportGraph:
+    """
+    The import graph of the local Elm modules in an Elm project.
+
+    Files are only parsed again when their mtime changes.
+    """
+
+    source_dirs: list[str]
+    # file -> (mtime_ns, module names it imports)
+    files: dict[str, tuple[int, list[str]]] = field(default_factory=dict)
+    # module name -> file
+    modules: dict[str, str] = field(default_factory=dict)
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+    def refresh(self):
+        """Pick up every added, changed and removed Elm file."""
+        with self.lock:
+            files: dict[str, tuple[int, list[str]]] = {}
+            modules: dict[str, str] = {}
+            for source_dir, path, mtime in self._listing():
+                rel_path = os.path.splitext(os.path.relpath(path, source_dir))[0]
+                # The first source directory wins, like the Elm compiler
+                modules.setdefault(rel_path.replace(os.path.sep, "."), path)
+                cached = self.files.get(path)
+                files[path] = (
+                    cached
+                    if cached and cached[0] == mtime
+                    else self._parse(path, mtime)
+                )
+            self.files, self.modules = files, modules
+
+    def update(self, path: str):
+        """Bring a single changed, added or deleted file up to date."""
+        path = os.path.normpath(path)
+        if not path.endswith(".elm"):
+            return
+        with self.lock:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                if path in self.files:
+                    self.refresh()
+                return
+            if path not in self.files:
+                self.refresh()
+            elif self.files[path][0] != mtime:
+                self.files[path] = self._parse(path, mtime)
+
+    def module(self, name: str) -> Optional[str]:
+        """The file of a local module."""
+        return self.modules.get(name)
+
+    def module_name(self, path: str) -> Optional[str]:
+        with self.lock:
+            for name, module_path in self.modules.items():
+                if module_path == path:
+                    return name
+        return None
+
+    def imports(self, path: str) -> set[str]:
+        """The local files a file imports directly."""
+        with self.lock:
+            names = self.files.get(path, (0, []))[1]
+            return {self.modules[name] for name in names if name in self.modules}
+
+    def importers(self) -> dict[str, set[str]]:
+        """The reverse graph, every file against the local files that import it."""
+        with self.lock:
+            reverse: dict[str, set[str]] = {path: set() for path in self.files}
+            for path in self.files:
+                for dependency in self.imports(path):
+                    reverse[dependency].add(path)
+            return reverse
+
+    def dependents(self, paths: set[str]) -> set[str]:
+        """The given files and every file that imports them, directly or transitively."""
+        reverse = self.importers()
+        return _reachable(paths, lambda path: reverse.get(path, set()))
+
+    def dependencies(self, path: str) -> set[str]:
+        """A file and every local file it imports, directly or transitively."""
+        with self.lock:
+            return _reachable({path}, self.imports)
+
+    def _parse(self, path: str, mtime: int) -> tuple[int, list[str]]:
+        try:
+            return mtime, elm_imports(path)
+        except (OSError, ValueError):
+            return mtime, []
+
+    def _listing(self):
+        for source_dir in self.source_dirs:
+            pending = [source_dir]
+            while pending:
+                current = pending.pop()
+                try:
+                    it = os.scandir(current)
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                with it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".elm") and entry.is_file():
+                            yield source_dir, entry.path, entry.stat().st_mtime_ns
+
+
+def _reachable(start: set[str], edges) -> set[str]:
+    seen: set[str] = set()
+    pending = list(start)
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        pending.extend(edges(current))
+    return seen
+
+
+_GRAPHS: dict[str, ImportGraph] = {}
+_GRAPHS_LOCK = threading.Lock()
+
+
+def import_graph(src_path: str, refresh: bool = True) -> ImportGraph:
+    """
+    The import graph of the Elm project in src_path, shared within the process.
+
+    refresh:
+        True = Stat the source directories for changes first
+        False = Trust the graph, watch keeps it up to date from its events
+    """
+    with _GRAPHS_LOCK:
+        graph = _GRAPHS.get(src_path)
+        if graph is None:
+            graph = _GRAPHS[src_path] = ImportGraph(source_directories(src_path))
+            refresh = True
+    if refresh:
+        graph.refresh()
+    return graph
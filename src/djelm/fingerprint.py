@@ -0,0 +1,40 @@
+import hashlib
+import json
+import os
+from typing import Iterable
+
+FINGERPRINTS_NAME = "fingerprints.json"
+
+
+def fingerprint(paths: Iterable[str], *extra: str) -> str:
+    """
+    A hash of the name and content of every path, plus any extra values.
+    """
+    digest = hashlib.sha256()
+    for value in extra:
+        digest.update(value.encode())
+        digest.update(b"\0")
+    for path in sorted(paths):
+        digest.update(path.encode())
+        digest.update(b"\0")
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"missing")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_fingerprints(path: str) -> dict[str, str]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_fingerprints(path: str, fingerprints: dict[str, str]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(fingerprints, f, indent=2, sort_keys=True)
@@ -0,0 +1,147 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from djelm.effect import ExitFailure, ExitSuccess
+from djelm.flags.main import PreparedElm
+
+if TYPE_CHECKING:
+    from djelm.generators import ModelBuilder
+
+# Workers are replaced after this many flag modules so module objects,
+# generated pydantic models and TypeAdapters don't build up.
+MAX_TASKS_PER_CHILD = 50
+
+
+@dataclass(slots=True, frozen=True)
+class PreparedFlags:
+    """
+    The generated Elm of a flags module, evaluated in a flag pool worker.
+
+    Stands in for Flags when cutting a model.
+    """
+
+    alias_type: str
+    decoder_body: str
+
+    def to_elm_parser_data(self) -> PreparedElm:
+        return {"alias_type": self.alias_type, "decoder_body": self.decoder_body}
+
+
+class _BufferLogger:
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def write(self, msg: str):
+        self.lines.append(msg)
+
+
+def _setup_django():
+    if os.environ.get("DJANGO_SETTINGS_MODULE"):
+        import django
+
+        django.setup()
+
+
+def prepare_flags(
+    generator: "ModelBuilder", app_path: str, program_name: str, watch_mode: bool
+) -> tuple[Optional[PreparedFlags], str, float]:
+    """
+    Load a program's flags module and generate its Elm.
+
+    Returns the generated Elm, or None when the module failed, along with
+    anything written to the log and the seconds it took.
+    """
+    start = time.perf_counter()
+    logger = _BufferLogger()
+    flags = generator.load_flags(app_path, program_name, True, watch_mode, logger)
+    if flags.tag != "Success":
+        return None, "".join(logger.lines), time.perf_counter() - start
+    try:
+        parser_data = flags.value.to_elm_parser_data()
+    except Exception as err:
+        output = "".join([*logger.lines, f"{type(err).__name__}: {err}\n"])
+        return None, output, time.perf_counter() - start
+    return (
+        PreparedFlags(**parser_data),
+        "".join(logger.lines),
+        time.perf_counter() - start,
+    )
+
+
+@dataclass(slots=True)
+class FlagPool:
+    """
+    A small pool of processes that evaluate flag modules.
+
+    Flag modules are executed in the workers, only the generated Elm is sent
+    back. Workers are started on first use and recycled after
+    max_tasks_per_child flag modules.
+    """
+
+    max_workers: Optional[int] = None
+    max_tasks_per_child: int = MAX_TASKS_PER_CHILD
+    executor: Optional[ProcessPoolExecutor] = None
+    pending: dict[tuple[str, str, str], Future] = field(default_factory=dict)
+    # Seconds each program's flags took to evaluate in its worker
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_setup_django,
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self.executor
+
+    def prefetch(
+        self,
+        generator: "ModelBuilder",
+        app_path: str,
+        program_name: str,
+        watch_mode: bool = False,
+    ):
+        """Start evaluating a flags module, a later load_flags collects the result."""
+        key = (type(generator).__name__, app_path, program_name)
+        if key not in self.pending:
+            self.pending[key] = self._executor().submit(
+                prepare_flags, generator, app_path, program_name, watch_mode
+            )
+
+    def wait(self, generator: "ModelBuilder", app_path: str, program_name: str):
+        """Block until a prefetched flags module has been evaluated."""
+        future = self.pending.get((type(generator).__name__, app_path, program_name))
+        if future is not None:
+            wait([future])
+
+    def load_flags(
+        self,
+        generator: "ModelBuilder",
+        app_path: str,
+        program_name: str,
+        watch_mode: bool,
+        logger,
+    ) -> ExitSuccess[PreparedFlags] | ExitFailure[None, Exception]:
+        self.prefetch(generator, app_path, program_name, watch_mode)
+        future = self.pending.pop((type(generator).__name__, app_path, program_name))
+        try:
+            prepared, output, seconds = future.result()
+        except Exception as err:
+            return ExitFailure(None, err=err)
+        self.timings[program_name] = seconds
+        if output:
+            logger.write(output)
+        if prepared is None:
+            return ExitFailure(None, err=Exception(output.strip()))
+        return ExitSuccess(prepared)
+
+    def shutdown(self):
+        executor, self.executor = self.executor, None
+        self.pending.clear()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
@@ -6,6 +6,7 @@ from .primitives import (
     BoolFlag,
     NullableFlag,
     ListFlag,
+    DictFlag,
     ObjectFlag,
     CustomTypeFlag,
 )
@@ -1,7 +1,14 @@
 from typing_extensions import Annotated
 import typing
 
-from pydantic import BeforeValidator, Field, Strict, TypeAdapter
+from pydantic import (
+    BeforeValidator,
+    Field,
+    PlainSerializer,
+    SerializationInfo,
+    Strict,
+    TypeAdapter,
+)
 
 
 def match_literal(v: str) -> typing.Callable[[str], str]:
@@ -14,6 +21,48 @@ def match_literal(v: str) -> typing.Callable[[str], str]:
     return do_match
 
 
+def transpose_rows(keys: list[str]) -> typing.Callable[[typing.Any, typing.Any], dict]:
+    """
+    Wrap serializer that turns a list of records in to a record of lists.
+
+    [{"a": 1, "b": 2}, {"a": 3, "b": 4}] -> {"a": [1, 3], "b": [2, 4]}
+    """
+
+    def do_transpose(v, handler):
+        rows = handler(v)
+        return {k: [row.get(k) for row in rows] for k in keys}
+
+    return do_transpose
+
+
+def omit_none(keys: set[str]) -> typing.Callable[[typing.Any, typing.Any], dict]:
+    """
+    Wrap model serializer that leaves out keys with a None value.
+
+    keys = {"b"}
+    {"a": None, "b": None} -> {"a": None}
+    """
+
+    def do_omit(self, handler):
+        serialized = handler(self)
+        return {k: v for k, v in serialized.items() if v is not None or k not in keys}
+
+    return do_omit
+
+
+def categorical_index(v: str, info: SerializationInfo) -> int | str:
+    """
+    Plain serializer that swaps a string for its index in the payload string table.
+
+    The table lives in the serialization context and grows in order of first appearance.
+    Without a table in the context the string is serialized as is.
+    """
+    if not isinstance(info.context, dict) or "strings" not in info.context:
+        return v
+    strings: dict[str, int] = info.context["strings"]
+    return strings.setdefault(v, len(strings))
+
+
 def string_literal_adapter(v: str):
     return TypeAdapter(Annotated[str, Strict(), BeforeValidator(match_literal(v))])  # type:ignore
 
@@ -23,12 +72,17 @@ def annotated_string_literal(v: str):
 
 
 annotated_string = Annotated[str, Strict()]
+annotated_categorical_string = Annotated[
+    str, Strict(), PlainSerializer(categorical_index, when_used="json")
+]
 annotated_int = Annotated[int, Strict()]
 annotated_float = Annotated[float, Strict()]
 annotated_bool = Annotated[bool, Strict()]
 annotated_alias_key = Annotated[str, Field(pattern=r"^[a-z][A-Za-z0-9_]*$")]
 
 StringAdapter = TypeAdapter(annotated_string)
+CategoricalStringAdapter = TypeAdapter(annotated_categorical_string)
+StringTableAdapter = TypeAdapter(list[str])
 IntAdapter = TypeAdapter(annotated_int)
 FloatAdapter = TypeAdapter(annotated_float)
 BoolAdapter = TypeAdapter(annotated_bool)
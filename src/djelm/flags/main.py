@@ -1,8 +1,15 @@
 from collections import deque
 import typing
-from dataclasses import dataclass
-
-from pydantic import BaseModel, TypeAdapter, validate_call
+from dataclasses import dataclass, replace
+
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    WrapSerializer,
+    model_serializer,
+    validate_call,
+)
 from typing_extensions import Annotated
 
 import djelm.codegen.annotation as Anno
@@ -14,26 +21,32 @@ import djelm.codegen.module_name as Module
 import djelm.codegen.op as Op
 import djelm.codegen.range as Range
 import djelm.codegen.writer as Writer
-from djelm.codegen.pattern import VarPattern
+from djelm.codegen.pattern import Pattern, VarPattern
 from djelm.flags.form.primitives import ModelChoiceFieldFlag
 
 from .adapters import (
     BoolAdapter,
+    CategoricalStringAdapter,
     FloatAdapter,
     IntAdapter,
     StringAdapter,
+    StringTableAdapter,
     annotated_alias_key,
     annotated_bool,
+    annotated_categorical_string,
     annotated_float,
     annotated_int,
     annotated_string,
     annotated_string_literal,
+    omit_none,
     string_literal_adapter,
+    transpose_rows,
 )
 from .primitives import (
     AliasFlag,
     BoolFlag,
     CustomTypeFlag,
+    DictFlag,
     Flag,
     FloatFlag,
     IntFlag,
@@ -78,6 +91,33 @@ def valid_alias_key(k: annotated_alias_key):
     return k
 
 
+STRINGS_ARG = "strings"
+
+
+def _with_strings_annotation(
+    annotation: Compiler.Annotation, strings: bool
+) -> Compiler.Annotation:
+    """Array String -> annotation, for decoders that take the payload string table"""
+    if strings:
+        return Anno.function([Anno.array(Anno.string())], annotation)
+    return annotation
+
+
+def _with_strings_expression(
+    expression: Compiler.Expression, strings: bool
+) -> Compiler.Expression:
+    if strings:
+        return Exp.Parenthesized(
+            Elm.apply(expression, [Elm.value(STRINGS_ARG)]),
+            None,
+        )
+    return expression
+
+
+def _strings_args(strings: bool) -> list[Pattern]:
+    return [VarPattern(STRINGS_ARG)] if strings else []
+
+
 @dataclass(slots=True)
 class StringDecoder:
     """Decoder helper for the Elm String primitive"""
@@ -104,23 +144,6 @@ class StringDecoder:
     def _compiler_annotation() -> Compiler.Annotation:
         return Anno.string()
 
-    def pipeline_expression(self) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [Elm.literal(self.value), self.decoder_expression()],
-            Range.Range(1, 0),
-        )
-
-    def pipeline_literal_expression(self, literal: str) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [
-                Elm.literal(self.value),
-                self.decoder_literal_expression(literal),
-            ],
-            Range.Range(1, 0),
-        )
-
     @staticmethod
     def decoder_expression() -> Compiler.Expression:
         return Elm.apply(
@@ -128,6 +151,86 @@ class StringDecoder:
             [],
         )
 
+    @staticmethod
+    def decoder_categorical_expression() -> Compiler.Expression:
+        return _with_strings_expression(Elm.value("categoricalStringDecoder"), True)
+
+    @staticmethod
+    def categorical_declaration() -> _DeclarationMetaStatic:
+        """
+        Resolves an index in to the payload string table.
+
+        categoricalStringDecoder : Array String -> Decode.Decoder String
+        categoricalStringDecoder strings =
+            Decode.int
+                |> Decode.andThen (\\idx -> Array.get idx strings |> ...)
+        """
+        sig = Compiler.Signature(
+            "categoricalStringDecoder",
+            _with_strings_annotation(
+                Anno.typed("Decode.Decoder", [Anno.string()]), True
+            ).annotation,
+        )
+        lookup = Op.pipes(
+            Elm.apply(
+                Exp.FunctionOrValue(Module.ModuleName(["Array"]), "get", None, None),
+                [Elm.value("idx"), Elm.value(STRINGS_ARG)],
+            ),
+            iter(
+                [
+                    Elm.apply(
+                        Exp.FunctionOrValue(
+                            Module.ModuleName(["Maybe"]), "withDefault", None, None
+                        ),
+                        [
+                            Exp.Parenthesized(
+                                Elm.apply(
+                                    Exp.FunctionOrValue(
+                                        Module.ModuleName(["Decode"]),
+                                        "fail",
+                                        None,
+                                        None,
+                                    ),
+                                    [Elm.literal("Missing categorical string")],
+                                ),
+                                None,
+                            )
+                        ],
+                    ),
+                    Elm.apply(
+                        Exp.FunctionOrValue(
+                            Module.ModuleName(["Maybe"]), "map", None, None
+                        ),
+                        [
+                            Exp.FunctionOrValue(
+                                Module.ModuleName(["Decode"]), "succeed", None, None
+                            )
+                        ],
+                    ),
+                ]
+            ),
+        )
+        expression = Op.pipe(
+            Elm.apply(
+                Exp.FunctionOrValue(
+                    Module.ModuleName(["Decode"]), "andThen", None, None
+                ),
+                [Exp.Parenthesized(Exp.Lambda([VarPattern("idx")], lookup), None)],
+                Range.Range(1, 0),
+            ),
+            IntDecoder.decoder_expression(),
+        )
+        return _DeclarationMetaStatic(
+            static_name="categoricalStringDecoder",
+            declarations=[
+                _DeclarationMetaBasic(
+                    declaration=Elm.declaration(
+                        sig.name, expression, sig, _strings_args(True)
+                    )
+                )
+            ],
+        )
+
     @staticmethod
     def decoder_literal_expression(literal: str) -> Compiler.Expression:
         return Exp.Parenthesized(
@@ -201,13 +304,6 @@ class IntDecoder:
     def _compiler_annotation() -> Compiler.Annotation:
         return Anno.int()
 
-    def pipeline_expression(self) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [Elm.literal(self.value), self.decoder_expression()],
-            Range.Range(1, 0),
-        )
-
     @staticmethod
     def decoder_expression() -> Compiler.Expression:
         return Elm.apply(
@@ -236,13 +332,6 @@ class BoolDecoder:
     def _compiler_annotation() -> Compiler.Annotation:
         return Anno.bool()
 
-    def pipeline_expression(self) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [Elm.literal(self.value), self.decoder_expression()],
-            Range.Range(1, 0),
-        )
-
     @staticmethod
     def decoder_expression() -> Compiler.Expression:
         return Elm.apply(
@@ -271,13 +360,6 @@ class FloatDecoder:
     def _compiler_annotation() -> Compiler.Annotation:
         return Anno.float()
 
-    def pipeline_expression(self) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [Elm.literal(self.value), self.decoder_expression()],
-            Range.Range(1, 0),
-        )
-
     @staticmethod
     def decoder_expression() -> Compiler.Expression:
         return Elm.apply(
@@ -307,18 +389,6 @@ class ListDecoder:
     def _compiler_annotation(annotation: Compiler.Annotation) -> Compiler.Annotation:
         return Anno.list(annotation)
 
-    def pipeline_expression(
-        self, expression: Compiler.Expression
-    ) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [
-                Elm.literal(self.value),
-                self.decoder_expression(expression),
-            ],
-            Range.Range(1, 0),
-        )
-
     @staticmethod
     def decoder_expression(expression: Compiler.Expression) -> Compiler.Expression:
         return Exp.Parenthesized(
@@ -330,6 +400,162 @@ class ListDecoder:
         )
 
 
+@dataclass(slots=True)
+class DictDecoder:
+    """Decoder helper for the Elm Dict primitive"""
+
+    value: str
+    key: Compiler.Annotation
+    target: Compiler.Annotation
+
+    def alias(self):
+        return f"""{self.value} : {self._annotation(self.key, self.target)}"""
+
+    def nested_alias(self):
+        return f""", {self.value} : {self._annotation(self.key, self.target)}"""
+
+    @staticmethod
+    def _annotation(key: Compiler.Annotation, annotation: Compiler.Annotation) -> str:
+        return Anno.toString(DictDecoder._compiler_annotation(key, annotation))
+
+    @staticmethod
+    def _compiler_annotation(
+        key: Compiler.Annotation, annotation: Compiler.Annotation
+    ) -> Compiler.Annotation:
+        return Anno.dict(key, annotation)
+
+    @staticmethod
+    def decoder_expression(
+        key: Flag, expression: Compiler.Expression
+    ) -> Compiler.Expression:
+        match key:
+            case IntFlag():
+                decoder = Elm.value("intDictDecoder")
+            case _:
+                decoder = Exp.FunctionOrValue(
+                    Module.ModuleName(["Decode"]), "dict", None, None
+                )
+        return Exp.Parenthesized(Elm.apply(decoder, [expression]), None)
+
+    @staticmethod
+    def int_key_declaration() -> _DeclarationMetaStatic:
+        """
+        Json object keys are always strings so Int keys are parsed after decoding.
+
+        intDictDecoder : Decode.Decoder a -> Decode.Decoder (Dict Int a)
+        intDictDecoder valueDecoder =
+            Decode.dict valueDecoder
+                |> Decode.map (Dict.foldl (\\key value acc -> ...) Dict.empty)
+        """
+        sig = Compiler.Signature(
+            "intDictDecoder",
+            Anno.function(
+                [
+                    Anno.typed(
+                        "Decode.Decoder",
+                        [Compiler.Annotation(Compiler.Generic("a"), {})],
+                    )
+                ],
+                Anno.typed(
+                    "Decode.Decoder",
+                    [
+                        Anno.dict(
+                            Anno.int(), Compiler.Annotation(Compiler.Generic("a"), {})
+                        )
+                    ],
+                ),
+            ).annotation,
+        )
+        insert = Op.pipes(
+            Elm.apply(
+                Exp.FunctionOrValue(Module.ModuleName(["String"]), "toInt", None, None),
+                [Elm.value("key")],
+            ),
+            iter(
+                [
+                    Elm.apply(
+                        Exp.FunctionOrValue(
+                            Module.ModuleName(["Maybe"]), "withDefault", None, None
+                        ),
+                        [Elm.value("acc")],
+                    ),
+                    Elm.apply(
+                        Exp.FunctionOrValue(
+                            Module.ModuleName(["Maybe"]), "map", None, None
+                        ),
+                        [
+                            Exp.Parenthesized(
+                                Exp.Lambda(
+                                    [VarPattern("k")],
+                                    Elm.apply(
+                                        Exp.FunctionOrValue(
+                                            Module.ModuleName(["Dict"]),
+                                            "insert",
+                                            None,
+                                            None,
+                                        ),
+                                        [
+                                            Elm.value("k"),
+                                            Elm.value("value"),
+                                            Elm.value("acc"),
+                                        ],
+                                    ),
+                                ),
+                                None,
+                            )
+                        ],
+                    ),
+                ]
+            ),
+        )
+        expression = Op.pipe(
+            Elm.apply(
+                Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "map", None, None),
+                [
+                    Exp.Parenthesized(
+                        Elm.apply(
+                            Exp.FunctionOrValue(
+                                Module.ModuleName(["Dict"]), "foldl", None, None
+                            ),
+                            [
+                                Exp.Parenthesized(
+                                    Exp.Lambda(
+                                        [
+                                            VarPattern("key"),
+                                            VarPattern("value"),
+                                            VarPattern("acc"),
+                                        ],
+                                        insert,
+                                    ),
+                                    None,
+                                ),
+                                Exp.FunctionOrValue(
+                                    Module.ModuleName(["Dict"]), "empty", None, None
+                                ),
+                            ],
+                        ),
+                        None,
+                    )
+                ],
+                Range.Range(1, 0),
+            ),
+            Elm.apply(
+                Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "dict", None, None),
+                [Elm.value("valueDecoder")],
+            ),
+        )
+        return _DeclarationMetaStatic(
+            static_name="intDictDecoder",
+            declarations=[
+                _DeclarationMetaBasic(
+                    declaration=Elm.declaration(
+                        sig.name, expression, sig, [VarPattern("valueDecoder")]
+                    )
+                )
+            ],
+        )
+
+
 @dataclass(slots=True)
 class NullableDecoder:
     """Decoder helper for the Elm Maybe monad"""
@@ -351,18 +577,6 @@ class NullableDecoder:
     def _compiler_annotation(annotation: Compiler.Annotation) -> Compiler.Annotation:
         return Anno.maybe(annotation)
 
-    def pipeline_expression(
-        self, expression: Compiler.Expression
-    ) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [
-                Elm.literal(self.value),
-                self.decoder_expression(expression),
-            ],
-            Range.Range(1, 0),
-        )
-
     @staticmethod
     def decoder_expression(expression: Compiler.Expression) -> Compiler.Expression:
         return Exp.Parenthesized(
@@ -383,14 +597,17 @@ class ObjectDecoder:
     value: str
     depth: int
     parent_alias: str | None = None
+    strings: bool = False
 
     def pipeline_signature(self) -> Compiler.Signature:
         return Compiler.Signature(
             self._to_decoder_name(),
-            Compiler.Typed(
-                "Decode.Decoder",
-                [self._compiler_annotation(Anno.record([])).annotation],
-            ),
+            _with_strings_annotation(
+                Anno.typed(
+                    "Decode.Decoder", [self._compiler_annotation(Anno.record([]))]
+                ),
+                self.strings,
+            ).annotation,
         )
 
     def alias(self, key: str):
@@ -406,11 +623,17 @@ class ObjectDecoder:
         return Anno.toString(anno)
 
     def _to_decoder_name(self):
+        return f"""{self._decoder_prefix()}Decoder"""
+
+    def _to_columns_decoder_name(self):
+        return f"""{self._decoder_prefix()}ColumnsDecoder"""
+
+    def _decoder_prefix(self) -> str:
         if self.parent_alias:
             prefix = f"{self.parent_alias.lower()}{self.value}"
         else:
             prefix = self.value[0].lower() + self.value[1:]
-        return f"""{prefix + self._depth_markers()}Decoder"""
+        return prefix + self._depth_markers()
 
     def _depth_markers(self) -> str:
         marker = ""
@@ -426,13 +649,6 @@ class ObjectDecoder:
             f"{p}{Format.alias_type(self.value)}{self._depth_markers()}", annotation
         )
 
-    def pipeline_expression(self, key: str) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [Elm.literal(key), self.decoder_expression()],
-            Range.Range(1, 0),
-        )
-
     def pipeline_starter_expression(self) -> Compiler.Expression:
         return Elm.apply(
             Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "succeed", None, None),
@@ -440,7 +656,108 @@ class ObjectDecoder:
         )
 
     def decoder_expression(self) -> Compiler.Expression:
-        return Elm.value(self._to_decoder_name())
+        return _with_strings_expression(
+            Elm.value(self._to_decoder_name()), self.strings
+        )
+
+
+@dataclass(slots=True)
+class ColumnarDecoder:
+    """
+    Decoder helper for a columnar encoded Elm List of {} primitives
+
+    Every field is decoded as a List and zipped back in to records.
+
+    e.g.
+            someColumnsDecoder : Decode.Decoder (List Some_)
+            someColumnsDecoder =
+                Decode.map (List.map Some_) (Decode.field "a" (Decode.list Decode.string))
+                    |> Decode.map2 (List.map2 (|>)) (Decode.field "b" (Decode.list Decode.int))
+    """
+
+    object_decoder: ObjectDecoder
+    field_decoders: list[tuple[str, Compiler.Expression]]
+
+    def signature(self) -> Compiler.Signature:
+        return Compiler.Signature(
+            self.object_decoder._to_columns_decoder_name(),
+            _with_strings_annotation(
+                Anno.typed(
+                    "Decode.Decoder",
+                    [
+                        Anno.list(
+                            self.object_decoder._compiler_annotation(Anno.record([]))
+                        )
+                    ],
+                ),
+                self.object_decoder.strings,
+            ).annotation,
+        )
+
+    def declaration(self) -> Compiler.Declaration:
+        assert 0 < len(self.field_decoders)
+
+        (first_key, first_decoder), *rest = self.field_decoders
+        top_pipe = Elm.apply(
+            Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "map", None, None),
+            [
+                Exp.Parenthesized(
+                    Elm.apply(
+                        Exp.FunctionOrValue(
+                            Module.ModuleName(["List"]), "map", None, None
+                        ),
+                        [Elm.value(self.object_decoder._to_annotation())],
+                    ),
+                    None,
+                ),
+                self._column_expression(first_key, first_decoder),
+            ],
+        )
+        zip_expressions = [
+            Elm.apply(
+                Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "map2", None, None),
+                [
+                    Exp.Parenthesized(
+                        Elm.apply(
+                            Exp.FunctionOrValue(
+                                Module.ModuleName(["List"]), "map2", None, None
+                            ),
+                            [Elm.value("(|>)")],
+                        ),
+                        None,
+                    ),
+                    self._column_expression(key, decoder),
+                ],
+                Range.Range(1, 0),
+            )
+            for key, decoder in rest
+        ]
+        sig = self.signature()
+
+        return Elm.declaration(
+            sig.name,
+            Op.pipes(top_pipe, reversed(zip_expressions)),
+            sig,
+            _strings_args(self.object_decoder.strings),
+        )
+
+    @staticmethod
+    def _column_expression(
+        key: str, expression: Compiler.Expression
+    ) -> Compiler.Expression:
+        return Exp.Parenthesized(
+            Elm.apply(
+                Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "field", None, None),
+                [Elm.literal(key), ListDecoder.decoder_expression(expression)],
+            ),
+            None,
+        )
+
+    def decoder_expression(self) -> Compiler.Expression:
+        return _with_strings_expression(
+            Elm.value(self.object_decoder._to_columns_decoder_name()),
+            self.object_decoder.strings,
+        )
 
 
 @dataclass(slots=True)
@@ -452,16 +769,6 @@ class CustomTypeDecoder:
     compiler_variants: list[Compiler.Variant]
     decoder_expressions: list[tuple[str, Compiler.Expression]]
 
-    @staticmethod
-    def pipeline_expression(
-        field: str, expression: Compiler.Expression
-    ) -> Compiler.Expression:
-        return Elm.apply(
-            Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
-            [Elm.literal(field), expression],
-            Range.Range(1, 0),
-        )
-
     def _to_annotation(self) -> str:
         return Anno.toString(self._compiler_annotation())
 
@@ -511,6 +818,14 @@ class CustomTypeDecoder:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _FlagOptions:
+    """Options that apply to every flag in a Flags tree"""
+
+    minify_keys: bool = False
+    categorical_strings: bool = False
+
+
 PipelineReturn = typing.TypedDict(
     "PipelineReturn",
     {
@@ -518,6 +833,7 @@ PipelineReturn = typing.TypedDict(
         "anno": typing.Dict[str, PrimitiveObjectFlagType],
         "alias_type": str,
         "field_annotations": list[tuple[str, Compiler.Annotation]],
+        "field_decoders": list[tuple[str, Compiler.Expression]],
         "type_declarations": list[_DeclarationMetaBasic | _DeclarationMetaStatic],
         "decoder_declarations": list[_DeclarationMetaBasic | _DeclarationMetaStatic],
     },
@@ -530,10 +846,19 @@ InlineReturn = typing.TypedDict(
         "alias_type": str,
         "compiler_annotation": Compiler.Annotation,
         "decoder_expression": Compiler.Expression,
+        "field_decoders": list[tuple[str, Compiler.Expression]],
         "type_declarations": list[_DeclarationMetaBasic | _DeclarationMetaStatic],
         "decoder_declarations": list[_DeclarationMetaBasic | _DeclarationMetaStatic],
     },
 )
+ColumnarReturn = typing.TypedDict(
+    "ColumnarReturn",
+    {
+        "anno": PrimitiveObjectFlagType,
+        "decoder_expression": Compiler.Expression,
+        "decoder_declaration": _DeclarationMetaBasic,
+    },
+)
 
 
 class FlagMetaClass(type):
@@ -542,14 +867,21 @@ class FlagMetaClass(type):
 
 
 class BaseFlag(metaclass=FlagMetaClass):
-    def __new__(cls, flag):
+    def __new__(cls, flag, minify_keys: bool = False):
         assert isinstance(flag, Flag)
 
+        options = _FlagOptions(
+            minify_keys=minify_keys,
+            categorical_strings=_has_categorical_strings(flag),
+        )
         prepared_flags: PipelineReturn | InlineReturn | None = None
         decoder_sig = (
             Compiler.Signature(
-                "toModel",
-                Compiler.Typed("Decode.Decoder", [Compiler.Typed("ToModel", [])]),
+                "toModelWith" if options.categorical_strings else "toModel",
+                _with_strings_annotation(
+                    Anno.typed("Decode.Decoder", [Anno.typed("ToModel", [])]),
+                    options.categorical_strings,
+                ).annotation,
             ),
             Elm.apply(
                 Exp.FunctionOrValue(
@@ -563,7 +895,9 @@ class BaseFlag(metaclass=FlagMetaClass):
 
         match flag:
             case ObjectFlag(obj=_):
-                prepared_flags = _prepare_pipeline_flags(flag, decoder_sig)
+                prepared_flags = _prepare_pipeline_flags(
+                    flag, decoder_sig, options=options
+                )
             case ModelChoiceFieldFlag(variants=_) as mcf:
                 prepared_flags = _prepare_pipeline_flags(
                     mcf.obj(), decoder_sig=decoder_sig
@@ -571,22 +905,37 @@ class BaseFlag(metaclass=FlagMetaClass):
                 prepared_flags["adapter"] = mcf.adapter()
             case _:
                 prepared_flags = _prepare_inline_flags(
-                    flag, ObjectDecoder("inlineToModel", 1), decoder_sig=decoder_sig
+                    flag,
+                    ObjectDecoder(
+                        "inlineToModel", 1, strings=options.categorical_strings
+                    ),
+                    decoder_sig=decoder_sig,
+                    options=options,
                 )
 
         assert prepared_flags is not None
 
+        if options.categorical_strings:
+            prepared_flags["decoder_declarations"] = [
+                _DeclarationMetaBasic(declaration=_string_table_declaration()),
+                *prepared_flags["decoder_declarations"],
+            ]
+
         class Prepared:
             """Validator and Elm values builder"""
 
             @staticmethod
             def parse(input) -> str:
+                # Categorical strings are collected in to the table during serialization
+                context: dict | None = (
+                    {STRINGS_ARG: {}} if options.categorical_strings else None
+                )
                 match flag:
                     case ObjectFlag(obj=_):
-                        return (
+                        value = (
                             prepared_flags["adapter"]
                             .validate_python(input)
-                            .model_dump_json()
+                            .model_dump_json(by_alias=True, context=context)
                         )
                     case ModelChoiceFieldFlag():
                         adapter = prepared_flags["adapter"]
@@ -595,7 +944,16 @@ class BaseFlag(metaclass=FlagMetaClass):
                     case _:
                         adapter = prepared_flags["adapter"]
                         validated = adapter.validate_python(input)
-                        return adapter.dump_json(validated).decode("utf-8")
+                        value = adapter.dump_json(
+                            validated, by_alias=True, context=context
+                        ).decode("utf-8")
+
+                if context is not None:
+                    strings = StringTableAdapter.dump_json(
+                        list(context[STRINGS_ARG])
+                    ).decode("utf-8")
+                    return f'{{"{STRINGS_ARG}":{strings},"value":{value}}}'
+                return value
 
             @staticmethod
             def to_elm_parser_data() -> PreparedElm:
@@ -661,18 +1019,24 @@ def _prepare_inline_flags(
     object_decoder: ObjectDecoder | None = None,
     depth: int = 1,
     decoder_sig: tuple[Compiler.Signature, Compiler.Expression] | None = None,
+    options: _FlagOptions = _FlagOptions(),
 ) -> InlineReturn:
     adapter: TypeAdapter
     anno: PrimitiveObjectFlagType
     alias_type: str = ""
     compiler_annotation = None
     decoder_expression: Compiler.Expression | None = None
+    field_decoders: list[tuple[str, Compiler.Expression]] = []
     type_declarations: list[_DeclarationMetaBasic | _DeclarationMetaStatic] = []
     decoder_declarations: list[_DeclarationMetaBasic | _DeclarationMetaStatic] = []
     match flag:
         case AliasFlag(name=alias_name, obj=alias_flag):
-            alias_object_decoder = ObjectDecoder(alias_name, 1)
-            object_inline = _prepare_inline_flags(alias_flag, alias_object_decoder)
+            alias_object_decoder = ObjectDecoder(
+                alias_name, 1, strings=options.categorical_strings
+            )
+            object_inline = _prepare_inline_flags(
+                alias_flag, alias_object_decoder, options=options
+            )
             adapter = object_inline["adapter"]
             anno = object_inline["anno"]
             alias_type = object_inline["alias_type"]
@@ -700,6 +1064,11 @@ def _prepare_inline_flags(
                     flag.literal
                 )
                 anno = annotated_string_literal(flag.literal)  # type:ignore
+            if flag.categorical:
+                adapter = CategoricalStringAdapter
+                decoder_expression = StringDecoder.decoder_categorical_expression()
+                anno = annotated_categorical_string  # type:ignore
+                decoder_declarations.append(StringDecoder.categorical_declaration())
             alias_type = StringDecoder._annotation()
             compiler_annotation = StringDecoder._compiler_annotation()
         case IntFlag():
@@ -721,7 +1090,7 @@ def _prepare_inline_flags(
             compiler_annotation = BoolDecoder._compiler_annotation()
             decoder_expression = BoolDecoder.decoder_expression()
         case NullableFlag(obj=obj):
-            object_inline = _prepare_inline_flags(obj, object_decoder)
+            object_inline = _prepare_inline_flags(obj, object_decoder, options=options)
             t = object_inline["anno"]
             adapter = TypeAdapter(Annotated[typing.Optional[t], None])
             anno = typing.Optional[t]  # type:ignore
@@ -738,8 +1107,8 @@ def _prepare_inline_flags(
             decoder_expression = NullableDecoder.decoder_expression(
                 object_inline["decoder_expression"]
             )
-        case ListFlag(obj=obj):
-            object_inline = _prepare_inline_flags(obj, object_decoder)
+        case ListFlag(obj=obj, columnar=columnar):
+            object_inline = _prepare_inline_flags(obj, object_decoder, options=options)
             t = object_inline["anno"]
             adapter = TypeAdapter(Annotated[list[t], None])  # type:ignore
             anno = list[t]  # type:ignore
@@ -753,6 +1122,38 @@ def _prepare_inline_flags(
             decoder_expression = ListDecoder.decoder_expression(
                 object_inline["decoder_expression"]
             )
+            if columnar:
+                assert object_decoder is not None
+                prepared_columnar = _prepare_columnar_flags(
+                    flag, object_decoder, object_inline
+                )
+                anno = prepared_columnar["anno"]
+                adapter = TypeAdapter(anno)
+                decoder_declarations.append(prepared_columnar["decoder_declaration"])
+                decoder_expression = prepared_columnar["decoder_expression"]
+        case DictFlag(key=key_flag, value=value_flag):
+            key_inline = _prepare_inline_flags(key_flag)
+            object_inline = _prepare_inline_flags(
+                value_flag, object_decoder, options=options
+            )
+            k = key_inline["anno"]
+            t = object_inline["anno"]
+            adapter = TypeAdapter(Annotated[dict[k, t], None])  # type:ignore
+            anno = dict[k, t]  # type:ignore
+            alias_type = DictDecoder._annotation(
+                key_inline["compiler_annotation"], object_inline["compiler_annotation"]
+            )
+
+            type_declarations.extend(object_inline["type_declarations"])
+            decoder_declarations.extend(object_inline["decoder_declarations"])
+            if isinstance(key_flag, IntFlag):
+                decoder_declarations.append(DictDecoder.int_key_declaration())
+            compiler_annotation = DictDecoder._compiler_annotation(
+                key_inline["compiler_annotation"], object_inline["compiler_annotation"]
+            )
+            decoder_expression = DictDecoder.decoder_expression(
+                key_flag, object_inline["decoder_expression"]
+            )
         case CustomTypeFlag(variants=v):
             if object_decoder is None:
                 raise Exception(
@@ -763,7 +1164,9 @@ def _prepare_inline_flags(
             annos = []
             variants: list[Compiler.Variant] = []
             next_object_decoder = ObjectDecoder(
-                object_decoder.value, object_decoder.depth + 1
+                object_decoder.value,
+                object_decoder.depth + 1,
+                strings=options.categorical_strings,
             )
             variant_decoder_expressions: list[tuple[str, Compiler.Expression]] = []
             for var in v:
@@ -772,8 +1175,11 @@ def _prepare_inline_flags(
                     formatted_constructor,
                     object_decoder.depth + 1,
                     object_decoder._to_annotation(),
+                    options.categorical_strings,
+                )
+                object_inline = _prepare_inline_flags(
+                    var[1], next_object_decoder, options=options
                 )
-                object_inline = _prepare_inline_flags(var[1], next_object_decoder)
                 variant_decoder_expressions.append(
                     (formatted_constructor, object_inline["decoder_expression"])
                 )
@@ -834,6 +1240,7 @@ def _prepare_inline_flags(
                 ),
                 depth + 1,
                 parent_key,
+                replace(options, minify_keys=False),
             )
             adapter = mcf.adapter()
             # Use internal annotation
@@ -879,6 +1286,7 @@ def _prepare_inline_flags(
                 ),
                 depth + 1,
                 parent_key,
+                options,
             )
             t = object_pipeline["anno"]  # type:ignore
             type_declaration = Elm.alias(
@@ -901,6 +1309,7 @@ def _prepare_inline_flags(
             )
             decoder_declarations.extend(object_pipeline["decoder_declarations"])
             decoder_expression = object_decoder.decoder_expression()
+            field_decoders = object_pipeline["field_decoders"]
         case _:
             raise Exception(f"Can't resolve core_schema type for: {flag}")
 
@@ -908,7 +1317,12 @@ def _prepare_inline_flags(
 
     if decoder_sig:
         sig, _ = decoder_sig
-        decoder_body = Elm.declaration(sig.name, decoder_expression, sig)
+        decoder_body = Elm.declaration(
+            sig.name,
+            decoder_expression,
+            sig,
+            _strings_args(options.categorical_strings),
+        )
 
     return {
         "adapter": adapter,
@@ -916,6 +1330,7 @@ def _prepare_inline_flags(
         "alias_type": alias_type,
         "compiler_annotation": compiler_annotation,
         "decoder_expression": decoder_expression,
+        "field_decoders": field_decoders,
         "type_declarations": type_declarations,
         "decoder_declarations": [
             _DeclarationMetaBasic(declaration=decoder_body),
@@ -931,11 +1346,14 @@ def _prepare_pipeline_flags(
     decoder_sig: tuple[Compiler.Signature, Compiler.Expression],
     depth: int = 1,
     parent_key: str | None = None,
+    options: _FlagOptions = _FlagOptions(),
 ) -> PipelineReturn:
     anno: typing.Dict[str, PrimitiveObjectFlagType] = {}
+    wire_keys: typing.Dict[str, str] = {}
+    optional_keys: set[str] = set()
     alias_values: str = ""
     field_annotations: list[tuple[str, Compiler.Annotation]] = []
-    pipeline_expressions: list[Compiler.Expression] = []
+    field_decoders: list[tuple[str, Compiler.Expression]] = []
     type_declarations: list[_DeclarationMetaBasic | _DeclarationMetaStatic] = []
     decoder_declarations: list[_DeclarationMetaBasic | _DeclarationMetaStatic] = []
 
@@ -944,10 +1362,16 @@ def _prepare_pipeline_flags(
             assert key not in RESERVED_KEYWORDS
             key = key.replace("\n", "")
             valid_alias_key(key)
+            wire_key = minified_key(idx) if options.minify_keys else key
+            wire_keys[key] = wire_key
             match value_flag:
                 case AliasFlag(name=alias_name, obj=alias_obj):
-                    object_decoder = ObjectDecoder(alias_name, 1)
-                    object_inline = _prepare_inline_flags(alias_obj, object_decoder)
+                    object_decoder = ObjectDecoder(
+                        alias_name, 1, strings=options.categorical_strings
+                    )
+                    object_inline = _prepare_inline_flags(
+                        alias_obj, object_decoder, options=options
+                    )
                     type_declarations.append(
                         _DeclarationMetaStatic(
                             static_name=alias_name,
@@ -966,21 +1390,21 @@ def _prepare_pipeline_flags(
                     )
                     match alias_obj:
                         case CustomTypeFlag():
-                            pipeline_expressions.append(
-                                CustomTypeDecoder.pipeline_expression(
-                                    key, object_inline["decoder_expression"]
-                                )
+                            field_decoders.append(
+                                (wire_key, object_inline["decoder_expression"])
                             )
                         case ObjectFlag():
-                            pipeline_expressions.append(
-                                object_decoder.pipeline_expression(key)
+                            field_decoders.append(
+                                (wire_key, object_decoder.decoder_expression())
                             )
                     if idx == 0:
                         alias_values += f" {object_decoder.alias(key)}"
                     else:
                         alias_values += f"\n    {object_decoder.nested_alias(key)}"
                 case ModelChoiceFieldFlag() as mcf:
-                    decoder = ObjectDecoder(key, depth, parent_key)
+                    decoder = ObjectDecoder(
+                        key, depth, parent_key, options.categorical_strings
+                    )
                     prepared_object_recursive = _prepare_pipeline_flags(
                         # Use built in flags
                         mcf.obj(),
@@ -990,6 +1414,7 @@ def _prepare_pipeline_flags(
                         ),
                         depth + 1,
                         parent_key=decoder._to_annotation(),
+                        options=replace(options, minify_keys=False),
                     )
 
                     # Use built in annotations
@@ -1022,14 +1447,16 @@ def _prepare_pipeline_flags(
                     decoder_declarations.extend(
                         prepared_object_recursive["decoder_declarations"]
                     )
-                    pipeline_expressions.append(decoder.pipeline_expression(key))
+                    field_decoders.append((wire_key, decoder.decoder_expression()))
                     if idx == 0:
                         alias_values += f" {decoder.alias(key)}"
                     else:
                         alias_values += f"\n    {decoder.nested_alias(key)}"
 
                 case ObjectFlag(obj=obj):
-                    decoder = ObjectDecoder(key, depth, parent_key)
+                    decoder = ObjectDecoder(
+                        key, depth, parent_key, options.categorical_strings
+                    )
                     prepared_object_recursive = _prepare_pipeline_flags(
                         ObjectFlag(obj),
                         (
@@ -1038,16 +1465,9 @@ def _prepare_pipeline_flags(
                         ),
                         depth + 1,
                         parent_key=decoder._to_annotation(),
+                        options=options,
                     )
-                    anno[key] = type(
-                        "K",
-                        (BaseModel,),
-                        {
-                            "__annotations__": prepared_object_recursive[
-                                "anno"
-                            ].__origin__.__annotations__  # type:ignore
-                        },
-                    )
+                    anno[key] = prepared_object_recursive["anno"].__origin__  # type:ignore
                     field_annotations.append(
                         (
                             key,
@@ -1073,38 +1493,95 @@ def _prepare_pipeline_flags(
                     decoder_declarations.extend(
                         prepared_object_recursive["decoder_declarations"]
                     )
-                    pipeline_expressions.append(decoder.pipeline_expression(key))
+                    field_decoders.append((wire_key, decoder.decoder_expression()))
                     if idx == 0:
                         alias_values += f" {decoder.alias(key)}"
                     else:
                         alias_values += f"\n    {decoder.nested_alias(key)}"
 
-                case ListFlag(obj=obj):
-                    decoder = ObjectDecoder(key, depth, parent_key)
-                    object_inline = _prepare_inline_flags(obj, decoder)
+                case ListFlag(obj=obj, columnar=columnar):
+                    decoder = ObjectDecoder(
+                        key, depth, parent_key, options.categorical_strings
+                    )
+                    object_inline = _prepare_inline_flags(obj, decoder, options=options)
                     list_decoder = ListDecoder(
                         key,
                         object_inline["compiler_annotation"],
                     )
                     type_declarations.extend(object_inline["type_declarations"])
                     decoder_declarations.extend(object_inline["decoder_declarations"])
-                    anno[key] = list[object_inline["anno"]]  # type:ignore
                     field_annotations.append(
                         (key, Anno.list(object_inline["compiler_annotation"]))
                     )
-                    pipeline_expressions.append(
-                        list_decoder.pipeline_expression(
-                            object_inline["decoder_expression"]
+                    if columnar:
+                        prepared_columnar = _prepare_columnar_flags(
+                            value_flag, decoder, object_inline
+                        )
+                        decoder_declarations.append(
+                            prepared_columnar["decoder_declaration"]
+                        )
+                        anno[key] = prepared_columnar["anno"]
+                        field_decoders.append(
+                            (wire_key, prepared_columnar["decoder_expression"])
+                        )
+                    else:
+                        anno[key] = list[object_inline["anno"]]  # type:ignore
+                        field_decoders.append(
+                            (
+                                wire_key,
+                                ListDecoder.decoder_expression(
+                                    object_inline["decoder_expression"]
+                                ),
+                            )
                         )
-                    )
                     if idx == 0:
                         alias_values += f" {list_decoder.alias()}"
                     else:
                         alias_values += f"\n    {list_decoder.nested_alias()}"
 
+                case DictFlag(key=key_flag, value=obj):
+                    decoder = ObjectDecoder(
+                        key, depth, parent_key, options.categorical_strings
+                    )
+                    key_inline = _prepare_inline_flags(key_flag)
+                    object_inline = _prepare_inline_flags(obj, decoder, options=options)
+                    dict_decoder = DictDecoder(
+                        key,
+                        key_inline["compiler_annotation"],
+                        object_inline["compiler_annotation"],
+                    )
+                    type_declarations.extend(object_inline["type_declarations"])
+                    decoder_declarations.extend(object_inline["decoder_declarations"])
+                    if isinstance(key_flag, IntFlag):
+                        decoder_declarations.append(DictDecoder.int_key_declaration())
+                    anno[key] = dict[key_inline["anno"], object_inline["anno"]]  # type:ignore
+                    field_annotations.append(
+                        (
+                            key,
+                            Anno.dict(
+                                key_inline["compiler_annotation"],
+                                object_inline["compiler_annotation"],
+                            ),
+                        )
+                    )
+                    field_decoders.append(
+                        (
+                            wire_key,
+                            DictDecoder.decoder_expression(
+                                key_flag, object_inline["decoder_expression"]
+                            ),
+                        )
+                    )
+                    if idx == 0:
+                        alias_values += f" {dict_decoder.alias()}"
+                    else:
+                        alias_values += f"\n    {dict_decoder.nested_alias()}"
+
                 case CustomTypeFlag(variants=_) as ctf:
-                    decoder = ObjectDecoder(key, depth, parent_key)
-                    object_inline = _prepare_inline_flags(ctf, decoder)
+                    decoder = ObjectDecoder(
+                        key, depth, parent_key, options.categorical_strings
+                    )
+                    object_inline = _prepare_inline_flags(ctf, decoder, options=options)
                     anno[key] = typing.Optional[object_inline["anno"]]  # type:ignore
                     field_annotations.append(
                         (key, object_inline["compiler_annotation"])
@@ -1113,10 +1590,8 @@ def _prepare_pipeline_flags(
                     type_declarations.extend(object_inline["type_declarations"])
                     decoder_declarations.extend(object_inline["decoder_declarations"])
 
-                    pipeline_expressions.append(
-                        CustomTypeDecoder.pipeline_expression(
-                            key, object_inline["decoder_expression"]
-                        )
+                    field_decoders.append(
+                        (wire_key, object_inline["decoder_expression"])
                     )
                     if idx == 0:
                         alias_values += f" {decoder.alias(key)}"
@@ -1126,7 +1601,11 @@ def _prepare_pipeline_flags(
 
                 case NullableFlag(obj=obj1):
                     object_inline = _prepare_inline_flags(
-                        obj1, ObjectDecoder(key, depth, parent_key)
+                        obj1,
+                        ObjectDecoder(
+                            key, depth, parent_key, options.categorical_strings
+                        ),
+                        options=options,
                     )
                     nullable_decoder = NullableDecoder(
                         key,
@@ -1135,13 +1614,19 @@ def _prepare_pipeline_flags(
                     type_declarations.extend(object_inline["type_declarations"])
                     decoder_declarations.extend(object_inline["decoder_declarations"])
                     anno[key] = typing.Optional[object_inline["anno"]]  # type:ignore
+                    if value_flag.omit_when_none:
+                        anno[key] = Annotated[anno[key], Field(default=None)]  # type:ignore
+                        optional_keys.add(wire_key)
                     field_annotations.append(
                         (key, Anno.maybe(object_inline["compiler_annotation"]))
                     )
 
-                    pipeline_expressions.append(
-                        nullable_decoder.pipeline_expression(
-                            object_inline["decoder_expression"]
+                    field_decoders.append(
+                        (
+                            wire_key,
+                            NullableDecoder.decoder_expression(
+                                object_inline["decoder_expression"]
+                            ),
                         )
                     )
 
@@ -1156,17 +1641,10 @@ def _prepare_pipeline_flags(
                     field_annotations.append(
                         (key, single_prepared["compiler_annotation"])
                     )
-
-                    if value_flag.literal:
-                        pipeline_expressions.append(
-                            string_decoder.pipeline_literal_expression(
-                                value_flag.literal
-                            )
-                        )
-                    else:
-                        pipeline_expressions.append(
-                            string_decoder.pipeline_expression()
-                        )
+                    decoder_declarations.extend(single_prepared["decoder_declarations"])
+                    field_decoders.append(
+                        (wire_key, single_prepared["decoder_expression"])
+                    )
 
                     if idx == 0:
                         alias_values += f" {string_decoder.alias()}"
@@ -1180,7 +1658,9 @@ def _prepare_pipeline_flags(
                     field_annotations.append(
                         (key, single_prepared["compiler_annotation"])
                     )
-                    pipeline_expressions.append(int_decoder.pipeline_expression())
+                    field_decoders.append(
+                        (wire_key, single_prepared["decoder_expression"])
+                    )
 
                     if idx == 0:
                         alias_values += f" {int_decoder.alias()}"
@@ -1194,7 +1674,9 @@ def _prepare_pipeline_flags(
                     field_annotations.append(
                         (key, single_prepared["compiler_annotation"])
                     )
-                    pipeline_expressions.append(float_decoder.pipeline_expression())
+                    field_decoders.append(
+                        (wire_key, single_prepared["decoder_expression"])
+                    )
 
                     if idx == 0:
                         alias_values += f" {float_decoder.alias()}"
@@ -1208,7 +1690,9 @@ def _prepare_pipeline_flags(
                     field_annotations.append(
                         (key, single_prepared["compiler_annotation"])
                     )
-                    pipeline_expressions.append(bool_decoder.pipeline_expression())
+                    field_decoders.append(
+                        (wire_key, single_prepared["decoder_expression"])
+                    )
                     if idx == 0:
                         alias_values += f" {bool_decoder.alias()}"
                     else:
@@ -1220,22 +1704,39 @@ def _prepare_pipeline_flags(
             raise err
 
     sig, top_pipe = decoder_sig
+    pipeline_expressions = [
+        _optional_expression(wire_key, expression)
+        if wire_key in optional_keys
+        else _required_expression(wire_key, expression)
+        for wire_key, expression in field_decoders
+    ]
 
     pipeline_decoder = Elm.declaration(
         sig.name,
         Op.pipes(top_pipe, reversed(pipeline_expressions)),
         sig,
+        _strings_args(options.categorical_strings),
     )
 
+    if options.minify_keys:
+        anno = {
+            k: Annotated[t, Field(serialization_alias=wire_keys[k])]  # type:ignore
+            for k, t in anno.items()
+        }
+
+    namespace: dict[str, typing.Any] = {"__annotations__": anno}
+    if optional_keys:
+        namespace["omit_none"] = model_serializer(mode="wrap")(omit_none(optional_keys))
+    model = type("K", (BaseModel,), namespace)
+
     return {
-        "adapter": TypeAdapter(
-            Annotated[type("K", (BaseModel,), {"__annotations__": anno}), None]
-        ),  # type:ignore
-        "anno": Annotated[type("K", (BaseModel,), {"__annotations__": anno}), None],  # type:ignore
+        "adapter": TypeAdapter(Annotated[model, None]),  # type:ignore
+        "anno": Annotated[model, None],  # type:ignore
         "alias_type": "{" + alias_values + "\n    }",
         "alias_extra": "",
         "decoder_extra": "",
         "field_annotations": field_annotations,
+        "field_decoders": field_decoders,
         "type_declarations": type_declarations,
         "decoder_declarations": [
             _DeclarationMetaBasic(declaration=pipeline_decoder),
@@ -1244,6 +1745,145 @@ def _prepare_pipeline_flags(
     }
 
 
+def _has_categorical_strings(flag: Flag) -> bool:
+    match flag:
+        case StringFlag(categorical=categorical):
+            return categorical
+        case (
+            NullableFlag(obj=obj)
+            | ListFlag(obj=obj)
+            | AliasFlag(obj=obj)
+            | DictFlag(value=obj)
+        ):
+            return _has_categorical_strings(obj)
+        case ObjectFlag(obj=obj):
+            return any(_has_categorical_strings(f) for f in obj.values())
+        case CustomTypeFlag(variants=variants):
+            return any(_has_categorical_strings(f) for _, f in variants)
+        case _:
+            return False
+
+
+def _string_table_declaration() -> Compiler.Declaration:
+    """
+    Decodes the payload string table and hands it to every decoder.
+
+    toModel : Decode.Decoder ToModel
+    toModel =
+        Decode.field "strings" (Decode.array Decode.string)
+            |> Decode.andThen (\\strings -> Decode.field "value" (toModelWith strings))
+    """
+    sig = Compiler.Signature(
+        "toModel",
+        Anno.typed("Decode.Decoder", [Anno.typed("ToModel", [])]).annotation,
+    )
+    expression = Op.pipe(
+        Elm.apply(
+            Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "andThen", None, None),
+            [
+                Exp.Parenthesized(
+                    Exp.Lambda(
+                        [VarPattern(STRINGS_ARG)],
+                        Elm.apply(
+                            Exp.FunctionOrValue(
+                                Module.ModuleName(["Decode"]), "field", None, None
+                            ),
+                            [
+                                Elm.literal("value"),
+                                _with_strings_expression(
+                                    Elm.value("toModelWith"), True
+                                ),
+                            ],
+                        ),
+                    ),
+                    None,
+                )
+            ],
+            Range.Range(1, 0),
+        ),
+        Elm.apply(
+            Exp.FunctionOrValue(Module.ModuleName(["Decode"]), "field", None, None),
+            [
+                Elm.literal(STRINGS_ARG),
+                Exp.Parenthesized(
+                    Elm.apply(
+                        Exp.FunctionOrValue(
+                            Module.ModuleName(["Decode"]), "array", None, None
+                        ),
+                        [StringDecoder.decoder_expression()],
+                    ),
+                    None,
+                ),
+            ],
+        ),
+    )
+    return Elm.declaration(sig.name, expression, sig)
+
+
+def _required_expression(
+    key: str, expression: Compiler.Expression
+) -> Compiler.Expression:
+    return Elm.apply(
+        Exp.FunctionOrValue(Module.ModuleName([]), "required", None, None),
+        [Elm.literal(key), expression],
+        Range.Range(1, 0),
+    )
+
+
+def _optional_expression(
+    key: str, expression: Compiler.Expression
+) -> Compiler.Expression:
+    return Elm.apply(
+        Exp.FunctionOrValue(Module.ModuleName([]), "optional", None, None),
+        [Elm.literal(key), expression, Elm.value("Nothing")],
+        Range.Range(1, 0),
+    )
+
+
+def minified_key(idx: int) -> str:
+    """
+    Short wire key for the field at idx, in base 36.
+
+    0 -> "0", 35 -> "z", 36 -> "10"
+    """
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    key = ""
+    while True:
+        idx, remainder = divmod(idx, 36)
+        key = digits[remainder] + key
+        if idx == 0:
+            return key
+
+
+def _prepare_columnar_flags(
+    flag: ListFlag,
+    object_decoder: ObjectDecoder,
+    object_inline: InlineReturn,
+) -> ColumnarReturn:
+    """
+    Wire format and decoder for a columnar ListFlag.
+
+    Rows are transposed to columns when serializing to json and the generated decoder
+    zips the columns back in to the same List of records.
+    """
+    if not isinstance(flag.obj, ObjectFlag):
+        raise Exception(f"A columnar ListFlag only supports an ObjectFlag: {flag.obj}")
+    keys = [key for key, _ in object_inline["field_decoders"]]
+    columnar_decoder = ColumnarDecoder(object_decoder, object_inline["field_decoders"])
+    t = object_inline["anno"]
+
+    return {
+        "anno": Annotated[
+            list[t],  # type:ignore
+            WrapSerializer(transpose_rows(keys), when_used="json"),
+        ],
+        "decoder_expression": columnar_decoder.decoder_expression(),
+        "decoder_declaration": _DeclarationMetaBasic(
+            declaration=columnar_decoder.declaration()
+        ),
+    }
+
+
 class Flags(BaseFlag):
     """
     A class for validating djelm flags that are used in Elm programs.
@@ -1253,6 +1893,13 @@ class Flags(BaseFlag):
 
     f2 = Flags(StringFlag())
     f2.parse("hello world") -> '"hello world"'
+
+    minify_keys :
+        Serialize ObjectFlag keys as short base 36 indices, the generated decoders
+        map them back to the original field names.
+
+        f3 = Flags(ObjectFlag({"hello": StringFlag()}), minify_keys=True)
+        f3.parse({"hello": "world"}) -> '{"0":"world"}'
     """
 
     if typing.TYPE_CHECKING:
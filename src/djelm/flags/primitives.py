@@ -16,9 +16,22 @@ class StringFlag(Flag):
         Will match against the passed string literal.
 
         Generated decoders will also express the string literal
+
+    categorical :
+        For low cardinality values such as a status or country.
+
+        Each distinct string is sent once in a payload string table and every value
+        is sent as an index in to that table.
+
+        Generated decoders will resolve the index back to a String.
     """
 
     literal: str | None = None
+    categorical: bool = False
+
+    def __post_init__(self):
+        if self.literal is not None and self.categorical:
+            raise Exception("A StringFlag can't be both a literal and categorical")
 
 
 @dataclass(slots=True)
@@ -38,16 +51,67 @@ class BoolFlag(Flag):
 
 @dataclass(slots=True)
 class NullableFlag(Flag):
-    """Flag for the Elm Maybe monad"""
+    """Flag for the Elm Maybe monad
+
+    omit_when_none :
+        Only applies to ObjectFlag fields.
+
+        Leaves the field out of the json when its value is None instead of sending null,
+        the field may also be left out of the python value.
+
+        Generated decoders will decode a missing field as Nothing.
+    """
 
     obj: Flag
+    omit_when_none: bool = False
 
 
 @dataclass(slots=True)
 class ListFlag(Flag):
-    """Flag for the Elm List primitive"""
+    """Flag for the Elm List primitive
+
+    columnar :
+        Only valid when obj is an ObjectFlag.
+
+        Serializes the list of records as one array per field instead of
+        repeating every key for every record.
+
+        [{"a": 1, "b": 2}, {"a": 3, "b": 4}] -> {"a": [1, 3], "b": [2, 4]}
+
+        Generated decoders zip the fields back in to the same List of records.
+    """
 
     obj: Flag
+    columnar: bool = False
+
+
+@dataclass(slots=True)
+class DictFlag(Flag):
+    """Flag for the Elm Dict primitive
+
+    key :
+        A StringFlag or IntFlag.
+
+        Serialized as the keys of a json object, generated decoders decode them
+        back to a String or Int Dict key.
+
+    value :
+        Flag for every value in the Dict.
+
+    DictFlag(StringFlag(), IntFlag()) -> Dict String Int
+    """
+
+    key: "StringFlag | IntFlag"
+    value: Flag
+
+    def __post_init__(self):
+        match self.key:
+            case StringFlag(literal=None, categorical=False) | IntFlag():
+                pass
+            case _:
+                raise Exception(
+                    f"A DictFlag key must be a StringFlag or IntFlag: {self.key}"
+                )
 
 
 @dataclass(slots=True)
@@ -82,6 +146,18 @@ class CustomTypeFlag(Flag):
 
     variants: list[tuple[str, Flag]]
 
+    def __post_init__(self):
+        # Categorical strings are sent as an index, a sibling variant that also
+        # decodes a number would make the generated oneOf ambiguous.
+        numeric = [name for name, flag in self.variants if _decodes_number(flag)]
+        categorical = [
+            name for name, flag in self.variants if _decodes_categorical(flag)
+        ]
+        if categorical and len(numeric) > 1:
+            raise Exception(
+                f"A categorical StringFlag variant can't be used alongside other variants that decode a number: {', '.join(numeric)}"
+            )
+
 
 @dataclass(slots=True)
 class AliasFlag(Flag):
@@ -119,6 +195,33 @@ class AliasFlag(Flag):
     obj: ObjectFlag | CustomTypeFlag
 
 
+def _decodes_categorical(flag: Flag) -> bool:
+    match flag:
+        case StringFlag(categorical=categorical):
+            return categorical
+        case NullableFlag(obj=obj) | AliasFlag(obj=obj):
+            return _decodes_categorical(obj)
+        case CustomTypeFlag(variants=variants):
+            return any(_decodes_categorical(f) for _, f in variants)
+        case _:
+            return False
+
+
+def _decodes_number(flag: Flag) -> bool:
+    """Whether a flag's json can be a bare number, categorical strings included"""
+    match flag:
+        case IntFlag() | FloatFlag():
+            return True
+        case StringFlag(categorical=categorical):
+            return categorical
+        case NullableFlag(obj=obj) | AliasFlag(obj=obj):
+            return _decodes_number(obj)
+        case CustomTypeFlag(variants=variants):
+            return any(_decodes_number(f) for _, f in variants)
+        case _:
+            return False
+
+
 FlagsObject = dict[str, "PrimitiveFlag"]
 FlagsList = list["PrimitiveFlag"]
 FlagsNullable = typing.Union[type[str], type[int], type[float], type[bool], type[None]]
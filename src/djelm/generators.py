@@ -5,7 +5,7 @@ from typing import Protocol
 from typing_extensions import TypedDict
 
 import djelm.flag_loader as FlagLoader
-from djelm.cookiecutter import CookieCutter
+from djelm.cookiecutter import CookieCutter, TemplateCutter
 from djelm.effect import ExitFailure, ExitSuccess
 from djelm.flags import Flags
 from djelm.flags.primitives import IntFlag
@@ -230,7 +230,7 @@ DEFAULT_WIDGET_IMPORTS = ['import defo from "@icelab/defo";']
 def widget_cookie_cutter(
     app_name: str, src_path: str, program_name: WIDGET_NAMES_T, version: str
 ) -> CookieCutter:
-    return CookieCutter[WidgetProgramCookieExtra](
+    return TemplateCutter[WidgetProgramCookieExtra](
         file_dir=os.path.dirname(__file__),
         output_dir=os.path.join(src_path, *STUFF_NAMESPACE),
         cookie_template_name="widget_templates",
@@ -256,8 +256,8 @@ def entrypoint_cookie_cutter(
     view_prefix: str,
     imports: list[str] = [],
     extras: list[str] = [],
-) -> CookieCutter:
-    return CookieCutter[EntrypointCookieExtra](
+) -> TemplateCutter:
+    return TemplateCutter[EntrypointCookieExtra](
         file_dir=os.path.join(os.path.dirname(__file__), "cookiecutters"),
         output_dir=os.path.join(src_path, *STUFF_NAMESPACE),
         cookie_template_name="entrypoint_template",
@@ -282,16 +282,17 @@ def model_cookie_cutter(
     dir: str,
     output_dir: str,
     module_model_namespace: str,
-):
-    return CookieCutter[ProgramModelCookieExtra](
+) -> TemplateCutter:
+    parser_data = flags.to_elm_parser_data()
+    return TemplateCutter[ProgramModelCookieExtra](
         file_dir=os.path.join((os.path.dirname(__file__)), "cookiecutters"),
         output_dir=(output_dir),
         cookie_template_name=cookie_template_name,
         extra={
             "program_name": module_name(program_name),
             "dir": dir,
-            "alias_type": flags.to_elm_parser_data()["alias_type"],
-            "decoder_body": flags.to_elm_parser_data()["decoder_body"],
+            "alias_type": parser_data["alias_type"],
+            "decoder_body": parser_data["decoder_body"],
             "module_model_namespace": module_model_namespace,
         },
         overwrite=True,
@@ -0,0 +1,24 @@
+from jinja2 import Environment
+from jinja2.ext import Extension
+
+from djelm.render import include_program, render_program
+
+
+class DjelmExtension(Extension):
+    """
+    Jinja2 extension exposing djelm programs as global functions.
+
+    {{ render_program(key, MainFlags.parse(value), settings) }}
+    {{ include_program("dist/Main.js") }}
+
+    Both render the same markup as the djelm Django template tags.
+    """
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        environment.globals.update(
+            {"render_program": render_program, "include_program": include_program}
+        )
+
+
+djelm = DjelmExtension
@@ -6,8 +6,10 @@ from ...strategy import (
     AddProgramHandlersStrategy,
     AddProgramStrategy,
     AddWidgetStrategy,
+    CompileAllStrategy,
     CompileStrategy,
     CreateStrategy,
+    DepsStrategy,
     ElmStrategy,
     FindProgramsStrategy,
     GenerateModelStrategy,
@@ -17,11 +19,29 @@ from ...strategy import (
     NpmStrategy,
     RemoveProgramStrategy,
     Strategy,
+    WatchAllStrategy,
     WatchStrategy,
 )
 from ...validate import Validations
 
 
+def non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not a whole number")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} can't be negative")
+    return number
+
+
+def positive_int(value: str) -> int:
+    number = non_negative_int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} must be at least 1")
+    return number
+
+
 class Command(LabelCommand):
     help = "Runs elm commands"
     missing_args_message = """
@@ -32,15 +52,22 @@ Command arguments are missing, please add one of the following:
   removeprogram <app-name> <program-name> - remove all files associated with an Elm program called <program-name> in the <app-name> app
   addwidget <app-name> <widget-name> - create a widget program in the <app-name> app
   watch <app-name> - will watch the app's src file for Elm code changes and compile
+  watch <app-name> --debounce MS - milliseconds to wait for a burst of changes to settle before compiling
+  watch --all [--jobs N] - to watch every djelm app with one watcher, compiling up to N apps at a time
   npm <app-name> [args].. - call your designated NODE_PACKAGE_MANAGER with [args]
   elm <app-name> [args].. - call your designated ELM_BIN_PATH with [args]
   generatemodel <app-name> [args].. - generate a model for the existing program <program-name> in the <app-name> app
   generatemodel <app-name> - generate a model for all programs in the <app-name> app
+  generatemodels <app-name> --jobs N - evaluate up to N flag modules at a time
   list - to list all your djelm apps
   listwidgets - to list all supported widget programs
   findprograms - to list all Elm programs in src/
+  deps <app-name> <module> - show the imports of an Elm module, the modules importing it and the programs it affects
   compile <app-name> - to compile all your elm programs in the given <app-name> app
   compilebuild <app-name> - to compile all your elm programs with a production level build in the given <app-name> app
+  compilebuild <app-name> --compress - to also write gzip and brotli compressed copies of the built assets
+  compile <app-name> --force - to compile every program, including those whose inputs have not changed
+  compile --all [--jobs N] - to compile every djelm app concurrently, compilebuild --all for production builds
 Usage example:
   python manage.py djelm create djelm_app
   python manage.py djelm addprogram djelm_app MyElmProgram
@@ -48,6 +75,7 @@ Usage example:
   python manage.py djelm removeprogram djelm_app MyElmProgram
   python manage.py djelm addwidget djelm_app ModelChoiceField
   python manage.py djelm watch djelm_app
+  python manage.py djelm watch --all
   python manage.py djelm npm djelm_app install
   python manage.py djelm elm djelm_app install <elm-package>
   python manage.py djelm generatemodel djelm_app MyElmProgram
@@ -55,8 +83,11 @@ Usage example:
   python manage.py djelm list
   python manage.py djelm listwidgets
   python manage.py djelm findprograms djelm_app
+  python manage.py djelm deps djelm_app Shared.Ui
   python manage.py djelm compile djelm_app
   python manage.py djelm compilebuild djelm_app
+  python manage.py djelm compilebuild djelm_app --compress
+  python manage.py djelm compilebuild --all --jobs 4
 """
     validate = None
     strategy: (
@@ -64,7 +95,9 @@ Usage example:
         | AddProgramStrategy
         | AddWidgetStrategy
         | CreateStrategy
+        | CompileAllStrategy
         | CompileStrategy
+        | DepsStrategy
         | ElmStrategy
         | FindProgramsStrategy
         | GenerateModelStrategy
@@ -73,6 +106,7 @@ Usage example:
         | ListWidgetsStrategy
         | NpmStrategy
         | RemoveProgramStrategy
+        | WatchAllStrategy
         | WatchStrategy
     )
 
@@ -90,6 +124,11 @@ Usage example:
 
         else:
             parser.add_argument("--no-deps", action="store_true")
+            parser.add_argument("--compress", action="store_true")
+            parser.add_argument("--force", action="store_true")
+            parser.add_argument("--all", action="store_true")
+            parser.add_argument("--jobs", type=positive_int)
+            parser.add_argument("--debounce", type=non_negative_int)
             super(Command, self).add_arguments(parser)
 
     def handle(self, *labels, **options):  # type:ignore
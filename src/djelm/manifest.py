@@ -0,0 +1,94 @@
+import json
+import os
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+MANIFEST_NAME = "djelm-manifest.json"
+MANIFEST_PATH = f"dist/{MANIFEST_NAME}"
+
+
+def _static_stamps() -> tuple[tuple[str, int], ...]:
+    """
+    The mtimes of every static directory and its dist directory, these change
+    when an app compiles its first manifest.
+    """
+    stamps = []
+    for finder in finders.get_finders():
+        for storage in getattr(finder, "storages", {}).values():
+            location = getattr(storage, "location", None)
+            if not location:
+                continue
+            for path in (location, os.path.join(location, "dist")):
+                try:
+                    stamps.append((path, os.stat(path).st_mtime_ns))
+                except OSError:
+                    continue
+    return tuple(stamps)
+
+
+@lru_cache(maxsize=1)
+def _manifest_paths(stamps: tuple[tuple[str, int], ...]) -> tuple[str, ...]:
+    return tuple(finders.find(MANIFEST_PATH, True) or [])
+
+
+def _read_manifests(paths) -> dict:
+    manifest: dict = {}
+    for path in paths:
+        try:
+            with open(path) as f:
+                manifest |= json.load(f)
+        except (OSError, ValueError):
+            continue
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def _merge_manifests(stamps: tuple[tuple[str, float], ...]) -> dict:
+    return _read_manifests(path for path, _ in stamps)
+
+
+@lru_cache(maxsize=1)
+def _loaded_manifest() -> dict:
+    return _read_manifests(finders.find(MANIFEST_PATH, True) or [])
+
+
+def load_manifest() -> dict:
+    """
+    Merge the djelm-manifest.json build output of every djelm app.
+
+    Manifests are read once and kept in memory. With DEBUG on they are read
+    again when the compile command rewrites them, and new manifests are found
+    when a static directory changes.
+    """
+    if not settings.DEBUG:
+        return _loaded_manifest()
+    stamps = []
+    for path in _manifest_paths(_static_stamps()):
+        try:
+            stamps.append((path, os.path.getmtime(path)))
+        except OSError:
+            continue
+    return _merge_manifests(tuple(stamps))
+
+
+def clear_manifest_cache():
+    _manifest_paths.cache_clear()
+    _merge_manifests.cache_clear()
+    _loaded_manifest.cache_clear()
+
+
+def program_file(djelm_program: str) -> str:
+    """
+    The static path of a program entrypoint, content hashed when built with
+    compilebuild.
+    """
+    return load_manifest().get(djelm_program, {}).get("file", djelm_program)
+
+
+def program_imports(djelm_program: str) -> list[str]:
+    """
+    The static paths of the chunks a program entrypoint dynamically imports.
+    """
+    return load_manifest().get(djelm_program, {}).get("imports", [])
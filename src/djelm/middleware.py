@@ -0,0 +1,54 @@
+from djelm.render import INCLUDES_PLACEHOLDER
+
+
+class ProgramIncludesMiddleware:
+    """
+    Places the program includes collected during a request at the
+    {% djelm_includes %} placeholder.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        includes = getattr(request, "djelm_includes", None)
+
+        if includes is None or not includes.deferred or response.streaming:
+            return response
+
+        response.content = response.content.replace(
+            INCLUDES_PLACEHOLDER.encode(response.charset),
+            includes.render().encode(response.charset),
+            1,
+        )
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = str(len(response.content))
+        return response
+
+
+class ProgramPreloadMiddleware:
+    """
+    Adds a Link modulepreload header for the entry and Elm chunks of every
+    program included during a request.
+
+    Proxies and CDNs that support it turn these headers into 103 Early Hints,
+    so browsers start fetching bundles before the HTML is parsed.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        includes = getattr(request, "djelm_includes", None)
+
+        if includes is None:
+            return response
+
+        links = [f"<{url}>; rel=modulepreload" for url in includes.preload_urls()]
+        if links:
+            if response.has_header("Link"):
+                links.insert(0, response["Link"])
+            response["Link"] = ", ".join(links)
+        return response
@@ -0,0 +1,262 @@
+import atexit
+import itertools
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import IO, Optional
+
+from djelm.manifest import MANIFEST_NAME
+
+PARCEL_HELPERS = f"""
+"use strict";
+const _core = require("@parcel/core");
+const crypto = require("crypto");
+const fs = require("fs");
+const path = require("path");
+
+const distDir = path.resolve("../static/dist");
+const manifestName = "{MANIFEST_NAME}";
+"""
+
+PARCEL_HELPERS += """
+function createBundler(options, workerFarm) {
+  return new _core.Parcel({
+    entries: options.entries,
+    defaultConfig: "@parcel/config-default",
+    mode: options.mode,
+    workerFarm,
+    defaultTargetOptions: {
+      distDir,
+      outputFormat: "esmodule",
+    },
+  });
+}
+
+// Maps each program entry to its file and the Elm chunks it dynamically imports.
+// Build entries are copied to a content-hashed file so they can be cached immutably.
+// Entries of current programs that were not rebuilt are kept from the previous manifest.
+function writeManifest(bundleGraph, bundles, hashEntries, programs) {
+  const manifestPath = path.join(distDir, manifestName);
+  const staticPath = (filePath) =>
+    ["dist", ...path.relative(distDir, filePath).split(path.sep)].join("/");
+  const previous = fs.existsSync(manifestPath)
+    ? JSON.parse(fs.readFileSync(manifestPath, "utf8"))
+    : {};
+  const manifest = Object.fromEntries(
+    Object.entries(previous).filter(([program]) => programs.includes(program))
+  );
+  for (const bundle of bundles) {
+    if (!bundle.needsStableName || bundle.type !== "js") continue;
+    let filePath = bundle.filePath;
+    if (hashEntries) {
+      const hash = crypto
+        .createHash("sha256")
+        .update(fs.readFileSync(filePath))
+        .digest("hex")
+        .slice(0, 8);
+      const { dir, name, ext } = path.parse(filePath);
+      filePath = path.join(dir, `${name}.${hash}${ext}`);
+      fs.copyFileSync(bundle.filePath, filePath);
+    }
+    manifest[staticPath(bundle.filePath)] = {
+      file: staticPath(filePath),
+      imports: bundleGraph
+        .getChildBundles(bundle)
+        .filter((child) => child.type === "js")
+        .map((child) => staticPath(child.filePath)),
+    };
+  }
+  for (const [program, entry] of Object.entries(previous)) {
+    const stale = entry.file !== program && entry.file !== manifest[program]?.file;
+    if (stale) fs.rmSync(path.join(distDir, "..", entry.file), { force: true });
+  }
+  fs.writeFileSync(manifestPath, JSON.stringify(manifest));
+}
+
+async function build(bundler, options) {
+  let { bundleGraph, buildTime } = await bundler.run();
+  let bundles = bundleGraph.getBundles();
+  writeManifest(bundleGraph, bundles, options.hashEntries, options.programs);
+  return `✨ Built ${bundles.length} bundles in ${buildTime}ms!\\n`;
+}
+
+function diagnostics(err) {
+  if (Array.isArray(err.diagnostics)) {
+    return err.diagnostics.map((d) => (d.message ? d.message : String(d)));
+  }
+  return [String(err.diagnostics ?? err)];
+}
+"""
+
+# Builds once with the JSON options passed as the first argument.
+COMPILE_PROGRAM = (
+    PARCEL_HELPERS
+    + """
+async function Main() {
+  const options = JSON.parse(process.argv[1]);
+  try {
+    console.log(await build(createBundler(options), options));
+  } catch (err) {
+    diagnostics(err).forEach((message) => console.error(message));
+    process.exit(1);
+  }
+}
+Main().then(() => process.exit()).catch((err) => {console.error(err); process.exit(1);});
+"""
+)
+
+# Prefixes the worker's replies on stdout, any other output is passed through.
+REPLY_PREFIX = "@@djelm-parcel@@ "
+
+# Seconds a build may take before the worker is considered hung
+BUILD_TIMEOUT = 600
+
+# Reads one JSON build request per stdin line and writes one prefixed JSON reply
+# per stdout line. Bundlers are kept between requests so rebuilds are incremental.
+WORKER_PROGRAM = (
+    PARCEL_HELPERS
+    + f"""
+const replyPrefix = "{REPLY_PREFIX}";
+"""
+    + """
+const readline = require("readline");
+
+console.log = console.error;
+
+const workerFarm = _core.createWorkerFarm();
+const bundlers = new Map();
+let queue = Promise.resolve();
+
+// Plugins and Parcel's workers can still write to stdout, start on a fresh line.
+function reply(message) {
+  process.stdout.write("\\n" + replyPrefix + JSON.stringify(message) + "\\n");
+}
+
+readline
+  .createInterface({ input: process.stdin })
+  .on("line", (line) => {
+    queue = queue.then(async () => {
+      const request = JSON.parse(line);
+      const key = JSON.stringify([request.entries, request.mode]);
+      if (!bundlers.has(key)) bundlers.set(key, createBundler(request, workerFarm));
+      try {
+        const message = await build(bundlers.get(key), request);
+        reply({ id: request.id, ok: true, message });
+      } catch (err) {
+        reply({ id: request.id, ok: false, message: diagnostics(err).join("\\n") });
+      }
+    });
+  })
+  .on("close", () => {
+    queue.then(() => workerFarm.end()).finally(() => process.exit());
+  });
+"""
+)
+
+
+class ParcelWorkerError(Exception):
+    pass
+
+
+def _read_replies(stdout: IO[str], replies: queue.Queue):
+    """Queue the worker's replies, passing any other output through to stderr."""
+    for line in stdout:
+        if line.startswith(REPLY_PREFIX):
+            try:
+                replies.put(json.loads(line[len(REPLY_PREFIX) :]))
+            except ValueError:
+                continue
+        elif line.strip():
+            sys.stderr.write(line)
+    # The worker exited
+    replies.put(None)
+
+
+@dataclass(slots=True)
+class ParcelWorker:
+    """
+    A long-lived Node process running Parcel builds for a djelm app.
+
+    The worker is started on the first build, restarted if it exits, and
+    stopped when the Python process exits. A build that takes longer than
+    timeout seconds kills the worker, the next build starts a fresh one.
+    """
+
+    cwd: str
+    timeout: float = BUILD_TIMEOUT
+    process: Optional[subprocess.Popen] = None
+    replies: queue.Queue = field(default_factory=queue.Queue)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    ids: itertools.count = field(default_factory=itertools.count)
+
+    def start(self):
+        self.process = subprocess.Popen(
+            ["node", "-e", WORKER_PROGRAM],
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        # Every process gets its own queue so replies from a killed worker can't leak
+        self.replies = queue.Queue()
+        threading.Thread(
+            target=_read_replies, args=(self.process.stdout, self.replies), daemon=True
+        ).start()
+        atexit.register(self.stop)
+
+    def stop(self, grace: float = 5):
+        process, self.process = self.process, None
+        atexit.unregister(self.stop)
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=grace)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+    def build(self, options: dict) -> dict:
+        """
+        Run a build and return the worker's {"ok": bool, "message": str} reply.
+        """
+        with self.lock:
+            for _ in range(2):
+                if self.process is None or self.process.poll() is not None:
+                    self.start()
+                process = self.process
+                assert process and process.stdin
+                request_id = next(self.ids)
+                try:
+                    process.stdin.write(json.dumps({**options, "id": request_id}))
+                    process.stdin.write("\n")
+                    process.stdin.flush()
+                    reply = self.wait_for_reply(request_id)
+                    if reply is not None:
+                        return reply
+                except OSError:
+                    pass
+                # The worker crashed, start a fresh one and retry once.
+                self.stop()
+            raise ParcelWorkerError("The Parcel build worker exited unexpectedly.")
+
+    def wait_for_reply(self, request_id: int) -> Optional[dict]:
+        """The reply to a request, None when the worker exited first."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                reply = self.replies.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.stop(grace=0)
+                raise ParcelWorkerError(
+                    f"The Parcel build did not finish within {self.timeout:g}s, "
+                    "the worker was stopped and will restart on the next build."
+                )
+            if reply is None or reply.get("id") == request_id:
+                return reply
@@ -0,0 +1,149 @@
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from djelm.utils import (
+    STUFF_NAMESPACE,
+    is_elm_entrypoint,
+    is_elm_file_string,
+    is_ts_file_string,
+    write_if_changed,
+)
+
+INDEX_NAME = "programs.json"
+
+# Generated model directories under src, they never hold programs
+GENERATED_DIRS = ("Models", os.path.join("Widgets", "Models"))
+
+
+def _indexed(rel_path: str) -> bool:
+    if not (is_elm_file_string(rel_path) or is_ts_file_string(rel_path)):
+        return False
+    parts = rel_path.split(os.path.sep)
+    if any(part.startswith(".") for part in parts):
+        return False
+    return not any(rel_path.startswith(d + os.path.sep) for d in GENERATED_DIRS)
+
+
+@dataclass(slots=True)
+class ProgramIndex:
+    """
+    A record of the Elm and TypeScript files in an app's src directory and
+    its nested namespaces.
+
+    Each file is stored as [mtime_ns, size, is_entrypoint] against its path
+    relative to src. Files are only re-read when their mtime or size changes.
+    """
+
+    src_dir: str
+    path: str
+    entries: dict[str, list] = field(default_factory=dict)
+    scanned: bool = False
+    dirty: bool = False
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+    @classmethod
+    def load(cls, src_dir: str, path: str) -> "ProgramIndex":
+        try:
+            with open(path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        if not isinstance(entries, dict):
+            entries = {}
+        return cls(src_dir, path, entries)
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            write_if_changed(self.path, json.dumps(self.entries, sort_keys=True))
+            self.dirty = False
+
+    def scan(self):
+        """Stat every indexed file, reading only new or changed Elm files."""
+        with self.lock:
+            seen = set()
+            for rel_path, stat in self._listing():
+                seen.add(rel_path)
+                self._refresh(rel_path, stat)
+            for rel_path in set(self.entries) - seen:
+                del self.entries[rel_path]
+                self.dirty = True
+            self.scanned = True
+
+    def update(self, path: str):
+        """Bring a single changed, added or deleted file up to date."""
+        rel_path = os.path.relpath(path, self.src_dir)
+        if rel_path.startswith(os.pardir) or not _indexed(rel_path):
+            return
+        with self.lock:
+            try:
+                self._refresh(rel_path, os.stat(path))
+            except FileNotFoundError:
+                if self.entries.pop(rel_path, None) is not None:
+                    self.dirty = True
+
+    def programs(self) -> list[str]:
+        """Paths, relative to src, of the Elm files that are program entrypoints."""
+        with self.lock:
+            return sorted(p for p, entry in self.entries.items() if entry[2])
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self.entries
+
+    def _listing(self) -> Iterator[tuple[str, os.stat_result]]:
+        rel_dirs = [""]
+        while rel_dirs:
+            rel_dir = rel_dirs.pop()
+            try:
+                it = os.scandir(os.path.join(self.src_dir, rel_dir))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with it:
+                for entry in it:
+                    rel_path = os.path.join(rel_dir, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and (
+                            rel_path not in GENERATED_DIRS
+                        ):
+                            rel_dirs.append(rel_path)
+                    elif _indexed(rel_path) and entry.is_file():
+                        yield rel_path, entry.stat()
+
+    def _refresh(self, rel_path: str, stat: os.stat_result):
+        entry = self.entries.get(rel_path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return
+        entrypoint = False
+        if is_elm_file_string(rel_path):
+            try:
+                with open(os.path.join(self.src_dir, rel_path)) as f:
+                    entrypoint = is_elm_entrypoint(f.read())
+            except (OSError, ValueError):
+                pass
+        self.entries[rel_path] = [stat.st_mtime_ns, stat.st_size, entrypoint]
+        self.dirty = True
+
+
+_INDEXES: dict[str, ProgramIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def program_index(src_path: str) -> ProgramIndex:
+    """
+    The program index of the djelm app whose static_src directory is src_path.
+
+    Loaded from elm-stuff once per process and shared by every command.
+    """
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(src_path)
+        if index is None:
+            index = ProgramIndex.load(
+                os.path.join(src_path, "src"),
+                os.path.join(src_path, *STUFF_NAMESPACE, INDEX_NAME),
+            )
+            _INDEXES[src_path] = index
+        return index
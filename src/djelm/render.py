@@ -0,0 +1,127 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.templatetags.static import static
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
+
+from djelm.manifest import program_file, program_imports
+from djelm.settings import settings_json
+
+# Precompiled equivalents of the djelm/program.html and djelm/include.html
+# templates, whitespace included, so both render paths give identical markup.
+PROGRAM_FORMAT = (
+    "\n<div\n"
+    '  data-{key}="{flags}"\n'
+    "  \n    \n  \n"
+    "  data-settings='{settings}'\n"
+    ">\n</div>\n"
+)
+INCLUDE_FORMAT = '\n<script type="module" src="{src}"></script>\n'
+PRELOAD_FORMAT = '\n<link rel="modulepreload" href="{href}">'
+INCLUDES_PLACEHOLDER = "<!-- djelm:includes -->"
+
+
+def render_program(key: str, flags: str, settings: Optional[dict] = None) -> SafeString:
+    """
+    Render a program container without going through the template engine.
+
+    Gives the same markup as the djelm/program.html inclusion template.
+    """
+    return mark_safe(
+        PROGRAM_FORMAT.format(
+            key=conditional_escape(key),
+            flags=conditional_escape(flags),
+            settings=settings_json(settings),
+        )
+    )
+
+
+def include_program(djelm_program: str, preload: bool = False) -> SafeString:
+    """
+    Render a program script tag without going through the template engine.
+
+    Gives the same markup as the djelm/include.html inclusion template, with
+    the entrypoint resolved through the build manifest. With preload, the
+    script tag is preceded by modulepreload links for the Elm chunks the
+    program imports.
+    """
+    preloads = (
+        "".join(
+            PRELOAD_FORMAT.format(href=conditional_escape(static(chunk)))
+            for chunk in program_imports(djelm_program)
+        )
+        if preload
+        else ""
+    )
+    return mark_safe(
+        preloads
+        + INCLUDE_FORMAT.format(
+            src=conditional_escape(static(program_file(djelm_program)))
+        )
+    )
+
+
+@dataclass(slots=True)
+class ProgramIncludes:
+    """
+    The programs included while rendering a request.
+
+    Programs map to whether their tags were already emitted in place. Once
+    deferred, tags are only emitted at the djelm_includes placeholder.
+    """
+
+    programs: dict[str, bool] = field(default_factory=dict)
+    deferred: bool = False
+
+    def add(self, djelm_program: str) -> SafeString:
+        if djelm_program in self.programs:
+            return SafeString("")
+
+        self.programs[djelm_program] = not self.deferred
+        if self.deferred:
+            return SafeString("")
+        return include_program(djelm_program, preload=True)
+
+    def preload_urls(self) -> list[str]:
+        """
+        The static URLs of every included program entry and its Elm chunks.
+        """
+        return [
+            static(path)
+            for djelm_program in self.programs
+            for path in [program_file(djelm_program), *program_imports(djelm_program)]
+        ]
+
+    def render(self) -> SafeString:
+        return mark_safe(
+            "".join(
+                include_program(djelm_program, preload=True)
+                for djelm_program, emitted in self.programs.items()
+                if not emitted
+            )
+        )
+
+
+def program_includes(context) -> ProgramIncludes:
+    """
+    The ProgramIncludes of the current request, or of the current template
+    render when the request is not in the template context.
+    """
+    request = context.get("request")
+    if request is None:
+        return context.render_context.dicts[0].setdefault(
+            "djelm_includes", ProgramIncludes()
+        )
+
+    if not hasattr(request, "djelm_includes"):
+        request.djelm_includes = ProgramIncludes()
+    return request.djelm_includes
+
+
+def include_program_once(context, djelm_program: str) -> SafeString:
+    """
+    Render a program script tag the first time a program is included in a
+    request, and nothing for later includes of the same program.
+    """
+    return program_includes(context).add(djelm_program)
@@ -1,17 +1,58 @@
-from dataclasses import dataclass, field
-from typing import Dict, Self, TypedDict, Union
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Self, Tuple, TypedDict, Union
 
 Name = TypedDict("Name", {"name": str})
 SingleTon = TypedDict("SingleTon", {"singleton": bool})
 
+DEFAULT_SETTINGS: Tuple = (("name", None), ("singleton", False))
 
-@dataclass(slots=True)
+
+@dataclass(frozen=True, slots=True)
 class ProgramSettings:
-    _settings: Dict = field(default_factory=lambda: {"name": None, "singleton": False})
+    """
+    An immutable, hashable set of program settings.
+
+    with_setting returns a new ProgramSettings so instances can be shared
+    and used as cache keys.
+    """
+
+    _settings: Tuple = DEFAULT_SETTINGS
 
     def with_setting(self, setting: Union[Name, SingleTon]) -> Self:
-        self._settings = self._settings | setting
-        return self
+        return type(self)(tuple((dict(self._settings) | setting).items()))
 
     def get_settings(self) -> dict:
-        return self._settings
+        return dict(self._settings)
+
+
+DEFAULT_SETTINGS_JSON = json.dumps(ProgramSettings().get_settings())
+
+
+# Only scalar settings are memoized, anything else is serialised on every call.
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=256)
+def _merged_settings_json(passed_settings: tuple) -> str:
+    # passed_settings holds (key, type, value) triples, the type keeps values
+    # that compare and hash equal such as 1, 1.0 and True apart.
+    return json.dumps(
+        ProgramSettings().get_settings()
+        | {key: value for key, _, value in passed_settings}
+    )
+
+
+def settings_json(settings: Optional[dict] = None) -> str:
+    """
+    The default settings merged with the given settings as a JSON string.
+    """
+    if not settings:
+        return DEFAULT_SETTINGS_JSON
+
+    if all(type(value) in _CACHEABLE_TYPES for value in settings.values()):
+        return _merged_settings_json(
+            tuple((key, type(value), value) for key, value in settings.items())
+        )
+    return json.dumps(ProgramSettings().get_settings() | settings)
@@ -1,20 +1,30 @@
 import asyncio
+import json
 import os
 import shutil
 import subprocess
 import sys
 import threading
-from dataclasses import dataclass
-from functools import lru_cache
-from itertools import filterfalse
-from typing import Coroutine, Iterable, cast
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, cast
 
-import aiofiles
 from django.conf import settings
 from typing_extensions import TypedDict
 from watchfiles import awatch
 
-from djelm.cookiecutter import CookieCutter
+from djelm.asset_imports import BUILD_CONFIG_FILES, asset_dependencies
+from djelm.compress import brotli, compress_assets, compression_report
+from djelm.cookiecutter import CookieCutter, TemplateCutter
+from djelm.elm_imports import import_graph
+from djelm.flag_pool import FlagPool
+from djelm.fingerprint import (
+    FINGERPRINTS_NAME,
+    fingerprint,
+    load_fingerprints,
+    save_fingerprints,
+)
 from djelm.forms.widgets.main import WIDGET_NAMES, WIDGET_NAMES_T
 from djelm.generators import (
     ModelBuilder,
@@ -28,6 +38,9 @@ from djelm.generators import (
     WidgetModelGenerator,
     entrypoint_cookie_cutter,
 )
+from djelm.manifest import clear_manifest_cache
+from djelm.parcel import COMPILE_PROGRAM, ParcelWorker, ParcelWorkerError
+from djelm.program_index import program_index
 from djelm.subprocess import SubProcess
 
 from .effect import ExitFailure, ExitSuccess
@@ -37,18 +50,16 @@ from .utils import (
     DJELM_VERSION,
     STUFF_ENTRYPOINTS,
     STUFF_NAMESPACE,
+    WriteStats,
     get_app_path,
     get_app_src_path,
-    is_djelm,
-    is_elm_entrypoint,
+    find_djelm_apps,
     is_elm_file_string,
-    is_ts_file_string,
     module_name,
     program_file,
     scope_name,
     supporting_ts_files,
     to_program_namespace,
-    walk_level,
     widget_scope_name,
 )
 from .validate import Validations
@@ -57,49 +68,64 @@ CreateCookieExtra = TypedDict("CreateCookieExtra", {"app_name": str})
 ParsedFile = TypedDict(
     "ParsedFile", {"base": str, "file": str, "supporting_ts_files": set[str]}
 )
+ModuleDeps = TypedDict(
+    "ModuleDeps",
+    {
+        "module": str,
+        "file": str,
+        "imports": list[str],
+        "imported_by": list[str],
+        "programs": list[str],
+    },
+)
+
+# Milliseconds watch waits for a burst of changes to settle before compiling
+WATCH_DEBOUNCE_MS = 200
+# Processes evaluating flag modules during watch
+WATCH_FLAG_WORKERS = 2
 
 
 class StrategyError(Exception):
     pass
 
 
-@lru_cache()
-def unsafe_find_programs(
-    src_path: str,
-) -> list[ParsedFile]:
-    """
-    Cached result of the FindPrograms._run_helper method.
-
-    WARNING: The list of returned programs may not be representative of the actual programs in the given src_path.
-    """
-    result = []
-    exception = None
-    done = threading.Event()
-
-    def wrapper():
-        nonlocal result, exception
-        try:
-            result = asyncio.run(FindProgramsStrategy(src_path)._run_helper(src_path))
-        except Exception as e:
-            exception = e
-        finally:
-            done.set()
-
-    thread = threading.Thread(target=wrapper)
-    thread.start()
-    done.wait()  # Wait for the thread to finish
-
-    if exception:
-        raise exception  # Re-raise any exception that occurred in the thread
+def program_namespace(src_path: str, program: ParsedFile) -> list[str]:
+    """The directories between src and a program, its Elm module namespace."""
+    rel_dir = os.path.relpath(program["base"], os.path.join(src_path, "src"))
+    return [] if rel_dir == os.curdir else rel_dir.split(os.path.sep)
 
-    parsed_file_results: list[ParsedFile] = []
 
-    if result:
-        for f in result:
-            if f.tag == "Success":
-                parsed_file_results.append(f.value)
+def find_programs(src_path: str, refresh: bool = True) -> list[ParsedFile]:
+    """
+    The Elm programs of the app whose static_src directory is src_path.
 
-    return parsed_file_results
+    refresh:
+        True = Stat the src directory for changes before answering
+        False = Trust the index, watch keeps it up to date from its events
+    """
+    index = program_index(src_path)
+    if refresh or not index.scanned:
+        index.scan()
+    index.save()
+
+    programs: list[ParsedFile] = []
+    for program in index.programs():
+        base, file = os.path.split(program)
+        program_name = os.path.splitext(file)[0]
+        programs.append(
+            ParsedFile(
+                {
+                    "base": os.path.join(index.src_dir, base).rstrip(os.path.sep),
+                    "file": file,
+                    "supporting_ts_files": {
+                        ts_file
+                        for ts_file in supporting_ts_files(program_name)
+                        if os.path.join(base, ts_file) in index
+                    },
+                }
+            )
+        )
+    return programs
 
 
 @dataclass(slots=True)
@@ -354,6 +380,10 @@ class CompileStrategy:
     build: bool = False
     raise_error: bool = True
     use_cache: bool = False
+    compress: bool = False
+    force: bool = False
+    worker: Optional[ParcelWorker] = None
+    output_prefix: str = ""
 
     def run(self, logger) -> ExitSuccess[None] | ExitFailure[None, StrategyError]:
         src_path = get_app_src_path(self.app_name)
@@ -367,26 +397,38 @@ class CompileStrategy:
 
             elm_files: list[ParsedFile] = []
 
-            if self.use_cache:
-                elm_files = unsafe_find_programs(src_path.value)
-            else:
-                unsafe_find_programs.cache_clear()
-                elm_files = unsafe_find_programs(src_path.value)
+            elm_files = find_programs(src_path.value, refresh=not self.use_cache)
 
-            cookiecutters: list[CookieCutter] = []
+            cookiecutters: list[TemplateCutter] = []
+            scopes: dict[str, str] = {}
 
             for elm_file in elm_files:
-                basedir = os.path.basename(elm_file["base"])
+                namespace = program_namespace(src_path.value, elm_file)
                 program_name = os.path.splitext(elm_file["file"])[0]
 
-                if basedir == "Widgets":
+                if namespace == ["Widgets"]:
+                    scope = widget_scope_name(self.app_name, program_name)
+                else:
+                    # Namespace segments are kept apart so Pages.AdminDashboard and
+                    # PagesAdmin.Dashboard don't share a scope
+                    scope = scope_name(
+                        self.app_name, "-".join([*namespace, program_name])
+                    )
+                module = ".".join([*namespace, module_name(program_name)])
+                if scope in scopes:
+                    raise StrategyError(
+                        f"The programs {scopes[scope]} and {module} share the view prefix {scope}, rename one of them."
+                    )
+                scopes[scope] = module
+
+                if namespace == ["Widgets"]:
                     cookiecutters.append(
                         entrypoint_cookie_cutter(
                             base_name="Widgets.",
                             base_path=f"Widgets{os.path.sep}",
                             src_path=src_path.value,
                             program_name=module_name(program_name),
-                            scope=widget_scope_name(self.app_name, program_name),
+                            scope=scope,
                             view_prefix="widget",
                             imports=self.compile_imports(
                                 elm_file["supporting_ts_files"], f"Widgets{os.path.sep}"
@@ -395,75 +437,170 @@ class CompileStrategy:
                         )
                     )
                 else:
+                    # Nested programs live in the Elm module namespace of their directory
+                    base_path = "".join(f"{d}{os.path.sep}" for d in namespace)
                     cookiecutters.append(
                         entrypoint_cookie_cutter(
-                            base_name="",
-                            base_path="",
+                            base_name="".join(f"{d}." for d in namespace),
+                            base_path=base_path,
                             src_path=src_path.value,
                             program_name=module_name(program_name),
-                            scope=scope_name(self.app_name, program_name),
+                            scope=scope,
                             view_prefix="",
                             imports=self.compile_imports(
-                                elm_file["supporting_ts_files"], ""
+                                elm_file["supporting_ts_files"], base_path
                             ),
                             extras=self.compile_extras(elm_file["supporting_ts_files"]),
                         )
                     )
 
+            stats = WriteStats()
             for cutter in cookiecutters:
+                cutter.stats = stats
                 cut = cutter.cut(logger)
 
                 if cut.tag == "Failure":
                     raise cut.err
+            logger.write(f"Entrypoints: {stats}")
 
-            try:
-                COMPILE_PROGRAM = f"""
-                "use strict";
-                const _core = require("@parcel/core");
-
-                let bundler = new _core.Parcel({{
-                  entries: "./{os.path.join(*STUFF_ENTRYPOINTS)}/*.ts",
-                  defaultConfig: "@parcel/config-default",
-                  mode: "{"production" if self.build else "development"}",
-                  defaultTargetOptions: {{
-                    distDir: "../static/dist",
-                    outputFormat: "esmodule",
-                  }},
-                }});
-
-                async function Main() {{
-                  try {{
-                    let {{ bundleGraph, buildTime }} = await bundler.run();
-                    let bundles = bundleGraph.getBundles();
-                    console.log(`✨ Built ${{bundles.length}} bundles in ${{buildTime}}ms!\n`);
-                  }} catch (err) {{
-                    if (Array.isArray(err.diagnostics)) {{
-                      err.diagnostics.forEach((d) => console.error(d.message ? d.message : d));
-                    }} else {{
-                      console.error(err.diagnostics);
-                    }}
-                    process.exit(1);
-                  }}
-                }}
-                Main().then(() => process.exit()).catch((err) => {{console.error(err); process.exit(1);}});
-                """
-                process = SubProcess(
-                    ["node", "-e", COMPILE_PROGRAM],
-                    os.path.join(src_path.value),
-                    self.raise_error,
+            fingerprints_path = os.path.join(
+                src_path.value, *STUFF_NAMESPACE, FINGERPRINTS_NAME
+            )
+            fingerprints = self.program_fingerprints(src_path.value, elm_files)
+            entries = self.changed_entrypoints(
+                src_path.value, fingerprints, load_fingerprints(fingerprints_path)
+            )
+            skipped = sorted(set(fingerprints) - set(entries))
+
+            if skipped:
+                logger.write(
+                    f"Skipped {len(skipped)} unchanged program(s): "
+                    + ", ".join(os.path.splitext(e)[0] for e in skipped)
                 )
-                try:
-                    process.open()
-                except Exception as err:
-                    if self.raise_error:
-                        raise err
-                    else:
+            if fingerprints and not entries:
+                return ExitSuccess(None)
+
+            options = {
+                "entries": entries
+                if entries and self.worker is None
+                else [f"./{os.path.join(*STUFF_ENTRYPOINTS)}/*.ts"],
+                "mode": "production" if self.build else "development",
+                "hashEntries": self.build,
+                "programs": [self.dist_program(e) for e in fingerprints],
+            }
+
+            try:
+                if self.worker is not None:
+                    try:
+                        result = self.worker.build(options)
+                    except ParcelWorkerError as err:
+                        if self.raise_error:
+                            raise StrategyError(str(err))
+                        logger.write(str(err))
+                        return ExitSuccess(None)
+                    logger.write(result["message"])
+                    if not result["ok"]:
+                        if self.raise_error:
+                            raise StrategyError(result["message"])
                         return ExitSuccess(None)
+                else:
+                    process = SubProcess(
+                        ["node", "-e", COMPILE_PROGRAM, json.dumps(options)],
+                        os.path.join(src_path.value),
+                        self.raise_error,
+                        prefix=self.output_prefix,
+                    )
+                    try:
+                        process.open()
+                    except Exception as err:
+                        if self.raise_error:
+                            raise err
+                        else:
+                            return ExitSuccess(None)
+                save_fingerprints(fingerprints_path, fingerprints)
+                # Renders in this process pick up the rewritten manifest
+                clear_manifest_cache()
+                if self.compress:
+                    self.compress_assets(src_path.value, logger)
                 return ExitSuccess(None)
             except subprocess.CalledProcessError:
                 sys.exit(1)
         return ExitFailure(None, StrategyError("Error"))
 
+    def program_fingerprints(
+        self, src_path: str, elm_files: list[ParsedFile]
+    ) -> dict[str, str]:
+        """
+        Fingerprint the inputs of every program by entrypoint file name.
+
+        Inputs are the program's Elm source and the local Elm modules it imports
+        transitively (generated Models included), its supporting .ts files and
+        the local scripts, stylesheets and assets they import transitively, the
+        generated entrypoint, elm.json, the npm manifest, lockfiles and build
+        config, and the build mode.
+
+        A program with an import that can't be followed gets an empty
+        fingerprint and is always compiled.
+        """
+        graph = import_graph(src_path, refresh=not self.use_cache)
+        fingerprints: dict[str, str] = {}
+
+        for elm_file in elm_files:
+            base_name = "".join(f"{d}." for d in program_namespace(src_path, elm_file))
+            program_name = module_name(os.path.splitext(elm_file["file"])[0])
+            entrypoint = f"{base_name}{program_name}.ts"
+            inputs = graph.dependencies(
+                os.path.normpath(os.path.join(elm_file["base"], elm_file["file"]))
+            )
+            assets = asset_dependencies(
+                os.path.join(elm_file["base"], f)
+                for f in elm_file["supporting_ts_files"]
+            )
+            if assets is None:
+                # An import we can't follow, leave the program to Parcel
+                fingerprints[entrypoint] = ""
+                continue
+            inputs |= assets
+            inputs |= {
+                os.path.join(src_path, "elm.json"),
+                os.path.join(src_path, *STUFF_ENTRYPOINTS, entrypoint),
+                *(os.path.join(src_path, f) for f in BUILD_CONFIG_FILES),
+            }
+            fingerprints[entrypoint] = fingerprint(
+                inputs, "production" if self.build else "development"
+            )
+        return fingerprints
+
+    def changed_entrypoints(
+        self,
+        src_path: str,
+        fingerprints: dict[str, str],
+        previous: dict[str, str],
+    ) -> list[str]:
+        """
+        The entrypoints whose fingerprint changed or whose bundle is missing.
+        """
+        dist_dir = os.path.join(src_path, "..", "static")
+        return [
+            f"./{os.path.join(*STUFF_ENTRYPOINTS, entrypoint)}"
+            for entrypoint, value in fingerprints.items()
+            if self.force
+            or not value
+            or previous.get(entrypoint) != value
+            or not os.path.isfile(
+                os.path.join(dist_dir, *self.dist_program(entrypoint).split("/"))
+            )
+        ]
+
+    def dist_program(self, entrypoint: str) -> str:
+        return f"dist/{os.path.splitext(entrypoint)[0]}.js"
+
+    def compress_assets(self, src_path: str, logger):
+        assets = compress_assets(os.path.join(src_path, "..", "static", "dist"))
+        logger.write(compression_report(assets))
+        if brotli is None:
+            logger.write("Install the brotli package to also write .br assets.")
+
     def compile_imports(self, files: set[str], base_path: str) -> list[str]:
         imports = []
         for file in files:
@@ -483,6 +620,147 @@ class CompileStrategy:
         return extras
 
 
+@dataclass(slots=True)
+class PrefixedLogger:
+    """
+    Prefixes every line written to a logger shared between threads.
+    """
+
+    logger: Any
+    prefix: str
+    lock: threading.Lock
+
+    def write(self, msg: str):
+        with self.lock:
+            self.logger.write(
+                "\n".join(f"{self.prefix}{line}" for line in msg.splitlines())
+            )
+
+
+@dataclass(slots=True)
+class CompileAllStrategy:
+    """
+    Compiles the elm programs of every djelm app concurrently.
+    """
+
+    build: bool = False
+    compress: bool = False
+    force: bool = False
+    jobs: Optional[int] = None
+    apps: list[str] = field(default_factory=lambda: list(settings.INSTALLED_APPS))
+
+    def run(self, logger) -> ExitSuccess[list[str]] | ExitFailure[None, StrategyError]:
+        app_names = find_djelm_apps(self.apps)
+        if not app_names:
+            logger.write("No djelm apps found.")
+            return ExitSuccess([])
+
+        lock = threading.Lock()
+        width = max(len(app_name) for app_name in app_names)
+
+        def compile_app(app_name: str) -> tuple[str, bool, float]:
+            prefix = f"[{app_name:<{width}}] "
+            app_logger = PrefixedLogger(logger, prefix, lock)
+            start = time.perf_counter()
+            try:
+                result = CompileStrategy(
+                    app_name,
+                    self.build,
+                    compress=self.compress,
+                    force=self.force,
+                    output_prefix=prefix,
+                ).run(app_logger)
+                ok = result.tag == "Success"
+            except (Exception, SystemExit) as err:
+                app_logger.write(str(err) or type(err).__name__)
+                ok = False
+            return app_name, ok, time.perf_counter() - start
+
+        workers = (
+            self.jobs
+            if self.jobs is not None
+            else min(len(app_names), os.cpu_count() or 1)
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(compile_app, app_names))
+
+        logger.write("\nCompile summary:")
+        for app_name, ok, seconds in results:
+            status = "\033[92mok\033[0m" if ok else "\033[91mfailed\033[0m"
+            logger.write(f"  {app_name:<{width}}  {status}  {seconds:.2f}s")
+
+        failed = [app_name for app_name, ok, _ in results if not ok]
+        if failed:
+            sys.exit(1)
+        return ExitSuccess(app_names)
+
+
+@dataclass(slots=True)
+class DepsStrategy:
+    """
+    Show an Elm module's local imports, the modules importing it and the
+    programs that are rebuilt when it changes.
+    """
+
+    app_name: str
+    module: str
+
+    def run(self, logger) -> ExitSuccess[ModuleDeps] | ExitFailure[None, StrategyError]:
+        src_path = get_app_src_path(self.app_name)
+
+        if src_path.tag != "Success":
+            raise src_path.err
+
+        graph = import_graph(src_path.value)
+        path = graph.module(self.module)
+
+        if path is None:
+            logger.write(
+                f"""
+\033[91m-- MODULE NOT FOUND --------------------------------------------------- command/deps\033[0m
+
+I was looking for this Elm module:
+
+    \033[93m{self.module}\033[0m
+
+But I couldn't find it in the source-directories of \033[1m{self.app_name}\033[0m.
+"""
+            )
+            raise StrategyError(
+                f"Module {self.module} not found in the source-directories of {self.app_name}"
+            )
+
+        programs = {
+            os.path.normpath(os.path.join(p["base"], p["file"]))
+            for p in find_programs(src_path.value)
+        }
+
+        def names(paths: Iterable[str]) -> list[str]:
+            return sorted(graph.module_name(p) or p for p in paths)
+
+        deps = ModuleDeps(
+            {
+                "module": self.module,
+                "file": path,
+                "imports": names(graph.imports(path)),
+                "imported_by": names(graph.importers().get(path, set())),
+                "programs": names(graph.dependents({path}) & programs),
+            }
+        )
+
+        logger.write(f"\033[1m{self.module}\033[0m {path}\n")
+        for title, key in [
+            ("Imports", "imports"),
+            ("Imported by", "imported_by"),
+            ("Programs affected by a change", "programs"),
+        ]:
+            logger.write(f"{title}:")
+            for name in deps[key] or ["(none)"]:
+                logger.write(f"    {name}")
+            logger.write("")
+        return ExitSuccess(deps)
+
+
 @dataclass(slots=True)
 class ElmStrategy:
     """
@@ -525,108 +803,16 @@ class FindProgramsStrategy:
         if not os.path.isdir(os.path.join(src_path.value, "src")):
             logger.write("No programs found.")
             return ExitSuccess([])
-        parsed_file_results = []
-
-        parsed_file_results = asyncio.run(self._run_helper(src_path.value))
+        programs = find_programs(src_path.value)
 
-        succeeded_files: list[ParsedFile] = []
-
-        if parsed_file_results:
+        if programs:
             logger.write("I found the following programs:\n")
-            for f in parsed_file_results:
-                if f.tag == "Success":
-                    succeeded_files.append(f.value)
-                    if f.value["file"].endswith(".elm"):
-                        logger.write(f"""    \033[1mbase:\033[0m {f.value["base"]}""")
-                        logger.write(f"""    \033[1mfile:\033[0m {f.value["file"]}""")
-                        logger.write("\n")
-                else:
-                    logger.write(str(f.err))
-
-        return ExitSuccess(succeeded_files)
-
-    async def _run_helper(self, src_path: str):
-        programs_base_dir = os.path.join(src_path, "src")
-        ## Organized by directory to files in that directory
-        ts_files_lookup: dict[str, list[str]] = {}
-        dir_data_src: Iterable[tuple[str, list[str], list[str]]] = walk_level(
-            programs_base_dir
-        )
-        base_src, dirs_src, files_src = next(dir_data_src)
-        ts_files_lookup[base_src] = []
-        elm_files_widgets: list[tuple[str, list[str]]] = []
+            for program in programs:
+                logger.write(f"""    \033[1mbase:\033[0m {program["base"]}""")
+                logger.write(f"""    \033[1mfile:\033[0m {program["file"]}""")
+                logger.write("\n")
 
-        if "Widgets" in dirs_src:
-            dir_data_widgets: Iterable[tuple[str, list[str], list[str]]] = walk_level(
-                os.path.join(base_src, "Widgets")
-            )
-            base_widget_src, _, widget_file_src = next(dir_data_widgets)
-            ts_files_lookup[base_widget_src] = []
-            widget_files = []
-            for f in widget_file_src:
-                if is_elm_file_string(f):
-                    widget_files.append(f)
-                if is_ts_file_string(f):
-                    ts_files_lookup[base_widget_src].append(f)
-            elm_files_widgets.append((base_widget_src, widget_files))
-
-        elm_files: list[str] = []
-        for f in files_src:
-            if is_elm_file_string(f):
-                elm_files.append(f)
-            if is_ts_file_string(f):
-                ts_files_lookup[base_src].append(f)
-
-        return await self.__parsed_files(
-            [(base_src, elm_files), *elm_files_widgets], ts_files_lookup
-        )
-
-    async def __parsed_files(
-        self,
-        elm_file_data: list[tuple[str, list[str]]],
-        ts_files_lookup: dict[str, list[str]],
-    ):
-        coroutines: list[
-            Coroutine[
-                None, None, ExitSuccess[ParsedFile] | ExitFailure[None, Exception]
-            ]
-        ] = []
-        for base_path, files in elm_file_data:
-            coroutine = [
-                self.__parse_file(base_path, file, ts_files_lookup) for file in files
-            ]
-            coroutines.extend(coroutine)
-
-        return await asyncio.gather(*coroutines)
-
-    async def __parse_file(
-        self, base_dir: str, file: str, ts_files_lookup: dict[str, list[str]]
-    ) -> ExitSuccess[ParsedFile] | ExitFailure[None, Exception]:
-        try:
-            handle = await aiofiles.open(os.path.join(base_dir, file))
-            content = await handle.read()
-            await handle.close()
-            if is_elm_entrypoint(content):
-                program_name = os.path.splitext(file)[0]
-                supporting_files = supporting_ts_files(program_name)
-                ts_files = ts_files_lookup.get(base_dir, [])
-                ret: ParsedFile = ParsedFile(
-                    {
-                        "base": base_dir,
-                        "file": file,
-                        "supporting_ts_files": (
-                            set(supporting_files).intersection(set(ts_files))
-                        ),
-                    }
-                )
-                return ExitSuccess(ret)
-            else:
-                return ExitFailure(
-                    None, Exception("'main : Program Value Model Msg' not found")
-                )
-
-        except Exception as err:
-            return ExitFailure(None, err)
+        return ExitSuccess(programs)
 
 
 class GenerateModelStrategy:
@@ -639,12 +825,24 @@ class GenerateModelStrategy:
         handler: ModelBuilder,
         from_source: bool,
         watch_mode: bool,
+        stats: Optional[WriteStats] = None,
+        model_hashes: Optional[dict[str, str]] = None,
+        flag_pool: Optional[FlagPool] = None,
     ) -> None:
+        """
+        stats: Shared write counts, the caller logs them when given
+        model_hashes: Hashes of previously generated models, a model whose flags
+            produce the same Elm is not generated again
+        flag_pool: Evaluate the flags module in a worker process instead of this one
+        """
         self.app_name = app_name
         self.prog_name = prog_name
         self.handler = handler
         self.from_source = from_source
         self.watch_mode = watch_mode
+        self.stats = stats
+        self.model_hashes = model_hashes
+        self.flag_pool = flag_pool
 
     def run(self, logger) -> ExitSuccess[None] | ExitFailure[None, StrategyError]:
         app_path = get_app_path(self.app_name)
@@ -656,13 +854,33 @@ class GenerateModelStrategy:
         if src_path.tag != "Success":
             return ExitFailure(meta=None, err=StrategyError(src_path.err))
 
-        flags_effect = handler.load_flags(
-            app_path.value, self.prog_name, self.from_source, self.watch_mode, logger
-        )
+        if self.flag_pool is not None and self.from_source:
+            flags_effect = self.flag_pool.load_flags(
+                handler, app_path.value, self.prog_name, self.watch_mode, logger
+            )
+        else:
+            flags_effect = handler.load_flags(
+                app_path.value,
+                self.prog_name,
+                self.from_source,
+                self.watch_mode,
+                logger,
+            )
 
         if flags_effect.tag != "Success":
             return ExitFailure(meta=None, err=StrategyError(flags_effect.err))
 
+        model_key = f"{type(handler).__name__}:{self.prog_name}"
+        model_hash = None
+        if self.model_hashes is not None:
+            parser_data = flags_effect.value.to_elm_parser_data()
+            model_hash = fingerprint(
+                (), parser_data["alias_type"], parser_data["decoder_body"]
+            )
+            if self.model_hashes.get(model_key) == model_hash:
+                logger.write(f"Model unchanged: {self.prog_name}")
+                return ExitSuccess(None)
+
         try:
             os.makedirs(os.path.join(src_path.value, *STUFF_NAMESPACE))
         except FileExistsError:
@@ -670,19 +888,26 @@ class GenerateModelStrategy:
         except FileNotFoundError as err:
             return ExitFailure(meta=None, err=StrategyError(err))
         cookies = handler.cookie_cutters(
-            flags_effect.value,
+            flags_effect.value,  # type:ignore
             self.app_name,
             self.prog_name,
             app_path.value,
             src_path.value,
         )
+        stats = self.stats if self.stats is not None else WriteStats()
         try:
             for cookie in cookies:
+                if isinstance(cookie, TemplateCutter):
+                    cookie.stats = stats
                 cookie_effect = cookie.cut(logger)
 
                 if cookie_effect.tag != "Success":
                     return ExitFailure(meta=None, err=StrategyError(cookie_effect.err))
 
+            if self.stats is None:
+                logger.write(f"Models: {stats}")
+            if self.model_hashes is not None and model_hash is not None:
+                self.model_hashes[model_key] = model_hash
             return ExitSuccess(None)
         except OSError as err:
             return ExitFailure(meta=None, err=StrategyError(err))
@@ -690,9 +915,15 @@ class GenerateModelStrategy:
 
 @dataclass(slots=True)
 class GenerateModelsStrategy:
-    """Generate model and decoder for all djelm elm programs"""
+    """
+    Generate model and decoder for all djelm elm programs.
+
+    Flag modules are evaluated by up to `jobs` worker processes, models are
+    written and logged in program order.
+    """
 
     app_name: str
+    jobs: Optional[int] = None
 
     def run(self, logger) -> ExitSuccess[None] | ExitFailure[None, StrategyError]:
         app_path = get_app_path(self.app_name)
@@ -703,24 +934,66 @@ class GenerateModelsStrategy:
         if src_path.tag != "Success":
             raise src_path.err
 
-        unsafe_find_programs.cache_clear()
-        all_programs = unsafe_find_programs(src_path.value)
+        all_programs = find_programs(src_path.value)
+        stats = WriteStats()
 
-        for program in all_programs:
-            baseDir = os.path.basename(program["base"])
+        programs: list[tuple[str, ModelBuilder]] = []
+        for program in sorted(all_programs, key=lambda p: (p["base"], p["file"])):
+            namespace = program_namespace(src_path.value, program)
             program_name = os.path.splitext(program["file"])[0]
-            generator = ModelGenerator()
-            if baseDir == "Widgets":
-                generator = program_namespace_to_model_builder([baseDir, program_name])
-
-            GenerateModelStrategy(
-                self.app_name,
-                program_name,
-                generator,
-                from_source=True,
-                watch_mode=False,
-            ).run(logger)
+            generator: ModelBuilder = ModelGenerator()
+            if namespace == ["Widgets"]:
+                generator = program_namespace_to_model_builder(
+                    [*namespace, program_name]
+                )
+            elif namespace:
+                # Models are generated from the flags directory for top level and widget programs only
+                continue
+            programs.append((program_name, generator))
 
+        flag_pool = FlagPool(max_workers=self.jobs)
+        results: list[tuple[str, bool, float]] = []
+        try:
+            # Flag modules evaluate in parallel, models are written in program order
+            for program_name, generator in programs:
+                flag_pool.prefetch(generator, app_path.value, program_name)
+            for program_name, generator in programs:
+                generate = GenerateModelStrategy(
+                    self.app_name,
+                    program_name,
+                    generator,
+                    from_source=True,
+                    watch_mode=False,
+                    stats=stats,
+                    flag_pool=flag_pool,
+                )
+                # Time spent queued behind other programs is not the program's
+                flag_pool.wait(generator, app_path.value, program_name)
+                start = time.perf_counter()
+                result = generate.run(logger)
+                results.append(
+                    (
+                        program_name,
+                        result.tag == "Success",
+                        flag_pool.timings.get(program_name, 0.0)
+                        + time.perf_counter()
+                        - start,
+                    )
+                )
+        finally:
+            flag_pool.shutdown()
+
+        if results:
+            width = max(len(program_name) for program_name, _, _ in results)
+            logger.write("\nGenerate summary:")
+            for program_name, ok, seconds in results:
+                status = "\033[92mok\033[0m" if ok else "\033[91mfailed\033[0m"
+                logger.write(f"  {program_name:<{width}}  {status}  {seconds:.2f}s")
+        logger.write(f"Models: {stats}")
+
+        failed = [program_name for program_name, ok, _ in results if not ok]
+        if failed:
+            raise StrategyError(f"Models failed to generate for: {', '.join(failed)}")
         return ExitSuccess(None)
 
 
@@ -728,16 +1001,7 @@ class ListStrategy:
     apps: list[str] = settings.INSTALLED_APPS
 
     def run(self, logger) -> ExitSuccess[list[str]] | ExitFailure[None, StrategyError]:
-        app_path_exits = filterfalse(
-            lambda x: x.tag == "Failure", map(get_app_path, self.apps)
-        )
-
-        dir_data: Iterable[tuple[str, list[str], list[str]]] = map(
-            next,
-            map(lambda p: walk_level(p.value), app_path_exits),  # type:ignore
-        )
-
-        django_elm_apps = [os.path.basename(r) for r, _, f in dir_data if is_djelm(f)]
+        django_elm_apps = find_djelm_apps(self.apps)
 
         apps = ""
 
@@ -829,12 +1093,20 @@ class WatchStrategy:
     When changes occur it will re-compile the elm programs.
 
     Modules in the flags directory are also monitored and models generated.
+    A model is only rewritten when its generated Elm differs from the last one,
+    and the watcher's own model writes do not trigger a second compile.
+
+    Changes are coalesced over the debounce window (milliseconds) and at most one
+    compile runs at a time. Changes arriving mid-compile queue a single follow-up compile.
     """
 
     app_name: str
+    debounce: int = WATCH_DEBOUNCE_MS
+    model_hashes: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    own_writes: set[str] = field(default_factory=set, init=False, repr=False)
+    flag_pool: Optional[FlagPool] = field(default=None, init=False, repr=False)
 
     def run(self, logger) -> ExitSuccess[None] | ExitFailure[None, StrategyError]:
-        compile = CompileStrategy(self.app_name, raise_error=False, use_cache=True)
         src_path = get_app_src_path(self.app_name)
         app_path = get_app_path(self.app_name)
 
@@ -844,6 +1116,14 @@ class WatchStrategy:
         if app_path.tag != "Success":
             raise app_path.err
 
+        # One Parcel process serves every recompile during the watch
+        worker = ParcelWorker(src_path.value)
+        self.flag_pool = FlagPool(max_workers=WATCH_FLAG_WORKERS)
+        # Watch compiles always run, the warm Parcel worker decides what to rebuild
+        compile = CompileStrategy(
+            self.app_name, raise_error=False, use_cache=True, force=True, worker=worker
+        )
+
         shutil.rmtree(os.path.join(src_path.value, ".parcel-cache"), ignore_errors=True)
         try:
             # first pass compile on start of watch
@@ -857,10 +1137,14 @@ class WatchStrategy:
                         os.path.join(app_path.value, "flags"),
                     ],
                     logger,
+                    compile,
                 )
             )
         except KeyboardInterrupt:
             return ExitSuccess(None)
+        finally:
+            worker.stop()
+            self.flag_pool.shutdown()
 
     async def watch(
         self,
@@ -868,58 +1152,325 @@ class WatchStrategy:
         src_path: str,
         dir: list[str],
         logger,
+        compile: Optional[CompileStrategy] = None,
     ):
-        compile = CompileStrategy(self.app_name, raise_error=False, use_cache=True)
-        async for changes in awatch(*dir):
-            for change, f in changes:
-                # VIM creates a file to check it can create a file, we want to ignore it
-                if f.endswith("4913"):
-                    continue
-                # If flags change generate models
-                # TODO Don't generate a model when a flags module is deleted
-                # TODO Only generate a model when the flags output is different to what has already been generated.
-                # TODO Validate if it's an actual flag file and not some other python file
-                if os.path.join(app_path, "flags") in f and f.endswith(".py"):
-                    dirname = os.path.basename(os.path.dirname(f))
-                    target_dirs = ["widgets", "flags"]
-                    # bail early
-                    if dirname not in target_dirs:
-                        continue
-                    filename = os.path.splitext(os.path.basename(f))[0]
-                    namespace = ["src"]
-                    generator: ModelBuilder = ModelGenerator()
-                    if "widgets" == dirname:
-                        namespace.append("Widgets")
-                        generator = WidgetModelGenerator()
-                    program_name = program_file(filename)
-                    # TODO validate if program is an actual Elm program and not some other Elm file
-                    is_program = os.path.isfile(
-                        os.path.join(src_path, *namespace, program_name)
-                    )
-                    if is_program:
-                        logger.write(f"FLAGS CHANGED: {f}")
-                        GenerateModelStrategy(
-                            self.app_name,
-                            module_name(filename),
-                            generator,
-                            from_source=True,
-                            watch_mode=True,
-                        ).run(logger)
-                    continue
-                # VIM for some reason triggers an ADDED(2) event when saving a buffer
-                if change == 1:
-                    logger.write(f"FILE ADDED: {f}")
-                    # recompile
-                    comp = asyncio.to_thread(compile.run, logger)
-                    await comp
-                if change == 2:
-                    logger.write(f"FILE MODIFIED: {f}")
-                    # recompile
-                    comp = asyncio.to_thread(compile.run, logger)
-                    await comp
+        if compile is None:
+            compile = CompileStrategy(
+                self.app_name, raise_error=False, use_cache=True, force=True
+            )
+        rebuild = RebuildQueue(compile, logger, self.debounce)
+        try:
+            async for changes in awatch(*dir, debounce=max(self.debounce, 50)):
+                changed = [
+                    f
+                    for change, f in changes
+                    if self.handle_change(change, f, app_path, src_path, logger)
+                ]
+                if changed and self.needs_compile(src_path, changed, logger):
+                    rebuild.request(changed)
+        finally:
+            await rebuild.close()
+
+        return ExitSuccess(None)
+
+    def handle_change(
+        self, change, f: str, app_path: str, src_path: str, logger
+    ) -> bool:
+        """Log a watched change, generating models for flags. True when it needs a compile."""
+        # VIM creates a file to check it can create a file, we want to ignore it
+        if f.endswith("4913"):
+            return False
+        # Temporary files from our own atomic writes
+        if os.path.basename(f).startswith(".djelm-"):
+            return False
+        f = os.path.normpath(f)
+        # Compiles during watch trust the program index and import graph, keep them current
+        program_index(src_path).update(f)
+        import_graph(src_path, refresh=False).update(f)
+        # Models we just wrote are already queued for a compile
+        if f in self.own_writes:
+            self.own_writes.discard(f)
+            return False
+        # If flags change generate models
+        # TODO Don't generate a model when a flags module is deleted
+        # TODO Validate if it's an actual flag file and not some other python file
+        if os.path.join(app_path, "flags") in f and f.endswith(".py"):
+            dirname = os.path.basename(os.path.dirname(f))
+            target_dirs = ["widgets", "flags"]
+            # bail early
+            if dirname not in target_dirs:
+                return False
+            filename = os.path.splitext(os.path.basename(f))[0]
+            namespace = ["src"]
+            generator: ModelBuilder = ModelGenerator()
+            if "widgets" == dirname:
+                namespace.append("Widgets")
+                generator = WidgetModelGenerator()
+            program_name = program_file(filename)
+            # TODO validate if program is an actual Elm program and not some other Elm file
+            is_program = os.path.isfile(
+                os.path.join(src_path, *namespace, program_name)
+            )
+            if not is_program:
+                return False
+            logger.write(f"FLAGS CHANGED: {f}")
+            stats = WriteStats()
+            GenerateModelStrategy(
+                self.app_name,
+                module_name(filename),
+                generator,
+                from_source=True,
+                watch_mode=True,
+                stats=stats,
+                model_hashes=self.model_hashes,
+                flag_pool=self.flag_pool,
+            ).run(logger)
+            if not stats.written:
+                return False
+            logger.write(f"Models: {stats}")
+            self.own_writes.update(
+                os.path.normpath(detail["path"])
+                for detail in generator.file_type_details(
+                    module_name(filename), app_path
+                )
+            )
+            return True
+        # VIM for some reason triggers an ADDED(2) event when saving a buffer
+        if change == 1:
+            logger.write(f"FILE ADDED: {f}")
+            return True
+        if change == 2:
+            logger.write(f"FILE MODIFIED: {f}")
+            return True
+        return False
+
+    def needs_compile(self, src_path: str, files: list[str], logger) -> bool:
+        """
+        Whether changed files reach a program, Elm modules that no program
+        imports, directly or transitively, don't need a compile.
+        """
+        elm_files = {f for f in files if is_elm_file_string(f)}
+        if len(elm_files) < len(files):
+            return True
+        graph = import_graph(src_path, refresh=False)
+        programs = {
+            os.path.normpath(os.path.join(p["base"], p["file"]))
+            for p in find_programs(src_path, refresh=False)
+        }
+        affected = graph.dependents(elm_files) & programs
+        if not affected:
+            logger.write("No programs import the changed modules, skipping compile.")
+            return False
+        logger.write(
+            "Affected programs: "
+            + ", ".join(sorted(graph.module_name(p) or p for p in affected))
+        )
+        return True
+
+
+@dataclass(slots=True)
+class WatchedApp:
+    strategy: WatchStrategy
+    app_path: str
+    src_path: str
+    compile: CompileStrategy
+    logger: PrefixedLogger
+
+    def owns(self, f: str) -> bool:
+        return f.startswith(self.app_path + os.sep)
+
+
+@dataclass(slots=True)
+class WatchAllStrategy:
+    """
+    Watches every djelm app with a single file watcher.
+
+    Changes are routed to the app that owns them, each app keeps its own
+    single-flight rebuild queue and at most `jobs` apps compile at a time.
+    """
+
+    debounce: int = WATCH_DEBOUNCE_MS
+    jobs: Optional[int] = None
+    apps: list[str] = field(default_factory=lambda: list(settings.INSTALLED_APPS))
+
+    def run(self, logger) -> ExitSuccess[list[str]] | ExitFailure[None, StrategyError]:
+        app_names = find_djelm_apps(self.apps)
+        if not app_names:
+            logger.write("No djelm apps found.")
+            return ExitSuccess([])
+
+        lock = threading.Lock()
+        width = max(len(app_name) for app_name in app_names)
+        watched: list[WatchedApp] = []
+        for app_name in app_names:
+            src_path = get_app_src_path(app_name)
+            app_path = get_app_path(app_name)
+
+            if src_path.tag != "Success":
+                raise src_path.err
+            if app_path.tag != "Success":
+                raise app_path.err
+
+            prefix = f"[{app_name:<{width}}] "
+            watched.append(
+                WatchedApp(
+                    WatchStrategy(app_name, self.debounce),
+                    app_path.value,
+                    src_path.value,
+                    CompileStrategy(
+                        app_name,
+                        raise_error=False,
+                        use_cache=True,
+                        force=True,
+                        # Parcel resolves from each app's node_modules, so every app gets its own worker
+                        worker=ParcelWorker(src_path.value),
+                        output_prefix=prefix,
+                    ),
+                    PrefixedLogger(logger, prefix, lock),
+                )
+            )
+            shutil.rmtree(
+                os.path.join(src_path.value, ".parcel-cache"), ignore_errors=True
+            )
+
+        flag_pool = FlagPool(max_workers=WATCH_FLAG_WORKERS)
+        for app in watched:
+            app.strategy.flag_pool = flag_pool
+        workers = (
+            self.jobs
+            if self.jobs is not None
+            else min(len(app_names), os.cpu_count() or 1)
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # first pass compile on start of watch
+                list(pool.map(lambda app: app.compile.run(app.logger), watched))
+                asyncio.run(self.watch(watched, logger, pool))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for app in watched:
+                if app.compile.worker is not None:
+                    app.compile.worker.stop()
+            flag_pool.shutdown()
+        return ExitSuccess(app_names)
+
+    async def watch(
+        self,
+        watched: list[WatchedApp],
+        logger,
+        pool: Optional[ThreadPoolExecutor] = None,
+    ):
+        queues = {
+            app.strategy.app_name: RebuildQueue(
+                app.compile, app.logger, self.debounce, pool
+            )
+            for app in watched
+        }
+        # Deepest app path first so nested apps own their changes
+        owners = sorted(watched, key=lambda app: len(app.app_path), reverse=True)
+        dirs = [
+            d
+            for app in watched
+            for d in (
+                os.path.join(app.src_path, "src"),
+                os.path.join(app.app_path, "flags"),
+            )
+            if os.path.isdir(d)
+        ]
+        logger.write(f"Watching {len(watched)} djelm apps")
+        try:
+            async for changes in awatch(*dirs, debounce=max(self.debounce, 50)):
+                for app_name, files in self.route(changes, owners).items():
+                    queues[app_name].request(files)
+        finally:
+            for queue in queues.values():
+                await queue.close()
 
         return ExitSuccess(None)
 
+    def route(
+        self, changes: Iterable[tuple[Any, str]], owners: list[WatchedApp]
+    ) -> dict[str, list[str]]:
+        """Hand each change to its app, returning the files that need a compile per app."""
+        changed: dict[str, list[str]] = {}
+        for change, f in changes:
+            app = next((app for app in owners if app.owns(f)), None)
+            if app is None:
+                continue
+            if app.strategy.handle_change(
+                change, f, app.app_path, app.src_path, app.logger
+            ):
+                changed.setdefault(app.strategy.app_name, []).append(f)
+        for app in owners:
+            files = changed.get(app.strategy.app_name)
+            if files and not app.strategy.needs_compile(
+                app.src_path, files, app.logger
+            ):
+                del changed[app.strategy.app_name]
+        return changed
+
+
+class RebuildQueue:
+    """
+    Runs watch compiles one at a time.
+
+    Requests made while a compile is in flight mark it stale, the requests are
+    coalesced and a single follow-up compile runs once the current one finishes.
+    """
+
+    def __init__(
+        self,
+        compile: CompileStrategy,
+        logger,
+        debounce: int,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        self.compile = compile
+        self.logger = logger
+        self.debounce = debounce
+        self.executor = executor
+        self.pending: list[str] = []
+        self.stale = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def request(self, files: list[str]):
+        self.pending.extend(files)
+        self.stale.set()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.loop())
+
+    async def loop(self):
+        while self.stale.is_set():
+            # Let the rest of a burst land before building
+            await asyncio.sleep(self.debounce / 1000)
+            self.stale.clear()
+            files, self.pending = self.pending, []
+            start = time.perf_counter()
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.compile.run, self.logger
+            )
+            elapsed = time.perf_counter() - start
+            follow_up = (
+                " (changes during build, rebuilding)" if self.stale.is_set() else ""
+            )
+            self.logger.write(
+                f"REBUILT {len(set(files))} changed file(s) in {elapsed:.2f}s{follow_up}"
+            )
+
+    async def wait(self):
+        """Wait for the in flight and any follow-up compile to finish."""
+        if self.task is not None:
+            await self.task
+
+    async def close(self):
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
 
 @dataclass(slots=True)
 class Strategy:
@@ -930,7 +1481,9 @@ class Strategy:
         | AddProgramHandlersStrategy
         | AddWidgetStrategy
         | CreateStrategy
+        | CompileAllStrategy
         | CompileStrategy
+        | DepsStrategy
         | ElmStrategy
         | FindProgramsStrategy
         | GenerateModelStrategy
@@ -939,8 +1492,32 @@ class Strategy:
         | ListWidgetsStrategy
         | NpmStrategy
         | RemoveProgramStrategy
+        | WatchAllStrategy
         | WatchStrategy
     ):
+        if options.get("all") and labels in (["compile"], ["compilebuild"]):
+            return CompileAllStrategy(
+                build=labels[0] == "compilebuild",
+                compress=options.get("compress", False),
+                force=options.get("force", False),
+                jobs=options.get("jobs"),
+            )
+        if options.get("all") and labels == ["watch"]:
+            return WatchAllStrategy(
+                debounce=options["debounce"]
+                if options.get("debounce") is not None
+                else WATCH_DEBOUNCE_MS,
+                jobs=options.get("jobs"),
+            )
+        if options.get("all"):
+            command = labels[0] if labels else ""
+            if command in ("compile", "compilebuild", "watch"):
+                raise StrategyError(
+                    f"--all compiles every djelm app, remove the app name from {command} --all"
+                )
+            raise StrategyError(
+                f"--all only works with compile, compilebuild and watch, not {command}"
+            )
         e = Validations().acceptable_command(labels)
         match e:
             case ExitFailure(err=err):
@@ -948,7 +1525,12 @@ class Strategy:
             case ExitSuccess(value={"command": "create", "app_name": app_name}):
                 return CreateStrategy(cast(str, app_name))
             case ExitSuccess(value={"command": "watch", "app_name": app_name}):
-                return WatchStrategy(cast(str, app_name))
+                return WatchStrategy(
+                    cast(str, app_name),
+                    debounce=options["debounce"]
+                    if options.get("debounce") is not None
+                    else WATCH_DEBOUNCE_MS,
+                )
             case ExitSuccess(
                 value={
                     "command": "addprogram",
@@ -994,7 +1576,11 @@ class Strategy:
                     watch_mode=False,
                 )
             case ExitSuccess(value={"command": "generatemodels", "app_name": app_name}):
-                return GenerateModelsStrategy(app_name)
+                return GenerateModelsStrategy(app_name, jobs=options.get("jobs"))
+            case ExitSuccess(
+                value={"command": "deps", "app_name": app_name, "module": module}
+            ):
+                return DepsStrategy(cast(str, app_name), cast(str, module))
             case ExitSuccess(value={"command": "list"}):
                 return ListStrategy()
             case ExitSuccess(value={"command": "listwidgets"}):
@@ -1069,7 +1655,12 @@ class Strategy:
             case ExitSuccess(
                 value={"command": "compile", "app_name": app_name, "build": build}
             ):
-                return CompileStrategy(cast(str, app_name), cast(bool, build))
+                return CompileStrategy(
+                    cast(str, app_name),
+                    cast(bool, build),
+                    compress=options.get("compress", False),
+                    force=options.get("force", False),
+                )
             case ExitSuccess(
                 value={"command": "addwidget", "app_name": app_name, "widget": widget}
             ):
@@ -10,6 +10,7 @@ class SubProcess:
     command: list[str]
     cwd: str
     raise_error: bool = False
+    prefix: str = ""
 
     def open(self):
         process = subprocess.Popen(
@@ -23,6 +24,14 @@ class SubProcess:
         stderr_data = []
 
         def read_stream(stream: IO[str], buffer: list[str]):
+            if self.prefix:
+                # Whole lines so output from concurrent processes stays readable
+                for line in stream:
+                    sys.stdout.write(self.prefix + line)
+                    sys.stdout.flush()
+                    if stream == process.stderr:
+                        buffer.append(line)
+                return
             while True:
                 char = stream.read(1)
                 if not char:
@@ -1,7 +1,8 @@
 from django import template
-import json
+from django.utils.safestring import mark_safe
 
-from djelm.settings import ProgramSettings
+from djelm.render import INCLUDES_PLACEHOLDER, program_includes
+from djelm.settings import DEFAULT_SETTINGS_JSON, settings_json
 
 register = template.Library()
 
@@ -12,12 +13,7 @@ def merge_settings(**kwargs):
     Combines default settings with user-provided settings,
     and returns the result as a JSON string.
     """
-    default_settings = ProgramSettings().get_settings()
-    passed_settings = kwargs.get("settings", {})
-
-    config = default_settings | passed_settings
-
-    return json.dumps(config)
+    return settings_json(kwargs.get("settings", {}))
 
 
 @register.simple_tag
@@ -25,6 +21,19 @@ def default_settings():
     """
     Returns the default program settings as a JSON string.
     """
-    default_settings = ProgramSettings().get_settings()
+    return DEFAULT_SETTINGS_JSON
+
+
+@register.simple_tag(takes_context=True)
+def djelm_includes(context):
+    """
+    Marks where the script and modulepreload tags of every program included
+    during the request are placed, e.g. in the document <head>.
+
+    Requires the request context processor and ProgramIncludesMiddleware.
+    """
+    if context.get("request") is None:
+        return ""
 
-    return json.dumps(default_settings)
+    program_includes(context).deferred = True
+    return mark_safe(INCLUDES_PLACEHOLDER)
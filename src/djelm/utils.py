@@ -1,5 +1,9 @@
+import hashlib
 import os
 import re
+import secrets
+from dataclasses import dataclass
+from typing import Optional
 
 from django.apps import apps
 
@@ -54,6 +58,20 @@ def is_djelm(files: list[str]) -> bool:
     return found
 
 
+def find_djelm_apps(apps: list[str]) -> list[str]:
+    """
+    The names of the installed apps that are djelm apps.
+    """
+    djelm_apps = []
+    for app in apps:
+        app_path = get_app_path(app)
+        if app_path.tag == "Success":
+            root, _, files = next(walk_level(app_path.value))
+            if is_djelm(files):
+                djelm_apps.append(os.path.basename(root))
+    return djelm_apps
+
+
 def is_create(app_name: str) -> bool:
     path_exit = get_app_path(app_name)
     if path_exit.tag == "Success":
@@ -152,3 +170,66 @@ def supporting_ts_files(prog_name: str) -> list[str]:
 def is_elm_entrypoint(content: str) -> bool:
     pattern = r"\bmain\s*:[^\n]*\n\s*main\s*="
     return bool(re.search(pattern, content, re.DOTALL))
+
+
+@dataclass(slots=True)
+class WriteStats:
+    written: int = 0
+    skipped: int = 0
+
+    def record(self, written: bool):
+        if written:
+            self.written += 1
+        else:
+            self.skipped += 1
+
+    def __str__(self) -> str:
+        return f"{self.written} written, {self.skipped} unchanged"
+
+
+def _open_temp(directory: str) -> tuple[int, str]:
+    """
+    Create a temporary file in directory with the mode open() would give it,
+    the kernel applies the umask.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = os.path.join(directory, f".djelm-{secrets.token_hex(8)}")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def write_if_changed(path: str, content: str, newline: Optional[str] = None) -> bool:
+    """
+    Atomically write content to path unless the file already holds the same
+    content. Returns whether the file was written.
+
+    Unchanged files keep their mtime, so Parcel caches and file watchers are
+    not invalidated.
+    """
+    if newline is None:
+        newline = os.linesep
+    if newline not in ("", "\n"):
+        content = content.replace("\n", newline)
+    data = content.encode("utf-8")
+
+    try:
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+    except OSError:
+        pass
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = _open_temp(directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
@@ -31,6 +31,7 @@ AddWidget = TypedDict(
     {"command": Literal["addwidget"], "app_name": str, "widget": WIDGET_NAMES_T},
 )
 Create = TypedDict("Create", {"command": Literal["create"], "app_name": str})
+Deps = TypedDict("Deps", {"command": Literal["deps"], "app_name": str, "module": str})
 Compile = TypedDict(
     "Compile",
     {"command": Literal["compile"], "app_name": str, "build": bool},
@@ -80,6 +81,7 @@ class Validations:
             | AddWidget
             | Create
             | Compile
+            | Deps
             | Elm
             | FindPrograms
             | GenerateModel
@@ -219,6 +221,14 @@ class Validations:
                     raise ValidationError(
                         Validations.__not_a_djelm_app("elm", app_name)
                     )
+            case ["deps", app_name, _]:
+                validated_app_path = self._validate_app_path(
+                    app_name, self.__not_in_settings("deps", app_name)
+                )
+                if not is_djelm(next(walk_level(validated_app_path))[2]):
+                    raise ValidationError(
+                        f"{Validations.__not_a_djelm_app('deps', app_name)}\n"
+                    )
             case ["findprograms", app_name]:
                 validated_app_path = self._validate_app_path(
                     app_name, self.__not_in_settings("addprogram", app_name)
@@ -377,6 +387,26 @@ class Validations:
                         "compilebuild " + app_name, list(rest)
                     )
                 )
+            case ["deps", _, _]:
+                return
+            case ["deps", app_name]:
+                raise ValidationError(
+                    Validations.__missing_argument(
+                        "deps",
+                        app_name,
+                        "Include the name of the Elm module you want to inspect, something like \033[1mShared.Ui\033[0m.",
+                    )
+                )
+            case [
+                "deps",
+            ]:
+                raise ValidationError(Validations.__missing_app_name("deps"))
+            case ["deps", app_name, module, *rest]:
+                raise ValidationError(
+                    Validations.__too_many_command_args(
+                        f"deps {app_name} {module}", list(rest)
+                    )
+                )
             case ["elm", _, *_]:
                 return
             case [
@@ -567,7 +597,8 @@ Perhaps you meant one of these?:
         listwidgets
         findprograms
         compile
-        compilebuild\033[0m"""
+        compilebuild
+        deps\033[0m"""
 
     @staticmethod
     def __not_in_settings(cmd_verb: str, app_name: str) -> str:
@@ -612,6 +643,7 @@ But \033[1m{app_name}\033[0m doesn't look like a djelm app and I can't run comma
             "create",
             "compile",
             "compilebuild",
+            "deps",
             "elm",
             "findprograms",
             "generatemodel",
@@ -634,6 +666,7 @@ But \033[1m{app_name}\033[0m doesn't look like a djelm app and I can't run comma
             | AddWidget
             | Create
             | Compile
+            | Deps
             | Elm
             | FindPrograms
             | GenerateModel
@@ -683,6 +716,10 @@ But \033[1m{app_name}\033[0m doesn't look like a djelm app and I can't run comma
                 return ExitSuccess(
                     Compile({"command": "compile", "app_name": v, "build": True})
                 )
+            case ["deps", v, m]:
+                return ExitSuccess(
+                    Deps({"command": "deps", "app_name": v, "module": m})
+                )
             case ["elm", v, *rest]:
                 return ExitSuccess(Elm({"command": "elm", "app_name": v, "args": rest}))
             case ["findprograms", v]:
@@ -84,3 +84,23 @@ class TestToString:
         SUT = Anno.toString(anno)
 
         assert SUT == """{ hello : String }"""
+
+    def test_with_array_string(self):
+        anno = Anno.array(Anno.string())
+        SUT = Anno.toString(anno)
+
+        assert SUT == "Array String"
+
+    def test_with_function(self):
+        anno = Anno.function(
+            [Anno.array(Anno.string()), Anno.int()], Anno.maybe(Anno.string())
+        )
+        SUT = Anno.toString(anno)
+
+        assert SUT == "Array String -> Int -> Maybe String"
+
+    def test_with_function_argument(self):
+        anno = Anno.function([Anno.function([Anno.int()], Anno.string())], Anno.int())
+        SUT = Anno.toString(anno)
+
+        assert SUT == "(Int -> String) -> Int"
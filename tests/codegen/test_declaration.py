@@ -6,6 +6,7 @@ import djelm.codegen.expression as Exp
 import djelm.codegen.module_name as Module
 import djelm.codegen.range as Range
 import djelm.codegen.compiler as Compiler
+from djelm.codegen.pattern import VarPattern
 
 
 class TestExpressions:
@@ -176,3 +177,31 @@ options_Decoder =
         |> required \"someField\" Decode.string
         |> required \"someField01\" Decode.int"""
         )
+
+    def test_declaration_with_args(self):
+        sig = Compiler.Signature(
+            "someDecoder",
+            Anno.function(
+                [Anno.array(Anno.string())],
+                Anno.typed("Decode.Decoder", [Anno.string()]),
+            ).annotation,
+        )
+        decl = Elm.declaration(
+            "someDecoder",
+            Elm.apply(
+                Exp.FunctionOrValue(
+                    Module.ModuleName(["Decode"]), "string", None, None
+                ),
+                [],
+            ),
+            sig,
+            [VarPattern("strings")],
+        )
+        SUT = Writer.writeDeclartion(decl)
+
+        assert (
+            SUT.write()
+            == """someDecoder : Array String -> Decode.Decoder String
+someDecoder strings =
+    Decode.string"""
+        )
@@ -8,6 +8,7 @@ from djelm.flags.form.primitives import (
 
 from djelm.flags.main import (
     BoolFlag,
+    DictFlag,
     FloatFlag,
     IntFlag,
     ListFlag,
@@ -20,6 +21,7 @@ from djelm.flags.primitives import AliasFlag
 ALL_FLAGS = [
     ObjectFlag,
     ListFlag,
+    DictFlag,
     NullableFlag,
     StringFlag,
     IntFlag,
@@ -89,6 +91,9 @@ def fuzz_flag():
     if choice is ListFlag:
         return ListFlag(fuzz_flag())
 
+    if choice is DictFlag:
+        return DictFlag(random.choice([StringFlag(), IntFlag()]), fuzz_flag())
+
     if choice is NullableFlag:
         return NullableFlag(fuzz_flag())
 
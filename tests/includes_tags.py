@@ -0,0 +1,15 @@
+from django import template
+
+from djelm.render import include_program_once
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def include_main(context):
+    return include_program_once(context, "dist/Main.js")
+
+
+@register.simple_tag(takes_context=True)
+def include_other(context):
+    return include_program_once(context, "dist/Other.js")
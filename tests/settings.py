@@ -27,6 +27,7 @@ TEMPLATES = [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
             ],
+            "libraries": {"includes": "tests.includes_tags"},
         },
     },
 ]
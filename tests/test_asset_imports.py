@@ -0,0 +1,61 @@
+import os
+
+from djelm.asset_imports import asset_dependencies, resolve_specifier
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def test_asset_dependencies_follows_scripts_and_styles(tmp_path):
+    src = tmp_path / "src"
+    handlers = str(src / "Main.handlers.ts")
+    write(
+        handlers,
+        "import { format } from './lib/format.js';\n"
+        "import {\n  a,\n  b,\n} from '../shared/ab';\n"
+        "import './main.css';\n"
+        "import confetti from 'canvas-confetti';\n",
+    )
+    write(str(src / "lib" / "format.ts"), "export const format = 1;\n")
+    write(str(tmp_path / "shared" / "ab" / "index.ts"), "export const a = 1;\n")
+    write(
+        str(src / "main.css"),
+        '@import "theme.css";\n.a { background: url(./bg.png); fill: url(#grad) }\n'
+        ".b { background: url(data:image/png;base64,AAAA) }\n",
+    )
+    write(str(src / "theme.css"), "")
+    write(str(src / "bg.png"), "")
+
+    assert asset_dependencies([handlers]) == {
+        handlers,
+        str(src / "lib" / "format.ts"),
+        str(tmp_path / "shared" / "ab" / "index.ts"),
+        str(src / "main.css"),
+        str(src / "theme.css"),
+        str(src / "bg.png"),
+    }
+
+
+def test_asset_dependencies_gives_up_on_imports_it_cant_follow(tmp_path):
+    handlers = str(tmp_path / "Main.handlers.ts")
+
+    write(handlers, "import { format } from './missing';\n")
+    assert asset_dependencies([handlers]) is None
+
+    write(handlers, "const page = import(`./pages/${name}`);\n")
+    assert asset_dependencies([handlers]) is None
+
+    write(handlers, "import '/root.css';\n")
+    assert asset_dependencies([handlers]) is None
+
+
+def test_resolve_specifier(tmp_path):
+    importer = str(tmp_path / "Main.ts")
+    write(str(tmp_path / "util.tsx"), "")
+
+    assert resolve_specifier("./util", importer) == str(tmp_path / "util.tsx")
+    assert resolve_specifier("./util.js?inline", importer) == str(tmp_path / "util.tsx")
+    assert resolve_specifier("./nope", importer) is None
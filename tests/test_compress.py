@@ -0,0 +1,51 @@
+import gzip
+import os
+
+from djelm.compress import brotli, compress_assets, compression_report
+
+
+def test_compress_assets(tmp_path):
+    (tmp_path / "Main.js").write_text("console.log('main');" * 100)
+    (tmp_path / "Main.js.map").write_text("{}")
+    (tmp_path / "Old.js.gz").write_bytes(b"stale")
+
+    assets = compress_assets(str(tmp_path), max_workers=2)
+
+    assert [os.path.basename(a.path) for a in assets] == ["Main.js"]
+    assert assets[0].gzip_size < assets[0].size
+    assert (
+        gzip.decompress((tmp_path / "Main.js.gz").read_bytes())
+        == (tmp_path / "Main.js").read_bytes()
+    )
+    assert (tmp_path / "Main.js.br").exists() == (brotli is not None)
+    assert not (tmp_path / "Old.js.gz").exists()
+    assert not (tmp_path / "Main.js.map.gz").exists()
+
+
+def test_compression_report(tmp_path):
+    (tmp_path / "Main.js").write_text("console.log('main');")
+
+    report = compression_report(compress_assets(str(tmp_path), max_workers=1))
+
+    assert report.splitlines()[0].split() == ["asset", "size", "gzip", "brotli"]
+    assert report.splitlines()[1].startswith("Main.js")
+
+
+def test_compress_assets_skips_up_to_date_assets(tmp_path, monkeypatch):
+    main = tmp_path / "Main.js"
+    main.write_text("console.log('main');" * 100)
+    first = compress_assets(str(tmp_path), max_workers=1)
+
+    def fail(path):
+        raise AssertionError(f"{path} was compressed again")
+
+    monkeypatch.setattr("djelm.compress.compress_asset", fail)
+    assert compress_assets(str(tmp_path), max_workers=1) == first
+
+    gz_mtime = os.stat(tmp_path / "Main.js.gz").st_mtime_ns
+    main.write_text("console.log('changed');" * 100)
+    os.utime(main, ns=(gz_mtime + 1_000_000_000, gz_mtime + 1_000_000_000))
+    monkeypatch.undo()
+    [changed] = compress_assets(str(tmp_path), max_workers=1)
+    assert changed.size == main.stat().st_size
+    assert gzip.decompress((tmp_path / "Main.js.gz").read_bytes()) == main.read_bytes()
@@ -0,0 +1,90 @@
+import filecmp
+import os
+
+import pytest
+
+from djelm.cookiecutter import CookieCutter, TemplateCutter
+from djelm.flags.main import Flags
+from djelm.flags.primitives import ObjectFlag, StringFlag
+from djelm.generators import entrypoint_cookie_cutter, model_cookie_cutter
+from djelm.utils import WriteStats
+
+
+class Logger:
+    def write(self, msg):
+        pass
+
+
+def cookiecutter_of(cutter: TemplateCutter, output_dir: str) -> CookieCutter:
+    return CookieCutter(
+        file_dir=cutter.file_dir,
+        output_dir=output_dir,
+        cookie_template_name=cutter.cookie_template_name,
+        extra=cutter.extra,
+        overwrite=cutter.overwrite,
+    )
+
+
+def assert_same_files(left: str, right: str):
+    comparison = filecmp.dircmp(left, right)
+    assert not comparison.left_only and not comparison.right_only
+    assert not comparison.diff_files
+    for sub in comparison.common_dirs:
+        assert_same_files(os.path.join(left, sub), os.path.join(right, sub))
+
+
+@pytest.mark.parametrize(
+    "make_cutter",
+    [
+        lambda src_path: entrypoint_cookie_cutter(
+            base_name="Widgets.",
+            base_path="Widgets/",
+            src_path=src_path,
+            program_name="Main",
+            scope="app-main",
+            view_prefix="widget",
+            imports=["import * as handlers from '../../../src/Main.handlers.ts'"],
+            extras=["handlers.handleApp(app);"],
+        ),
+        lambda src_path: model_cookie_cutter(
+            Flags(ObjectFlag({"name": StringFlag()})),
+            "app",
+            "Main",
+            "program_model_template",
+            "Models",
+            os.path.join(src_path, "src"),
+            "Models",
+        ),
+    ],
+)
+def test_template_cutter_matches_cookiecutter(tmp_path, make_cutter):
+    cutter = make_cutter(str(tmp_path / "template"))
+    expected = cookiecutter_of(cutter, str(tmp_path / "cookiecutter"))
+
+    cut = cutter.cut(Logger())
+    expected_cut = expected.cut(Logger())
+
+    assert cut.tag == "Success" and expected_cut.tag == "Success"
+    assert os.path.basename(cut.value) == os.path.basename(expected_cut.value)
+    assert_same_files(cutter.output_dir, expected.output_dir)
+
+
+def test_template_cutter_without_overwrite(tmp_path):
+    cutter = entrypoint_cookie_cutter("", "", str(tmp_path), "Main", "app-main", "")
+    cutter.overwrite = False
+
+    assert cutter.cut(Logger()).tag == "Success"
+    assert cutter.cut(Logger()).tag == "Failure"
+
+
+def test_template_cutter_skips_unchanged_files(tmp_path):
+    stats = WriteStats()
+    cutter = entrypoint_cookie_cutter("", "", str(tmp_path), "Main", "app-main", "")
+    cutter.stats = stats
+
+    cutter.cut(Logger())
+    cutter.cut(Logger())
+    cutter.extra["scope"] = "app-other"
+    cutter.cut(Logger())
+
+    assert (stats.written, stats.skipped) == (2, 1)
@@ -0,0 +1,98 @@
+import json
+import os
+
+from djelm.elm_imports import (
+    ImportGraph,
+    elm_imports,
+    source_directories,
+)
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def elm_app(tmp_path):
+    write(tmp_path / "elm.json", json.dumps({"source-directories": ["src"]}))
+    write(
+        tmp_path / "src" / "Main.elm",
+        "module Main exposing (..)\n\n"
+        "import Html exposing (Html)\n"
+        "import Models.Main exposing (ToModel)\n"
+        "{-\nimport Commented\n-}\n"
+        "import Shared\n",
+    )
+    write(tmp_path / "src" / "Models" / "Main.elm", "module Models.Main exposing (..)")
+    write(tmp_path / "src" / "Shared.elm", "module Shared exposing (..)\nimport Main\n")
+    return tmp_path
+
+
+def test_elm_imports(tmp_path):
+    app = elm_app(tmp_path)
+
+    assert elm_imports(app / "src" / "Main.elm") == ["Html", "Models.Main", "Shared"]
+
+
+def test_elm_imports_stop_at_the_first_declaration(tmp_path):
+    write(
+        tmp_path / "Main.elm",
+        'module Main exposing (..)\n\nimport Shared\n\nview =\n    """\nimport Nope\n"""\n',
+    )
+
+    assert elm_imports(tmp_path / "Main.elm") == ["Shared"]
+
+
+def test_import_graph_module(tmp_path):
+    app = elm_app(tmp_path)
+    source_dirs = source_directories(str(app))
+    graph = ImportGraph(source_dirs)
+    graph.refresh()
+
+    assert source_dirs == [str(app / "src")]
+    assert graph.module("Models.Main") == str(app / "src" / "Models" / "Main.elm")
+    assert graph.module("Html") is None
+
+
+def test_import_graph_dependencies(tmp_path):
+    app = elm_app(tmp_path)
+    graph = ImportGraph(source_directories(str(app)))
+    graph.refresh()
+
+    assert graph.dependencies(str(app / "src" / "Main.elm")) == {
+        str(app / "src" / "Main.elm"),
+        str(app / "src" / "Models" / "Main.elm"),
+        str(app / "src" / "Shared.elm"),
+    }
+
+
+def test_import_graph(tmp_path):
+    app = elm_app(tmp_path)
+    src = str(app / "src")
+    main, model, shared = (
+        os.path.join(src, "Main.elm"),
+        os.path.join(src, "Models", "Main.elm"),
+        os.path.join(src, "Shared.elm"),
+    )
+    write(app / "src" / "Ui" / "Button.elm", "module Ui.Button exposing (..)\n")
+    button = os.path.join(src, "Ui", "Button.elm")
+    graph = ImportGraph(source_directories(str(app)))
+    graph.refresh()
+
+    assert graph.module("Ui.Button") == button
+    assert graph.module_name(model) == "Models.Main"
+    assert graph.imports(main) == {model, shared}
+    assert graph.importers()[model] == {main}
+    assert graph.dependencies(main) == {main, model, shared}
+    assert graph.dependents({model}) == {model, main, shared}
+    assert graph.dependents({button}) == {button}
+
+    write(app / "src" / "Shared.elm", "module Shared exposing (..)\nimport Ui.Button\n")
+    graph.update(shared)
+    assert graph.dependents({button}) == {button, shared, main}
+
+    os.remove(button)
+    graph.update(button)
+    assert graph.module("Ui.Button") is None
+    assert graph.imports(shared) == set()
@@ -0,0 +1,67 @@
+import os
+
+from djelm.effect import ExitFailure, ExitSuccess
+from djelm.flag_pool import FlagPool, PreparedFlags, prepare_flags
+from djelm.flags import Flags, IntFlag
+from djelm.generators import ModelGenerator
+
+
+class StringLogger:
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def write(self, msg: str):
+        self.lines.append(msg)
+
+
+def write_flags(app_path, content: str):
+    os.makedirs(os.path.join(app_path, "flags"), exist_ok=True)
+    with open(os.path.join(app_path, "flags", "main.py"), "w") as f:
+        f.write(content)
+
+
+def test_prepare_flags_returns_generated_elm(tmp_path):
+    write_flags(
+        tmp_path,
+        "from djelm.flags import Flags, IntFlag\nMainFlags = Flags(IntFlag())\n",
+    )
+
+    prepared, output, _ = prepare_flags(ModelGenerator(), str(tmp_path), "Main", False)
+
+    assert prepared == PreparedFlags(**Flags(IntFlag()).to_elm_parser_data())
+    assert output == ""
+
+
+def test_prepare_flags_returns_module_errors(tmp_path):
+    write_flags(tmp_path, "raise ValueError('bad flags')\n")
+
+    prepared, output, _ = prepare_flags(ModelGenerator(), str(tmp_path), "Main", True)
+
+    assert prepared is None
+    assert "FLAG MODULE ERROR" in output
+    assert "bad flags" in output
+
+
+def test_flag_pool_evaluates_in_a_worker(tmp_path):
+    write_flags(
+        tmp_path,
+        "from djelm.flags import Flags, IntFlag\nMainFlags = Flags(IntFlag())\n",
+    )
+    pool = FlagPool(max_workers=1)
+    logger = StringLogger()
+    try:
+        pool.prefetch(ModelGenerator(), str(tmp_path), "Main")
+        result = pool.load_flags(ModelGenerator(), str(tmp_path), "Main", False, logger)
+        assert isinstance(result, ExitSuccess)
+        assert (
+            result.value.to_elm_parser_data() == Flags(IntFlag()).to_elm_parser_data()
+        )
+
+        write_flags(tmp_path, "MainFlags = None + 1\n")
+        failed = pool.load_flags(ModelGenerator(), str(tmp_path), "Main", False, logger)
+        assert isinstance(failed, ExitFailure)
+        assert any("FLAG MODULE ERROR" in line for line in logger.lines)
+        assert pool.pending == {}
+        assert set(pool.timings) == {"Main"}
+    finally:
+        pool.shutdown()
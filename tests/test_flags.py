@@ -14,6 +14,7 @@ from djelm.flags.primitives import (
     AliasFlag,
     BoolFlag,
     CustomTypeFlag,
+    DictFlag,
     FloatFlag,
     IntFlag,
     ListFlag,
@@ -21,7 +22,7 @@ from djelm.flags.primitives import (
     ObjectFlag,
     StringFlag,
 )
-from djelm.flags.main import Flags
+from djelm.flags.main import Flags, minified_key
 from djelm.generators import ModelGenerator
 from djelm.strategy import GenerateModelStrategy
 from djelm.utils import get_app_src_path
@@ -579,6 +580,126 @@ toModel =
         |> required "world" Decode.string""",
         }
 
+    def test_parser_with_categorical(self):
+        SUT = Flags(ListFlag(StringFlag(categorical=True)))
+
+        assert (
+            SUT.parse(["open", "closed", "open"])
+            == '{"strings":["open","closed"],"value":[0,1,0]}'
+        )
+        assert SUT.parse([]) == '{"strings":[],"value":[]}'
+        with pytest.raises(ValidationError):
+            SUT.parse([1])
+
+    def test_with_object_parser_categorical(self):
+        d = ObjectFlag(
+            {
+                "status": StringFlag(categorical=True),
+                "others": ListFlag(
+                    ObjectFlag({"status": NullableFlag(StringFlag(categorical=True))})
+                ),
+            }
+        )
+        SUT = Flags(d)
+
+        assert (
+            SUT.parse(
+                {"status": "open", "others": [{"status": None}, {"status": "closed"}]}
+            )
+            == '{"strings":["open","closed"],"value":{"status":0,"others":[{"status":null},{"status":1}]}}'
+        )
+
+    def test_categorical_with_literal_raises(self):
+        with pytest.raises(Exception):
+            StringFlag(literal="hello", categorical=True)
+
+    def test_categorical_custom_type_with_number_variant_raises(self):
+        with pytest.raises(Exception, match="categorical StringFlag variant"):
+            CustomTypeFlag(
+                variants=[
+                    ("Status", StringFlag(categorical=True)),
+                    ("Count", IntFlag()),
+                ]
+            )
+        with pytest.raises(Exception, match="categorical StringFlag variant"):
+            CustomTypeFlag(
+                variants=[
+                    ("Count", NullableFlag(FloatFlag())),
+                    ("Status", StringFlag(categorical=True)),
+                ]
+            )
+
+    def test_categorical_custom_type_with_string_variant(self):
+        SUT = Flags(
+            CustomTypeFlag(
+                variants=[
+                    ("Status", StringFlag(categorical=True)),
+                    ("Name", StringFlag()),
+                ]
+            )
+        )
+
+        assert SUT.parse("open") == '{"strings":["open"],"value":0}'
+
+    def test_to_elm_parser_with_categorical(self):
+        SUT = Flags(StringFlag(categorical=True))
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": "String",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    Decode.field "strings" (Decode.array Decode.string)
+        |> Decode.andThen (\\strings -> Decode.field "value" (toModelWith strings))
+
+toModelWith : Array String -> Decode.Decoder ToModel
+toModelWith strings =
+    (categoricalStringDecoder strings)
+
+categoricalStringDecoder : Array String -> Decode.Decoder String
+categoricalStringDecoder strings =
+    Decode.int
+        |> Decode.andThen (\\idx -> Array.get idx strings |> Maybe.map Decode.succeed |> Maybe.withDefault (Decode.fail "Missing categorical string"))""",
+        }
+
+    def test_with_object_to_elm_parser_categorical(self):
+        SUT = Flags(
+            ObjectFlag(
+                {
+                    "hello": StringFlag(categorical=True),
+                    "world": ObjectFlag({"status": StringFlag(categorical=True)}),
+                }
+            )
+        )
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": """{ hello : String
+    , world : World_
+    }
+
+type alias World_ =
+    { status : String }""",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    Decode.field "strings" (Decode.array Decode.string)
+        |> Decode.andThen (\\strings -> Decode.field "value" (toModelWith strings))
+
+toModelWith : Array String -> Decode.Decoder ToModel
+toModelWith strings =
+    Decode.succeed ToModel
+        |> required "hello" (categoricalStringDecoder strings)
+        |> required "world" (world_Decoder strings)
+
+categoricalStringDecoder : Array String -> Decode.Decoder String
+categoricalStringDecoder strings =
+    Decode.int
+        |> Decode.andThen (\\idx -> Array.get idx strings |> Maybe.map Decode.succeed |> Maybe.withDefault (Decode.fail "Missing categorical string"))
+
+world_Decoder : Array String -> Decode.Decoder World_
+world_Decoder strings =
+    Decode.succeed World_
+        |> required "status" (categoricalStringDecoder strings)""",
+        }
+
 
 class TestIntFlags:
     def test_with_object_parser(self):
@@ -913,6 +1034,65 @@ toModel =
     (Decode.nullable (Decode.nullable (Decode.list Decode.string)))""",
         }
 
+    def test_omit_when_none_parser(self):
+        SUT = Flags(
+            ObjectFlag(
+                {
+                    "hello": NullableFlag(StringFlag(), omit_when_none=True),
+                    "world": NullableFlag(StringFlag()),
+                }
+            )
+        )
+
+        assert SUT.parse({"hello": None, "world": None}) == '{"world":null}'
+        assert SUT.parse({"world": None}) == '{"world":null}'
+        assert (
+            SUT.parse({"hello": "hello", "world": "world"})
+            == '{"hello":"hello","world":"world"}'
+        )
+        with pytest.raises(ValidationError):
+            SUT.parse({"hello": None})
+
+    def test_omit_when_none_nested_parser(self):
+        SUT = Flags(
+            ListFlag(
+                ObjectFlag(
+                    {
+                        "hello": ObjectFlag(
+                            {"world": NullableFlag(IntFlag(), omit_when_none=True)}
+                        )
+                    }
+                )
+            ),
+            minify_keys=True,
+        )
+
+        assert (
+            SUT.parse([{"hello": {"world": None}}, {"hello": {"world": 1}}])
+            == '[{"0":{}},{"0":{"0":1}}]'
+        )
+
+    def test_omit_when_none_to_elm_parser(self):
+        SUT = Flags(
+            ObjectFlag(
+                {
+                    "hello": NullableFlag(StringFlag(), omit_when_none=True),
+                    "world": NullableFlag(StringFlag()),
+                }
+            )
+        )
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": """{ hello : Maybe String
+    , world : Maybe String
+    }""",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    Decode.succeed ToModel
+        |> optional "hello" (Decode.nullable Decode.string) Nothing
+        |> required "world" (Decode.nullable Decode.string)""",
+        }
+
 
 class TestListFlags:
     def test_with_object_parser(self):
@@ -1138,6 +1318,192 @@ toModel =
     (Decode.list (Decode.oneOf [Decode.map Car Decode.string]))""",
         }
 
+    def test_with_columnar_object_parser(self):
+        d = ListFlag(
+            ObjectFlag({"hello": StringFlag(), "count": IntFlag()}), columnar=True
+        )
+        SUT = Flags(d)
+
+        assert SUT.parse([]) == '{"hello":[],"count":[]}'
+        assert (
+            SUT.parse([{"hello": "world", "count": 1}, {"hello": "elm", "count": 2}])
+            == '{"hello":["world","elm"],"count":[1,2]}'
+        )
+        with pytest.raises(ValidationError):
+            SUT.parse([{"hello": "world"}])
+
+    def test_with_columnar_nested_object_parser(self):
+        d = ObjectFlag(
+            {
+                "rows": ListFlag(
+                    ObjectFlag(
+                        {"a": NullableFlag(StringFlag()), "b": ListFlag(IntFlag())}
+                    ),
+                    columnar=True,
+                )
+            }
+        )
+        SUT = Flags(d)
+
+        assert (
+            SUT.parse({"rows": [{"a": None, "b": [1]}, {"a": "x", "b": []}]})
+            == '{"rows":{"a":[null,"x"],"b":[[1],[]]}}'
+        )
+
+    def test_with_columnar_non_object_raises(self):
+        with pytest.raises(Exception):
+            Flags(ListFlag(StringFlag(), columnar=True))
+
+    def test_with_columnar_object_to_elm_parser(self):
+        d = ListFlag(
+            ObjectFlag({"hello": StringFlag(), "count": IntFlag()}), columnar=True
+        )
+        SUT = Flags(d)
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": """List InlineToModel_
+
+type alias InlineToModel_ =
+    { hello : String
+    , count : Int
+    }""",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    inlineToModel_ColumnsDecoder
+
+inlineToModel_Decoder : Decode.Decoder InlineToModel_
+inlineToModel_Decoder =
+    Decode.succeed InlineToModel_
+        |> required "hello" Decode.string
+        |> required "count" Decode.int
+
+inlineToModel_ColumnsDecoder : Decode.Decoder (List InlineToModel_)
+inlineToModel_ColumnsDecoder =
+    Decode.map (List.map InlineToModel_) (Decode.field "hello" (Decode.list Decode.string))
+        |> Decode.map2 (List.map2 (|>)) (Decode.field "count" (Decode.list Decode.int))""",
+        }
+
+    def test_with_columnar_nested_object_to_elm_parser(self):
+        d = ObjectFlag(
+            {"rows": ListFlag(ObjectFlag({"a": StringFlag()}), columnar=True)}
+        )
+        SUT = Flags(d)
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": """{ rows : List Rows_
+    }
+
+type alias Rows_ =
+    { a : String }""",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    Decode.succeed ToModel
+        |> required "rows" rows_ColumnsDecoder
+
+rows_Decoder : Decode.Decoder Rows_
+rows_Decoder =
+    Decode.succeed Rows_
+        |> required "a" Decode.string
+
+rows_ColumnsDecoder : Decode.Decoder (List Rows_)
+rows_ColumnsDecoder =
+    Decode.map (List.map Rows_) (Decode.field "a" (Decode.list Decode.string))""",
+        }
+
+
+class TestDictFlags:
+    @pytest.mark.parametrize(
+        "key", [StringFlag(literal="hello"), StringFlag(categorical=True), BoolFlag()]
+    )
+    def test_instance_errors(self, key):
+        with pytest.raises(Exception):
+            DictFlag(key, StringFlag())
+
+    def test_with_string_key_parser(self):
+        SUT = Flags(DictFlag(StringFlag(), IntFlag()))
+
+        assert SUT.parse({}) == "{}"
+        assert SUT.parse({"hello": 1, "world": 2}) == '{"hello":1,"world":2}'
+        with pytest.raises(ValidationError):
+            SUT.parse({"hello": "world"})
+        with pytest.raises(ValidationError):
+            SUT.parse({1: 1})
+
+    def test_with_int_key_parser(self):
+        SUT = Flags(DictFlag(IntFlag(), StringFlag()))
+
+        assert SUT.parse({1: "hello", 22: "world"}) == '{"1":"hello","22":"world"}'
+        with pytest.raises(ValidationError):
+            SUT.parse({"1": "hello"})
+
+    def test_with_object_parser(self):
+        SUT = Flags(
+            ObjectFlag(
+                {"people": DictFlag(StringFlag(), ObjectFlag({"age": IntFlag()}))}
+            )
+        )
+
+        assert (
+            SUT.parse({"people": {"bob": {"age": 32}}})
+            == '{"people":{"bob":{"age":32}}}'
+        )
+        with pytest.raises(ValidationError):
+            SUT.parse({"people": {"bob": {}}})
+
+    def test_with_string_key_to_elm_parser(self):
+        SUT = Flags(DictFlag(StringFlag(), ListFlag(IntFlag())))
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": "Dict String (List Int)",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    (Decode.dict (Decode.list Decode.int))""",
+        }
+
+    def test_with_int_key_to_elm_parser(self):
+        SUT = Flags(DictFlag(IntFlag(), StringFlag()))
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": "Dict Int String",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    (intDictDecoder Decode.string)
+
+intDictDecoder : Decode.Decoder a -> Decode.Decoder (Dict Int a)
+intDictDecoder valueDecoder =
+    Decode.dict valueDecoder
+        |> Decode.map (Dict.foldl (\\key value acc -> String.toInt key |> Maybe.map (\\k -> Dict.insert k value acc) |> Maybe.withDefault acc) Dict.empty)""",
+        }
+
+    def test_with_object_to_elm_parser(self):
+        SUT = Flags(
+            ObjectFlag(
+                {
+                    "people": DictFlag(StringFlag(), ObjectFlag({"age": IntFlag()})),
+                    "names": DictFlag(StringFlag(), StringFlag()),
+                }
+            )
+        )
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": """{ people : Dict String People_
+    , names : Dict String String
+    }
+
+type alias People_ =
+    { age : Int }""",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    Decode.succeed ToModel
+        |> required "people" (Decode.dict people_Decoder)
+        |> required "names" (Decode.dict Decode.string)
+
+people_Decoder : Decode.Decoder People_
+people_Decoder =
+    Decode.succeed People_
+        |> required "age" Decode.int""",
+        }
+
 
 class TestBoolFlags:
     def test_with_object_parser(self):
@@ -1685,6 +2051,77 @@ hello_world__Decoder =
         assert SUT.to_elm_parser_data() == expected
 
 
+class TestMinifyKeys:
+    @pytest.mark.parametrize(
+        "idx,expected", [(0, "0"), (9, "9"), (10, "a"), (35, "z"), (36, "10")]
+    )
+    def test_minified_key(self, idx, expected):
+        assert minified_key(idx) == expected
+
+    def test_parse(self):
+        SUT = Flags(
+            ObjectFlag(
+                {
+                    "hello": StringFlag(),
+                    "world": ObjectFlag({"someList": ListFlag(IntFlag())}),
+                }
+            ),
+            minify_keys=True,
+        )
+
+        assert (
+            SUT.parse({"hello": "world", "world": {"someList": [1]}})
+            == '{"0":"world","1":{"0":[1]}}'
+        )
+        with pytest.raises(ValidationError):
+            SUT.parse({"0": "world", "1": {"0": [1]}})
+
+    def test_parse_inline(self):
+        SUT = Flags(ListFlag(ObjectFlag({"hello": StringFlag()})), minify_keys=True)
+
+        assert SUT.parse([{"hello": "world"}]) == '[{"0":"world"}]'
+
+    def test_parse_columnar(self):
+        SUT = Flags(
+            ListFlag(
+                ObjectFlag({"hello": StringFlag(), "count": IntFlag()}), columnar=True
+            ),
+            minify_keys=True,
+        )
+
+        assert SUT.parse([{"hello": "world", "count": 1}]) == '{"0":["world"],"1":[1]}'
+
+    def test_to_elm_parser_data(self):
+        SUT = Flags(
+            ObjectFlag(
+                {
+                    "hello": StringFlag(),
+                    "world": ObjectFlag({"someList": ListFlag(IntFlag())}),
+                }
+            ),
+            minify_keys=True,
+        )
+
+        assert SUT.to_elm_parser_data() == {
+            "alias_type": """{ hello : String
+    , world : World_
+    }
+
+type alias World_ =
+    { someList : List Int }""",
+            "decoder_body": """toModel : Decode.Decoder ToModel
+toModel =
+    Decode.succeed ToModel
+        |> required "0" Decode.string
+        |> required "1" world_Decoder
+
+world_Decoder : Decode.Decoder World_
+world_Decoder =
+    Decode.succeed World_
+        |> required "0" (Decode.list Decode.int)""",
+        }
+
+
 class TestCustomTypeFlags:
     def test_root_string_flag_custom_type_parser(self):
         """Handles StringFlag"""
@@ -0,0 +1,38 @@
+from django.template.loader import render_to_string
+from jinja2 import Environment
+
+from djelm.flags.main import Flags
+from djelm.flags.primitives import ObjectFlag, StringFlag
+from djelm.jinja2 import DjelmExtension
+from djelm.settings import ProgramSettings
+
+MainFlags = Flags(ObjectFlag({"title": StringFlag()}))
+
+
+def environment() -> Environment:
+    return Environment(autoescape=True, extensions=[DjelmExtension])
+
+
+def test_render_program_matches_django_template():
+    flags = MainFlags.parse({"title": "<b>\"Tom\" & 'Jerry'</b>"})
+    settings = ProgramSettings().with_setting({"singleton": True}).get_settings()
+    template = environment().from_string(
+        "{{ render_program(key, MainFlags.parse(value), settings) }}"
+    )
+
+    assert template.render(
+        key="main",
+        MainFlags=MainFlags,
+        value={"title": "<b>\"Tom\" & 'Jerry'</b>"},
+        settings=settings,
+    ) == render_to_string(
+        "djelm/program.html", {"key": "main", "flags": flags, "settings": settings}
+    )
+
+
+def test_include_program_matches_django_template():
+    template = environment().from_string('{{ include_program("dist/Main.js") }}')
+
+    assert template.render() == render_to_string(
+        "djelm/include.html", {"djelm_program": "dist/Main.js"}
+    )
@@ -0,0 +1,143 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from djelm.parcel import COMPILE_PROGRAM, ParcelWorker, ParcelWorkerError
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="requires node")
+
+# A stand-in for @parcel/core that bundles each entry into dist/<name>.js
+FAKE_PARCEL = """
+const fs = require("fs");
+const path = require("path");
+
+class Parcel {
+  constructor(options) {
+    this.options = options;
+    this.runs = 0;
+  }
+  async run() {
+    if (this.options.entries.includes("crash")) process.exit(1);
+    if (this.options.entries.includes("hang")) await new Promise(() => {});
+    if (this.options.entries.includes("noisy")) {
+      process.stdout.write('plugin says hi {"id": 0, "ok": false}\\n{"ok": false}\\npartial');
+    }
+    if (this.options.entries.includes("fail")) {
+      throw { diagnostics: [{ message: "Elm compile error" }] };
+    }
+    this.runs += 1;
+    const distDir = this.options.defaultTargetOptions.distDir;
+    fs.mkdirSync(distDir, { recursive: true });
+    const bundles = this.options.entries.map((entry) => {
+      const filePath = path.join(distDir, path.basename(entry, ".ts") + ".js");
+      fs.writeFileSync(filePath, `// run ${this.runs}`);
+      return { filePath, type: "js", needsStableName: true };
+    });
+    return {
+      buildTime: 1,
+      bundleGraph: { getBundles: () => bundles, getChildBundles: () => [] },
+    };
+  }
+}
+
+module.exports = {
+  Parcel,
+  createWorkerFarm: () => ({ end: async () => {} }),
+};
+"""
+
+
+@pytest.fixture
+def src_path(tmp_path):
+    core = tmp_path / "static_src" / "node_modules" / "@parcel" / "core"
+    core.mkdir(parents=True)
+    (core / "index.js").write_text(FAKE_PARCEL)
+    return tmp_path / "static_src"
+
+
+def options(*entries: str) -> dict:
+    return {
+        "entries": list(entries),
+        "mode": "development",
+        "hashEntries": False,
+        "programs": ["dist/Main.js"],
+    }
+
+
+def test_worker_builds_incrementally(src_path):
+    worker = ParcelWorker(str(src_path))
+    try:
+        first = worker.build(options("Main.ts"))
+        pid = worker.process.pid  # type:ignore
+        second = worker.build(options("Main.ts"))
+        third = worker.build(options("Main.ts"))
+        assert worker.process.pid == pid  # type:ignore
+    finally:
+        worker.stop()
+
+    assert first["ok"] and second["ok"] and third["ok"]
+    assert worker.process is None
+    dist = src_path.parent / "static" / "dist"
+    # The same bundler served every build
+    assert (dist / "Main.js").read_text() == "// run 3"
+    assert json.loads((dist / "djelm-manifest.json").read_text()) == {
+        "dist/Main.js": {"file": "dist/Main.js", "imports": []}
+    }
+
+
+def test_worker_reports_build_errors(src_path):
+    worker = ParcelWorker(str(src_path))
+    try:
+        result = worker.build(options("fail"))
+    finally:
+        worker.stop()
+
+    assert result == {"id": 0, "ok": False, "message": "Elm compile error"}
+
+
+def test_worker_restarts_after_crash(src_path):
+    worker = ParcelWorker(str(src_path))
+    try:
+        with pytest.raises(Exception):
+            worker.build(options("crash"))
+        assert worker.build(options("Main.ts"))["ok"]
+    finally:
+        worker.stop()
+
+
+def test_worker_skips_stray_output(src_path, capsys):
+    worker = ParcelWorker(str(src_path))
+    try:
+        result = worker.build(options("noisy"))
+        assert worker.build(options("Main.ts"))["ok"]
+    finally:
+        worker.stop()
+
+    assert result["ok"]
+    assert "plugin says hi" in capsys.readouterr().err
+
+
+def test_worker_times_out_hung_builds(src_path):
+    worker = ParcelWorker(str(src_path), timeout=1)
+    try:
+        with pytest.raises(ParcelWorkerError, match="did not finish within 1s"):
+            worker.build(options("hang"))
+        assert worker.process is None
+        assert worker.build(options("Main.ts"))["ok"]
+    finally:
+        worker.stop()
+
+
+def test_compile_program(src_path):
+    process = subprocess.run(
+        ["node", "-e", COMPILE_PROGRAM, json.dumps(options("Main.ts"))],
+        cwd=src_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert process.returncode == 0
+    assert "Built 1 bundles" in process.stdout
+    assert (src_path.parent / "static" / "dist" / "Main.js").exists()
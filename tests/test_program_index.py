@@ -0,0 +1,112 @@
+import os
+
+import djelm.program_index
+from djelm.program_index import INDEX_NAME, ProgramIndex
+from djelm.strategy import find_programs
+from djelm.utils import STUFF_NAMESPACE
+
+PROGRAM = "module Main exposing (main)\n\nmain : Program Value Model Msg\nmain =\n    Browser.element {}\n"
+MODULE = 'module Ui exposing (view)\n\nview =\n    text ""\n'
+
+
+def write(path, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def count_reads(monkeypatch) -> list[str]:
+    reads = []
+    original = djelm.program_index.is_elm_entrypoint
+
+    def counting(content: str) -> bool:
+        reads.append(content)
+        return original(content)
+
+    monkeypatch.setattr(djelm.program_index, "is_elm_entrypoint", counting)
+    return reads
+
+
+def test_scan_indexes_entrypoints(tmp_path):
+    src = os.path.join(tmp_path, "src")
+    write(os.path.join(src, "Main.elm"), PROGRAM)
+    write(os.path.join(src, "Ui.elm"), MODULE)
+    write(os.path.join(src, "Widgets", "Select.elm"), PROGRAM)
+    write(os.path.join(src, "Models", "Main.elm"), PROGRAM)
+    write(os.path.join(src, "Pages", "Admin", "Dashboard.elm"), PROGRAM)
+    write(os.path.join(src, ".hidden", "Draft.elm"), PROGRAM)
+    index = ProgramIndex(src, os.path.join(tmp_path, INDEX_NAME))
+
+    index.scan()
+
+    assert index.programs() == [
+        "Main.elm",
+        os.path.join("Pages", "Admin", "Dashboard.elm"),
+        os.path.join("Widgets", "Select.elm"),
+    ]
+    assert "Ui.elm" in index
+    assert os.path.join("Models", "Main.elm") not in index
+
+
+def test_scan_only_reads_changed_files(tmp_path, monkeypatch):
+    src = os.path.join(tmp_path, "src")
+    write(os.path.join(src, "Main.elm"), PROGRAM)
+    write(os.path.join(src, "Ui.elm"), MODULE)
+    index_path = os.path.join(tmp_path, INDEX_NAME)
+    index = ProgramIndex(src, index_path)
+    index.scan()
+    index.save()
+    reads = count_reads(monkeypatch)
+
+    reloaded = ProgramIndex.load(src, index_path)
+    reloaded.scan()
+    assert reads == []
+    assert reloaded.programs() == ["Main.elm"]
+
+    write(os.path.join(src, "Ui.elm"), PROGRAM.replace("Main", "Ui"))
+    os.remove(os.path.join(src, "Main.elm"))
+    reloaded.scan()
+    assert len(reads) == 1
+    assert reloaded.programs() == ["Ui.elm"]
+
+
+def test_update_applies_single_changes(tmp_path):
+    src = os.path.join(tmp_path, "src")
+    main = os.path.join(src, "Main.elm")
+    write(main, MODULE)
+    index = ProgramIndex(src, os.path.join(tmp_path, INDEX_NAME))
+    index.scan()
+    assert index.programs() == []
+
+    write(main, PROGRAM)
+    index.update(main)
+    index.update(os.path.join(tmp_path, "elsewhere", "Other.elm"))
+    assert index.programs() == ["Main.elm"]
+
+    os.remove(main)
+    index.update(main)
+    assert index.programs() == []
+    assert index.dirty
+
+
+def test_find_programs(tmp_path):
+    src = os.path.join(tmp_path, "src")
+    write(os.path.join(src, "Main.elm"), PROGRAM)
+    write(os.path.join(src, "Main.handlers.ts"), "")
+    write(os.path.join(src, "Widgets", "Select.elm"), PROGRAM)
+
+    programs = find_programs(str(tmp_path))
+
+    assert programs == [
+        {
+            "base": src,
+            "file": "Main.elm",
+            "supporting_ts_files": {"Main.handlers.ts"},
+        },
+        {
+            "base": os.path.join(src, "Widgets"),
+            "file": "Select.elm",
+            "supporting_ts_files": set(),
+        },
+    ]
+    assert os.path.isfile(os.path.join(tmp_path, *STUFF_NAMESPACE, INDEX_NAME))
@@ -0,0 +1,158 @@
+import json
+import os
+
+import pytest
+from django.http import HttpResponse
+from django.template import Context, RequestContext, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory, override_settings
+
+from djelm.flags.main import Flags
+from djelm.flags.primitives import ObjectFlag, StringFlag
+from djelm.manifest import (
+    MANIFEST_NAME,
+    clear_manifest_cache,
+    program_file,
+    program_imports,
+)
+from djelm.middleware import ProgramIncludesMiddleware
+from djelm.render import include_program, render_program
+from djelm.settings import ProgramSettings
+
+
+def test_render_program_matches_template():
+    flags = Flags(ObjectFlag({"title": StringFlag()})).parse(
+        {"title": "<b>\"Tom\" & 'Jerry'</b>"}
+    )
+
+    assert render_program("main", flags) == render_to_string(
+        "djelm/program.html", {"key": "main", "flags": flags}
+    )
+
+
+def test_render_program_with_settings_matches_template():
+    settings = ProgramSettings().with_setting({"singleton": True}).get_settings()
+
+    assert render_program("main", "0", settings) == render_to_string(
+        "djelm/program.html", {"key": "main", "flags": "0", "settings": settings}
+    )
+
+
+def test_include_program_matches_template():
+    assert include_program("dist/Main.js") == render_to_string(
+        "djelm/include.html", {"djelm_program": "dist/Main.js"}
+    )
+
+
+@pytest.fixture
+def manifest_dir(tmp_path):
+    os.makedirs(tmp_path / "dist")
+    with open(tmp_path / "dist" / MANIFEST_NAME, "w") as f:
+        json.dump(
+            {
+                "dist/Main.js": {
+                    "file": "dist/Main.9f8e7d6c.js",
+                    "imports": ["dist/Main.1a2b.js"],
+                }
+            },
+            f,
+        )
+    clear_manifest_cache()
+    with override_settings(STATICFILES_DIRS=[tmp_path]):
+        yield tmp_path
+    clear_manifest_cache()
+
+
+def test_program_file(manifest_dir):
+    assert program_file("dist/Main.js") == "dist/Main.9f8e7d6c.js"
+    assert program_file("dist/Other.js") == "dist/Other.js"
+
+
+def test_program_file_finds_new_manifests(manifest_dir, tmp_path_factory):
+    other = tmp_path_factory.mktemp("other")
+    with override_settings(DEBUG=True, STATICFILES_DIRS=[manifest_dir, other]):
+        assert program_file("dist/Widget.js") == "dist/Widget.js"
+
+        os.makedirs(other / "dist")
+        with open(other / "dist" / MANIFEST_NAME, "w") as f:
+            json.dump({"dist/Widget.js": {"file": "dist/Widget.3c4d.js"}}, f)
+
+        assert program_file("dist/Widget.js") == "dist/Widget.3c4d.js"
+        assert program_file("dist/Main.js") == "dist/Main.9f8e7d6c.js"
+
+
+def test_program_file_is_cached_without_debug(manifest_dir):
+    assert program_file("dist/Main.js") == "dist/Main.9f8e7d6c.js"
+    with open(manifest_dir / "dist" / MANIFEST_NAME, "w") as f:
+        json.dump({"dist/Main.js": {"file": "dist/Main.0000.js"}}, f)
+
+    assert program_file("dist/Main.js") == "dist/Main.9f8e7d6c.js"
+    clear_manifest_cache()
+    assert program_file("dist/Main.js") == "dist/Main.0000.js"
+
+
+def test_program_imports(manifest_dir):
+    assert program_imports("dist/Main.js") == ["dist/Main.1a2b.js"]
+    assert program_imports("dist/Other.js") == []
+
+
+def test_include_program_preload(manifest_dir):
+    assert include_program("dist/Main.js", preload=True) == (
+        '\n<link rel="modulepreload" href="/static/dist/Main.1a2b.js">'
+        '\n<script type="module" src="/static/dist/Main.9f8e7d6c.js"></script>\n'
+    )
+
+
+def test_include_program_once_per_render():
+    template = Template(
+        "{% load includes %}{% include_main %}{% include_main %}{% include_other %}"
+    )
+
+    assert template.render(Context()) == (
+        '\n<script type="module" src="/static/dist/Main.js"></script>\n'
+        '\n<script type="module" src="/static/dist/Other.js"></script>\n'
+    )
+
+
+def test_include_program_once_per_request():
+    request = RequestFactory().get("/")
+    context = RequestContext(request)
+
+    assert Template("{% load includes %}{% include_main %}").render(context)
+    assert Template("{% load includes %}{% include_main %}").render(context) == ""
+    assert list(request.djelm_includes.programs) == ["dist/Main.js"]
+
+
+def test_djelm_includes_middleware(manifest_dir):
+    template = Template(
+        "{% load djelm_tags includes %}<head>{% djelm_includes %}</head>"
+        "{% include_main %}{% include_main %}{% include_other %}"
+    )
+
+    def view(request):
+        return HttpResponse(template.render(RequestContext(request)))
+
+    response = ProgramIncludesMiddleware(view)(RequestFactory().get("/"))
+
+    assert response.content.decode() == (
+        "<head>"
+        '\n<link rel="modulepreload" href="/static/dist/Main.1a2b.js">'
+        '\n<script type="module" src="/static/dist/Main.9f8e7d6c.js"></script>\n'
+        '\n<script type="module" src="/static/dist/Other.js"></script>\n'
+        "</head>"
+    )
+
+
+@override_settings(
+    ROOT_URLCONF="tests.urls",
+    MIDDLEWARE=["djelm.middleware.ProgramPreloadMiddleware"],
+)
+def test_program_preload_middleware(manifest_dir, client):
+    response = client.get("/program/")
+
+    assert response["Link"] == (
+        "</static/dist/Main.9f8e7d6c.js>; rel=modulepreload, "
+        "</static/dist/Main.1a2b.js>; rel=modulepreload, "
+        "</static/dist/Other.js>; rel=modulepreload"
+    )
+    assert not client.get("/plain/").has_header("Link")
@@ -1,8 +1,13 @@
+import asyncio
+import os
+import shutil
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from unittest import TestCase
 from django.core.management import call_command
-from django.core.management.base import LabelCommand
+from django.core.management.base import CommandError, LabelCommand
 from djelm.generators import (
     ModelGenerator,
     ProgramGenerator,
@@ -10,20 +15,35 @@ from djelm.generators import (
     WidgetModelGenerator,
 )
 from djelm.effect import ExitFailure, ExitSuccess
+from djelm.flags import IntFlag, StringFlag
+from djelm.flags.main import Flags
+from djelm.utils import (
+    STUFF_ENTRYPOINTS,
+    STUFF_NAMESPACE,
+    get_app_path,
+    get_app_src_path,
+)
 from djelm.strategy import (
+    WATCH_DEBOUNCE_MS,
     AddProgramHandlersStrategy,
     AddProgramStrategy,
     AddWidgetStrategy,
+    CompileAllStrategy,
+    CompileStrategy,
     CreateStrategy,
+    DepsStrategy,
     FindProgramsStrategy,
     GenerateModelStrategy,
     GenerateModelsStrategy,
     ListStrategy,
     NpmStrategy,
+    RebuildQueue,
     RemoveProgramStrategy,
     Strategy,
     StrategyError,
+    WatchAllStrategy,
     WatchStrategy,
+    WatchedApp,
     program_namespace_to_model_builder,
 )
 from .conftest import cleanup_theme_app_dir
@@ -182,3 +202,528 @@ def test_add_program_handlers_strategy():
             ExitFailure(None, Exception("app path doesn't exist")),
             ProgramHandlersGenerator(base_path=[], target_dir="src"),
         ).run(LabelCommand().stdout)
+
+
+def test_compile_strategy_changed_entrypoints(tmp_path):
+    src = tmp_path / "static_src"
+    (src / "src" / "Models").mkdir(parents=True)
+    (src / "elm.json").write_text('{"source-directories": ["src"]}')
+    (src / "src" / "Main.elm").write_text(
+        "module Main exposing (..)\nimport Models.Main"
+    )
+    (src / "src" / "Models" / "Main.elm").write_text("module Models.Main exposing (..)")
+    (src / "src" / "Other.elm").write_text("module Other exposing (..)")
+    (tmp_path / "static" / "dist").mkdir(parents=True)
+    (tmp_path / "static" / "dist" / "Main.js").write_text("")
+    (tmp_path / "static" / "dist" / "Other.js").write_text("")
+    elm_files = [
+        {"base": str(src / "src"), "file": "Main.elm", "supporting_ts_files": set()},
+        {"base": str(src / "src"), "file": "Other.elm", "supporting_ts_files": set()},
+    ]
+    strategy = CompileStrategy("app")
+
+    fingerprints = strategy.program_fingerprints(str(src), elm_files)
+    assert strategy.changed_entrypoints(str(src), fingerprints, fingerprints) == []
+
+    (src / "src" / "Models" / "Main.elm").write_text("module Models.Main exposing (a)")
+    changed = strategy.program_fingerprints(str(src), elm_files)
+    assert changed["Other.ts"] == fingerprints["Other.ts"]
+    assert [
+        os.path.basename(e)
+        for e in strategy.changed_entrypoints(str(src), changed, fingerprints)
+    ] == ["Main.ts"]
+
+    (tmp_path / "static" / "dist" / "Other.js").unlink()
+    assert [
+        os.path.basename(e)
+        for e in strategy.changed_entrypoints(str(src), changed, changed)
+    ] == ["Other.ts"]
+    assert (
+        CompileStrategy("app", build=True).program_fingerprints(str(src), elm_files)
+        != changed
+    )
+
+
+class RecordingWorker:
+    def __init__(self):
+        self.builds: list[dict] = []
+
+    def build(self, options: dict) -> dict:
+        self.builds.append(options)
+        return {"ok": True, "message": "built"}
+
+
+def test_compile_strategy_nested_programs():
+    src_path = get_app_src_path("test_programs").value  # type:ignore
+    pages = os.path.join(src_path, "src", "Pages")
+    os.makedirs(os.path.join(pages, "Admin"))
+    with open(os.path.join(pages, "Admin", "Dashboard.elm"), "w") as f:
+        f.write(
+            "module Pages.Admin.Dashboard exposing (main)\n\n"
+            "main : Program Value Model Msg\nmain =\n    Browser.element {}\n"
+        )
+    with open(os.path.join(pages, "Admin", "Dashboard.handlers.ts"), "w") as f:
+        f.write("")
+    entrypoint = os.path.join(src_path, *STUFF_ENTRYPOINTS, "Pages.Admin.Dashboard.ts")
+    worker = RecordingWorker()
+    try:
+        result = CompileStrategy(
+            "test_programs",
+            worker=worker,
+            force=True,  # type:ignore
+        ).run(StringLogger())
+
+        assert isinstance(result, ExitSuccess)
+        assert worker.builds[0]["programs"] == ["dist/Pages.Admin.Dashboard.js"]
+        with open(entrypoint) as f:
+            content = f.read()
+        assert 'import("../../../src/Pages/Admin/Dashboard.elm")' in content
+        assert (
+            "import * as handlers from '../../../src/Pages/Admin/Dashboard.handlers.ts'"
+            in content
+        )
+        assert "Elm.Pages.Admin.Dashboard.init(" in content
+        assert 'prefix: "testprogramspages-admin-dashboard"' in content
+    finally:
+        shutil.rmtree(pages)
+        shutil.rmtree(os.path.join(src_path, *STUFF_NAMESPACE), ignore_errors=True)
+
+
+def test_compile_strategy_nested_program_scopes():
+    src_path = get_app_src_path("test_programs").value  # type:ignore
+    src = os.path.join(src_path, "src")
+
+    def program(module: str) -> str:
+        return f"module {module} exposing (main)\n" + ELM_MAIN
+
+    write_elm(
+        os.path.join(src, "Pages", "AdminDashboard.elm"),
+        program("Pages.AdminDashboard"),
+    )
+    write_elm(
+        os.path.join(src, "PagesAdmin", "Dashboard.elm"),
+        program("PagesAdmin.Dashboard"),
+    )
+    entrypoints = os.path.join(src_path, *STUFF_ENTRYPOINTS)
+    try:
+        CompileStrategy(
+            "test_programs",
+            worker=RecordingWorker(),
+            force=True,  # type:ignore
+        ).run(StringLogger())
+        prefixes = []
+        for name in ("Pages.AdminDashboard.ts", "PagesAdmin.Dashboard.ts"):
+            with open(os.path.join(entrypoints, name)) as f:
+                prefixes.append(f.read().split('prefix: "')[1].split('"')[0])
+        assert prefixes == [
+            "testprogramspages-admindashboard",
+            "testprogramspagesadmin-dashboard",
+        ]
+
+        write_elm(
+            os.path.join(src, "pages", "AdminDashboard.elm"),
+            program("pages.AdminDashboard"),
+        )
+        with pytest.raises(StrategyError, match="share the view prefix"):
+            CompileStrategy(
+                "test_programs",
+                worker=RecordingWorker(),
+                force=True,  # type:ignore
+            ).run(StringLogger())
+    finally:
+        for d in ("Pages", "PagesAdmin", "pages"):
+            shutil.rmtree(os.path.join(src, d), ignore_errors=True)
+        shutil.rmtree(os.path.join(src_path, *STUFF_NAMESPACE), ignore_errors=True)
+
+
+def test_strategy_create_compile_all():
+    strategy = Strategy().create(["compilebuild"], {"all": True, "jobs": 2})
+
+    TestCase().assertIsInstance(strategy, CompileAllStrategy)
+    assert strategy.build and strategy.jobs == 2
+
+
+def test_strategy_create_rejects_unsupported_all():
+    with pytest.raises(StrategyError, match="remove the app name"):
+        Strategy().create(["compile", "test_programs"], {"all": True})
+    with pytest.raises(StrategyError, match="remove the app name"):
+        Strategy().create(["watch", "test_programs"], {"all": True})
+    with pytest.raises(StrategyError, match="not generatemodels"):
+        Strategy().create(["generatemodels"], {"all": True})
+
+
+def test_compile_all_strategy(monkeypatch):
+    compiled = []
+
+    def run(self, logger):
+        compiled.append((self.app_name, self.build, self.output_prefix))
+        logger.write("built")
+        return ExitSuccess(None)
+
+    monkeypatch.setattr(CompileStrategy, "run", run)
+    logger = StringLogger()
+
+    result = CompileAllStrategy(
+        build=True, apps=["djelm", "test_programs", "django.contrib.staticfiles"]
+    ).run(logger)
+
+    assert result.value == ["test_programs"]
+    assert compiled == [("test_programs", True, "[test_programs] ")]
+    assert "[test_programs] built" in logger.lines
+    assert any(
+        line.strip().startswith("test_programs") and "ok" in line
+        for line in logger.lines
+    )
+
+
+def test_compile_all_strategy_jobs(monkeypatch):
+    pools = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers=None):
+            pools.append(max_workers)
+            super().__init__(max_workers)
+
+    monkeypatch.setattr(CompileStrategy, "run", lambda self, logger: ExitSuccess(None))
+    monkeypatch.setattr("djelm.strategy.ThreadPoolExecutor", RecordingExecutor)
+
+    call_command("djelm", "compile", "--all", "--jobs", "3")
+    assert pools == [3]
+
+    for jobs in ("0", "-1"):
+        with pytest.raises(CommandError):
+            call_command("djelm", "compile", "--all", "--jobs", jobs)
+    assert pools == [3]
+
+
+def test_compile_all_strategy_failure(monkeypatch):
+    def run(self, logger):
+        raise StrategyError("Elm compile error")
+
+    monkeypatch.setattr(CompileStrategy, "run", run)
+    logger = StringLogger()
+
+    with pytest.raises(SystemExit):
+        CompileAllStrategy(apps=["test_programs"]).run(logger)
+
+    assert "[test_programs] Elm compile error" in logger.lines
+
+
+class SlowCompile:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.runs = 0
+
+    def run(self, logger):
+        self.runs += 1
+        time.sleep(self.seconds)
+
+
+def test_rebuild_queue_coalesces_a_burst_of_changes():
+    compile = SlowCompile(0)
+    logger = StringLogger()
+
+    async def burst():
+        queue = RebuildQueue(compile, logger, debounce=20)  # type: ignore
+        for f in ["A.elm", "B.elm", "A.elm"]:
+            queue.request([f])
+        await queue.wait()
+
+    asyncio.run(burst())
+
+    assert compile.runs == 1
+    assert logger.lines[0].startswith("REBUILT 2 changed file(s) in ")
+
+
+def test_rebuild_queue_runs_one_follow_up_for_changes_during_a_build():
+    compile = SlowCompile(0.2)
+    logger = StringLogger()
+
+    async def mid_build():
+        queue = RebuildQueue(compile, logger, debounce=0)  # type: ignore
+        queue.request(["A.elm"])
+        await asyncio.sleep(0.05)
+        # build in flight, these mark it stale
+        queue.request(["B.elm"])
+        queue.request(["C.elm"])
+        await queue.wait()
+
+    asyncio.run(mid_build())
+
+    assert compile.runs == 2
+    assert logger.lines[0].endswith("(changes during build, rebuilding)")
+    assert logger.lines[1].startswith("REBUILT 2 changed file(s) in ")
+
+
+def test_generatemodels_strategy(settings):
+    app_name = f"test_project_{str(uuid.uuid1()).replace('-', '_')}"
+    call_command("djelm", "create", app_name)
+    settings.INSTALLED_APPS += [app_name]
+    call_command("djelm", "addprogram", app_name, "Main")
+    call_command("djelm", "addwidget", app_name, "ModelChoiceField", "--no-deps")
+    src_path = os.path.join(get_app_path(app_name).value, "static_src", "src")  # type:ignore
+    models = [
+        os.path.join(src_path, "Models", "Main.elm"),
+        os.path.join(src_path, "Widgets", "Models", "ModelChoiceField.elm"),
+    ]
+    for model in models:
+        os.remove(model)
+    logger = StringLogger()
+
+    result = GenerateModelsStrategy(app_name, jobs=2).run(logger)
+
+    assert isinstance(result, ExitSuccess)
+    assert all(os.path.isfile(model) for model in models)
+    assert "Models: 2 written, 0 unchanged" in logger.lines
+    summary = logger.lines[logger.lines.index("Generate summary:") + 1 :]
+    assert summary[0].split()[:2] == ["Main", "\033[92mok\033[0m"]
+    assert summary[1].split()[0] == "ModelChoiceField"
+
+    with open(os.path.join(get_app_path(app_name).value, "flags", "main.py"), "w") as f:  # type:ignore
+        f.write("raise ValueError('bad flags')\n")
+    logger = StringLogger()
+    with pytest.raises(StrategyError, match="Models failed to generate for: Main"):
+        GenerateModelsStrategy(app_name, jobs=2).run(logger)
+    summary = logger.lines[logger.lines.index("Generate summary:") + 1 :]
+    assert summary[0].split()[:2] == ["Main", "\033[91mfailed\033[0m"]
+
+    settings.INSTALLED_APPS.remove(app_name)
+    cleanup_theme_app_dir(app_name)
+
+
+class CountingModelGenerator(ModelGenerator):
+    def __init__(self):
+        self.flag = StringFlag()
+        self.cuts = 0
+
+    def load_flags(self, app_path, program_name, from_source, watch_mode, logger):  # type:ignore
+        return ExitSuccess(Flags(self.flag))
+
+    def cookie_cutters(self, flags, app_name, program_name, app_path, src_path):  # type:ignore
+        self.cuts += 1
+        return []
+
+
+def test_generate_model_skips_unchanged_flag_output():
+    generator = CountingModelGenerator()
+    model_hashes: dict[str, str] = {}
+    logger = StringLogger()
+
+    def generate():
+        return GenerateModelStrategy(
+            "test_programs",
+            "Main",
+            generator,
+            from_source=True,
+            watch_mode=True,
+            model_hashes=model_hashes,
+        ).run(logger)
+
+    assert isinstance(generate(), ExitSuccess)
+    assert isinstance(generate(), ExitSuccess)
+    assert generator.cuts == 1
+    assert "Model unchanged: Main" in logger.lines
+
+    generator.flag = IntFlag()
+    generate()
+    assert generator.cuts == 2
+
+
+def test_watch_ignores_its_own_writes(tmp_path):
+    strategy = WatchStrategy("test_programs")
+    logger = StringLogger()
+    model = os.path.join(tmp_path, "src", "Models", "Main.elm")
+    strategy.own_writes.add(model)
+
+    assert not strategy.handle_change(1, model, "app", "src", logger)
+    assert not strategy.handle_change(
+        1, os.path.join(tmp_path, "src", "Models", ".djelm-x1y2"), "app", "src", logger
+    )
+    assert strategy.own_writes == set()
+    assert logger.lines == []
+    # Later edits to the model are picked up again
+    assert strategy.handle_change(2, model, "app", "src", logger)
+
+
+def test_watch_all_routes_changes_to_the_owning_app(tmp_path):
+    logger = StringLogger()
+
+    def watched(app_name: str) -> WatchedApp:
+        app_path = os.path.join(tmp_path, app_name)
+        return WatchedApp(
+            WatchStrategy(app_name),
+            app_path,
+            os.path.join(app_path, "static_src"),
+            CompileStrategy(app_name),
+            logger,  # type:ignore
+        )
+
+    owners = [watched("shop"), watched("shop_admin")]
+    shop_main = os.path.join(tmp_path, "shop", "static_src", "src", "Main.elm")
+    admin_main = os.path.join(tmp_path, "shop_admin", "static_src", "src", "Main.elm")
+    admin_ui = os.path.join(tmp_path, "shop_admin", "static_src", "src", "Ui.elm")
+    for main in [shop_main, admin_main]:
+        write_elm(main, "module Main exposing (main)\nimport Ui\n" + ELM_MAIN)
+    write_elm(admin_ui, "module Ui exposing (view)\n")
+
+    changed = WatchAllStrategy().route(
+        [
+            (2, shop_main),
+            (2, admin_main),
+            (1, admin_ui),
+            (2, os.path.join(tmp_path, "elsewhere", "Main.elm")),
+        ],
+        owners,
+    )
+
+    assert changed == {"shop": [shop_main], "shop_admin": [admin_main, admin_ui]}
+
+
+ELM_MAIN = "\nmain : Program Value Model Msg\nmain =\n    Browser.element {}\n"
+
+
+def write_elm(path: str, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def test_watch_only_compiles_changes_that_reach_a_program(tmp_path):
+    src = os.path.join(tmp_path, "src")
+    write_elm(
+        os.path.join(src, "Main.elm"),
+        "module Main exposing (main)\nimport Shared.Ui\n" + ELM_MAIN,
+    )
+    write_elm(
+        os.path.join(src, "Shared", "Ui.elm"),
+        "module Shared.Ui exposing (view)\nimport Shared.Colors\n",
+    )
+    write_elm(
+        os.path.join(src, "Shared", "Colors.elm"),
+        "module Shared.Colors exposing (..)\n",
+    )
+    write_elm(os.path.join(src, "Orphan.elm"), "module Orphan exposing (..)\n")
+    strategy = WatchStrategy("app")
+    logger = StringLogger()
+
+    assert strategy.needs_compile(
+        str(tmp_path), [os.path.join(src, "Shared", "Colors.elm")], logger
+    )
+    assert logger.lines == ["Affected programs: Main"]
+    assert not strategy.needs_compile(
+        str(tmp_path), [os.path.join(src, "Orphan.elm")], logger
+    )
+    assert strategy.needs_compile(
+        str(tmp_path), [os.path.join(src, "Main.handlers.ts")], logger
+    )
+
+
+def test_compile_strategy_rebuilds_when_a_handlers_import_changes(
+    tmp_path, monkeypatch
+):
+    src = tmp_path / "static_src"
+    write_elm(str(src / "elm.json"), '{"source-directories": ["src"]}')
+    write_elm(str(src / "package.json"), '{"dependencies": {}}')
+    write_elm(str(src / "src" / "Main.elm"), "module Main exposing (main)\n" + ELM_MAIN)
+    write_elm(
+        str(src / "src" / "Main.handlers.ts"),
+        "import { format } from './lib/format';\n",
+    )
+    write_elm(str(src / "src" / "lib" / "format.ts"), "export const format = 1;\n")
+    write_elm(str(tmp_path / "static" / "dist" / "Main.js"), "")
+    monkeypatch.setattr(
+        "djelm.strategy.get_app_src_path", lambda _: ExitSuccess(str(src))
+    )
+    worker = RecordingWorker()
+    compile = CompileStrategy("app", worker=worker)  # type:ignore
+
+    compile.run(StringLogger())
+    compile.run(StringLogger())
+    assert len(worker.builds) == 1
+
+    write_elm(str(src / "src" / "lib" / "format.ts"), "export const format = 2;\n")
+    compile.run(StringLogger())
+    assert len(worker.builds) == 2
+
+    write_elm(str(src / "package.json"), '{"dependencies": {"canvas-confetti": "1"}}')
+    compile.run(StringLogger())
+    assert len(worker.builds) == 3
+
+    # Watch compiles never skip, Parcel decides what changed
+    CompileStrategy("app", worker=worker, force=True).run(StringLogger())  # type:ignore
+    assert len(worker.builds) == 4
+
+
+def test_deps_strategy():
+    src_path = get_app_src_path("test_programs").value  # type:ignore
+    src = os.path.join(src_path, "src")
+    files = {
+        "Dashboard.elm": "module Dashboard exposing (main)\nimport Shared.Ui\n"
+        + ELM_MAIN,
+        os.path.join(
+            "Shared", "Ui.elm"
+        ): "module Shared.Ui exposing (..)\nimport Shared.Colors\n",
+        os.path.join("Shared", "Colors.elm"): "module Shared.Colors exposing (..)\n",
+    }
+    for name, content in files.items():
+        write_elm(os.path.join(src, name), content)
+    logger = StringLogger()
+    try:
+        deps = DepsStrategy("test_programs", "Shared.Ui").run(logger)
+        with pytest.raises(StrategyError, match="Module Nope not found"):
+            call_command("djelm", "deps", "test_programs", "Nope")
+    finally:
+        os.remove(os.path.join(src, "Dashboard.elm"))
+        shutil.rmtree(os.path.join(src, "Shared"))
+        shutil.rmtree(os.path.join(src_path, *STUFF_NAMESPACE), ignore_errors=True)
+
+    assert isinstance(deps, ExitSuccess)
+    assert deps.value["imports"] == ["Shared.Colors"]
+    assert deps.value["imported_by"] == ["Dashboard"]
+    assert deps.value["programs"] == ["Dashboard"]
+
+
+def test_strategy_create_deps():
+    strategy = Strategy().create(["deps", "test_programs", "Shared.Ui"], {})
+
+    assert isinstance(strategy, DepsStrategy)
+    assert strategy.module == "Shared.Ui"
+
+
+def test_strategy_create_watch_all():
+    strategy = Strategy().create(["watch"], {"all": True, "jobs": 2})
+
+    assert isinstance(strategy, WatchAllStrategy)
+    assert strategy.jobs == 2
+
+
+def test_strategy_create_watch_debounce():
+    strategy = Strategy().create(["watch", "test_programs"], {"debounce": 500})
+
+    assert isinstance(strategy, WatchStrategy)
+    assert strategy.debounce == 500
+    assert Strategy().create(["watch", "test_programs"], {"debounce": 0}).debounce == 0
+    assert Strategy().create(["watch"], {"all": True, "debounce": 0}).debounce == 0
+    assert (
+        Strategy().create(["watch", "test_programs"], {"debounce": None}).debounce
+        == WATCH_DEBOUNCE_MS
+    )
+
+
+def test_generatemodels_jobs_rejects_values_below_one():
+    for jobs in ("0", "-2"):
+        with pytest.raises(CommandError):
+            call_command("djelm", "generatemodels", "test_programs", "--jobs", jobs)
+
+
+def test_watch_debounce_rejects_negative_values():
+    with pytest.raises(CommandError):
+        call_command("djelm", "watch", "test_programs", "--debounce", "-1")
+
+
+class StringLogger:
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def write(self, msg: str):
+        self.lines.extend(msg.splitlines())
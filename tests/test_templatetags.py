@@ -0,0 +1,45 @@
+import json
+
+from djelm.settings import ProgramSettings
+from djelm.templatetags.djelm_tags import default_settings, merge_settings
+
+
+def test_program_settings_is_immutable_and_hashable():
+    settings = ProgramSettings()
+    updated = settings.with_setting({"singleton": True})
+
+    assert settings.get_settings() == {"name": None, "singleton": False}
+    assert updated.get_settings() == {"name": None, "singleton": True}
+    assert updated == ProgramSettings().with_setting({"singleton": True})
+    assert hash(updated) == hash(ProgramSettings().with_setting({"singleton": True}))
+
+
+def test_default_settings():
+    assert json.loads(default_settings()) == {"name": None, "singleton": False}
+
+
+def test_merge_settings():
+    settings = ProgramSettings().with_setting({"name": "Menu"}).get_settings()
+
+    assert merge_settings(settings=settings) == json.dumps(
+        {"name": "Menu", "singleton": False}
+    )
+    assert merge_settings() == default_settings()
+
+
+def test_merge_settings_unhashable_values():
+    assert json.loads(merge_settings(settings={"name": ["Menu"]})) == {
+        "name": ["Menu"],
+        "singleton": False,
+    }
+
+
+def test_merge_settings_keeps_equal_values_of_different_types():
+    assert json.loads(merge_settings(settings={"size": 1})) == {
+        "name": None,
+        "singleton": False,
+        "size": 1,
+    }
+    assert json.loads(merge_settings(settings={"size": True}))["size"] is True
+    assert json.loads(merge_settings(settings={"size": 1.0}))["size"] == 1.0
+    assert isinstance(json.loads(merge_settings(settings={"size": 1.0}))["size"], float)
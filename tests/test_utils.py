@@ -1,4 +1,6 @@
-from djelm.utils import is_elm_entrypoint
+import os
+
+from djelm.utils import WriteStats, is_elm_entrypoint, write_if_changed
 
 
 def test_valid_is_elm_entrypoint():
@@ -26,3 +28,38 @@ update msg model =
     (model, Cmd.none)
     """
     assert is_elm_entrypoint(content) is False
+
+
+def test_write_if_changed(tmp_path):
+    path = str(tmp_path / "nested" / "Main.ts")
+
+    assert write_if_changed(path, "main\n", "\n")
+    os.utime(path, (0, 0))
+
+    assert not write_if_changed(path, "main\n", "\n")
+    assert os.path.getmtime(path) == 0
+
+    assert write_if_changed(path, "changed\n", "\n")
+    with open(path) as f:
+        assert f.read() == "changed\n"
+    assert os.listdir(tmp_path / "nested") == ["Main.ts"]
+
+
+def test_write_if_changed_applies_the_umask(tmp_path):
+    path = str(tmp_path / "Main.ts")
+    umask = os.umask(0o027)
+    try:
+        write_if_changed(path, "main\n")
+    finally:
+        os.umask(umask)
+
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+def test_write_stats():
+    stats = WriteStats()
+    stats.record(True)
+    stats.record(False)
+    stats.record(False)
+
+    assert str(stats) == "1 written, 2 unchanged"
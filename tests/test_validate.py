@@ -45,6 +45,7 @@ def test_validate_failure_when_single_command():
     TestCase().assertIsInstance(
         Validations().acceptable_command(["watch"]), ExitFailure
     )
+    TestCase().assertIsInstance(Validations().acceptable_command(["deps"]), ExitFailure)
 
 
 def test_validate_failure_when_too_many_args():
@@ -240,6 +241,12 @@ def test_after_create_validate_success(settings):
     TestCase().assertIsInstance(
         Validations().acceptable_command(["watch", app_name]), ExitSuccess
     )
+    TestCase().assertIsInstance(
+        Validations().acceptable_command(["deps", app_name, "Main"]), ExitSuccess
+    )
+    TestCase().assertIsInstance(
+        Validations().acceptable_command(["deps", app_name]), ExitFailure
+    )
 
     settings.INSTALLED_APPS.remove(app_name)
     cleanup_theme_app_dir(app_name)
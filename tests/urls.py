@@ -0,0 +1,18 @@
+from django.http import HttpResponse
+from django.template import RequestContext, Template
+from django.urls import path
+
+
+def program_view(request):
+    template = Template("{% load includes %}{% include_main %}{% include_other %}")
+    return HttpResponse(template.render(RequestContext(request)))
+
+
+def plain_view(request):
+    return HttpResponse("plain")
+
+
+urlpatterns = [
+    path("program/", program_view),
+    path("plain/", plain_view),
+]